@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark suite for the `gedcom` package, see `benchmarks.run`.
+"""
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+"""
+Runs the benchmark suite on synthetic GEDCOM trees and compares the results against a saved baseline.
+
+Run from the root of the repository:
+
+```
+python -m benchmarks.run --sizes 10000 100000 --save baseline.json
+python -m benchmarks.run --sizes 10000 100000 --baseline baseline.json
+```
+
+Every benchmark is run once for timing and, unless `--no-memory` is given, once more with
+`tracemalloc` enabled to measure its peak memory. With `--baseline` every benchmark slower than
+the baseline by more than `--threshold` gets reported as regression and the exit code is `1`.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+from gedcom.ahnentafel import AhnentafelNumberer
+from gedcom.element.individual import IndividualElement
+from gedcom.generator import write_gedcom_file
+from gedcom.parser import Parser
+import gedcom.jsonl
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+
+ANCESTOR_SAMPLE_SIZE = 100
+
+THREAD_POOL_WORKERS = 8
+
+DEEP_PEDIGREE_GENERATIONS = 25
+
+DEEP_PEDIGREE_PARENT_RATE = 0.8
+
+
+def iter_deep_pedigree_lines(individuals, generations=DEEP_PEDIGREE_GENERATIONS, seed=0):
+    """Yields the lines of the pedigree of the proband `@P0_0@` spanning the given number of generations
+
+    Every generation holds at most `individuals // generations` individuals, so the further back the
+    more ancestors collapse. Each individual has known parents with a probability of `DEEP_PEDIGREE_PARENT_RATE`.
+
+    :rtype: generator of str
+    """
+    rng = random.Random(seed)
+    width = max(2, individuals // generations)
+    generation_sizes = [min(2 ** generation, width) for generation in range(generations + 1)]
+
+    family_lines = []
+    for generation, size in enumerate(generation_sizes):
+        for index in range(size):
+            yield "0 @P%d_%d@ INDI\n" % (generation, index)
+            if generation < generations and (generation == 0 or rng.random() < DEEP_PEDIGREE_PARENT_RATE):
+                family_pointer = "@F%d_%d@" % (generation, index)
+                parents_size = generation_sizes[generation + 1]
+                yield "1 FAMC %s\n" % family_pointer
+                family_lines.extend([
+                    "0 %s FAM\n" % family_pointer,
+                    "1 HUSB @P%d_%d@\n" % (generation + 1, rng.randrange(0, parents_size, 2)),
+                    "1 WIFE @P%d_%d@\n" % (generation + 1, rng.randrange(1, parents_size, 2)),
+                    "1 CHIL @P%d_%d@\n" % (generation, index),
+                ])
+
+    for line in family_lines:
+        yield line
+    yield "0 TRLR\n"
+
+
+class Workload(object):
+    """Synthetic GEDCOM file of a given size, along with a parser holding its parsed data"""
+
+    def __init__(self, file_path, individuals):
+        self.file_path = file_path
+        self.individuals = individuals
+        self.parser = Parser()
+        self.parser.parse_file(file_path)
+        self.individual_elements = [element for element in self.parser.get_root_child_elements()
+                                    if isinstance(element, IndividualElement)]
+        self.frozen_parser = None
+        self.deep_pedigree_parser = None
+
+    def get_frozen_parser(self):
+        """Returns the snapshot frozen by the `freeze` benchmark, freezing the parser if not run
+        :rtype: Parser
+        """
+        if self.frozen_parser is None:
+            self.frozen_parser = self.parser.freeze()
+        return self.frozen_parser
+
+    def get_deep_pedigree_parser(self):
+        """Returns a parser holding the pedigree of `benchmarks.run.iter_deep_pedigree_lines()`
+        :rtype: Parser
+        """
+        if self.deep_pedigree_parser is None:
+            self.deep_pedigree_parser = Parser()
+            self.deep_pedigree_parser.parse(line.encode('utf-8') for line in iter_deep_pedigree_lines(self.individuals))
+        return self.deep_pedigree_parser
+
+
+def benchmark_parse(workload):
+    Parser().parse_file(workload.file_path)
+
+
+def benchmark_element_list(workload):
+    workload.parser.invalidate_cache()
+    workload.parser.get_element_list()
+
+
+def benchmark_element_dictionary(workload):
+    workload.parser.invalidate_cache()
+    workload.parser.get_element_dictionary()
+
+
+def benchmark_individual_accessors(workload):
+    for individual in workload.individual_elements:
+        individual.get_name()
+        individual.get_gender()
+        individual.get_birth_data()
+        individual.get_birth_year()
+        individual.get_death_data()
+        individual.get_death_year()
+        individual.is_deceased()
+
+
+def benchmark_ancestors(workload):
+    for individual in workload.individual_elements[-ANCESTOR_SAMPLE_SIZE:]:
+        workload.parser.get_ancestors(individual)
+
+
+def benchmark_ahnentafel(workload):
+    numberer = AhnentafelNumberer(workload.parser)
+    for individual in workload.individual_elements[-ANCESTOR_SAMPLE_SIZE:]:
+        numberer.number(individual)
+
+
+def benchmark_freeze(workload):
+    workload.frozen_parser = workload.parser.freeze()
+
+
+def _read_individuals(parser, individuals):
+    for individual in individuals:
+        parser.get_parents(individual)
+        individual.get_name()
+        individual.get_birth_data()
+
+
+def _read_individuals_threaded(parser):
+    individuals = [element for element in parser.get_root_child_elements() if isinstance(element, IndividualElement)]
+    with ThreadPoolExecutor(THREAD_POOL_WORKERS) as executor:
+        list(executor.map(partial(_read_individuals, parser),
+                          [individuals[index::THREAD_POOL_WORKERS] for index in range(THREAD_POOL_WORKERS)]))
+
+
+def benchmark_threads_mutable(workload):
+    _read_individuals_threaded(workload.parser)
+
+
+def benchmark_threads_frozen(workload):
+    _read_individuals_threaded(workload.get_frozen_parser())
+
+
+def benchmark_ahnentafel_deep(workload):
+    parser = workload.get_deep_pedigree_parser()
+    AhnentafelNumberer(parser).number(parser.get_element_dictionary()["@P0_0@"])
+
+
+def benchmark_criteria_match(workload):
+    for individual in workload.individual_elements:
+        individual.criteria_match("surname=Meyer:birth_range=1600-1800")
+
+
+def benchmark_to_gedcom_string(workload):
+    workload.parser.to_gedcom_string(True)
+
+
+def benchmark_to_jsonl_string(workload):
+    "".join(gedcom.jsonl.iter_jsonl(workload.parser.get_root_child_elements()))
+
+
+BENCHMARKS = (
+    ("parse", benchmark_parse),
+    ("element_list", benchmark_element_list),
+    ("element_dictionary", benchmark_element_dictionary),
+    ("individual_accessors", benchmark_individual_accessors),
+    ("ancestors", benchmark_ancestors),
+    ("ahnentafel", benchmark_ahnentafel),
+    ("ahnentafel_deep", benchmark_ahnentafel_deep),
+    ("freeze", benchmark_freeze),
+    ("threads_mutable", benchmark_threads_mutable),
+    ("threads_frozen", benchmark_threads_frozen),
+    ("criteria_match", benchmark_criteria_match),
+    ("to_gedcom_string", benchmark_to_gedcom_string),
+    ("to_jsonl_string", benchmark_to_jsonl_string),
+)
+
+
+# Preparations of benchmarks which are not measured
+BENCHMARK_SETUPS = {
+    "threads_frozen": Workload.get_frozen_parser,
+    "ahnentafel_deep": Workload.get_deep_pedigree_parser,
+}
+
+
+def measure(benchmark, workload, memory=True):
+    """Returns the seconds taken by a benchmark and its peak memory in bytes, `None` if not measured
+    :rtype: tuple
+    """
+    start = perf_counter()
+    benchmark(workload)
+    seconds = perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        try:
+            benchmark(workload)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return seconds, peak_memory
+
+
+def run(sizes, names=None, memory=True, output=sys.stdout):
+    """Runs the benchmarks for every size of synthetic tree and returns the results
+    :rtype: dict
+    """
+    results = {}
+    directory = tempfile.mkdtemp(prefix="gedcom-benchmarks-")
+
+    for size in sizes:
+        file_path = os.path.join(directory, "workload-%d.ged" % size)
+        write_gedcom_file(file_path, size)
+
+        workload = Workload(file_path, size)
+        results[str(size)] = {}
+
+        for name, benchmark in BENCHMARKS:
+            if names and name not in names:
+                continue
+            if name in BENCHMARK_SETUPS:
+                BENCHMARK_SETUPS[name](workload)
+            seconds, peak_memory = measure(benchmark, workload, memory)
+            results[str(size)][name] = {"seconds": seconds, "peak_memory": peak_memory}
+            output.write("%10d  %-22s %10.3f s  %s\n" % (
+                size, name, seconds, "%10.1f MB" % (peak_memory / 1e6) if peak_memory is not None else ""
+            ))
+            output.flush()
+
+        del workload
+        os.remove(file_path)
+
+    os.rmdir(directory)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(results, baseline, threshold, output=sys.stdout):
+    """Writes the ratio of each result to its baseline and returns the number of regressions
+    :rtype: int
+    """
+    regressions = 0
+    output.write("\nComparison against baseline (ratio > %.2f is a regression):\n" % (1 + threshold))
+
+    for size, benchmarks in sorted(results["results"].items(), key=lambda item: int(item[0])):
+        for name, result in benchmarks.items():
+            baseline_result = baseline.get("results", {}).get(size, {}).get(name)
+            if not baseline_result or not baseline_result["seconds"]:
+                continue
+            ratio = result["seconds"] / baseline_result["seconds"]
+            regression = ratio > 1 + threshold
+            regressions += regression
+            output.write("%10s  %-22s %6.2fx%s\n" % (size, name, ratio, "  REGRESSION" if regression else ""))
+
+    return regressions
+
+
+def main(arguments=None):
+    argument_parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.strip().split("\n")[0])
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                                 help="numbers of individuals of the synthetic trees")
+    argument_parser.add_argument("--benchmarks", nargs="+", choices=[name for name, benchmark in BENCHMARKS],
+                                 help="run only the given benchmarks")
+    argument_parser.add_argument("--no-memory", action="store_true", help="skip measuring peak memory")
+    argument_parser.add_argument("--save", help="write the results as JSON to this file")
+    argument_parser.add_argument("--baseline", help="compare the results against this JSON file")
+    argument_parser.add_argument("--threshold", type=float, default=0.1,
+                                 help="relative slowdown reported as regression, defaults to 0.1")
+    options = argument_parser.parse_args(arguments)
+
+    results = run(options.sizes, options.benchmarks, not options.no_memory)
+
+    if options.save:
+        with open(options.save, "w") as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(results, baseline, options.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
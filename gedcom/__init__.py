@@ -35,7 +35,25 @@ __all__ = [
     # Subpackages
     "element",
     # Modules
+    "ahnentafel",
+    "batch",
+    "citation",
+    "dedup",
+    "diff",
+    "extract",
+    "generator",
     "helpers",
+    "instrumentation",
+    "jsonl",
+    "kinship",
+    "name_index",
     "parser",
-    "tags"
+    "phonetic",
+    "projection",
+    "query",
+    "shard",
+    "sqlite",
+    "tags",
+    "text_index",
+    "validator"
 ]
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Ahnentafel (Sosa-Stradonitz) numbering of the ancestors of an individual.
+
+The proband gets number `1`, the father of the individual with number `n` gets `2n` and the mother
+gets `2n + 1`. An ancestor reached through several lines of descent, known as pedigree collapse,
+gets all of the resulting numbers. The generation of a number `n` is `n.bit_length() - 1`, so the
+proband is generation `0` and the parents are generation `1`.
+
+All numbers are assigned in one breadth-first pass over the generations. Every individual is
+handled once per generation, with the numbers of all of its lines of descent at once. The fathers
+and mothers of every individual are looked up once and kept by the `AhnentafelNumberer`, so
+numbering many probands of the same data costs no further lookups:
+
+```python
+from gedcom.parser import Parser
+import gedcom.ahnentafel
+
+parser = Parser()
+parser.parse_file(file_path)
+proband = parser.get_element_dictionary()["@I1@"]
+
+numbering = gedcom.ahnentafel.number_ancestors(parser, proband)
+for number, ancestor in numbering.iter_numbers():
+    print(number, numbering.get_generation(ancestor), ancestor.get_name())
+```
+
+As with `gedcom.parser.Parser.get_parents()` the parent type `"NAT"` only follows natural parents,
+given by `_FREL` and `_MREL` values of `Natural`. With `"ALL"` individuals listed as child in
+several families, like an adoptive and a natural one, have several fathers and mothers sharing the
+same numbers.
+"""
+
+from gedcom.element.individual import IndividualElement
+from gedcom.parser import NotAnActualIndividualError
+import gedcom.tags
+
+PARENT_TYPE_ALL = "ALL"
+PARENT_TYPE_NATURAL = "NAT"
+
+
+class AncestorLoopError(Exception):
+    pass
+
+
+class AhnentafelNumbering(object):
+    """Ahnentafel numbers of the ancestors of a proband, see `gedcom.ahnentafel.AhnentafelNumberer.number()`"""
+
+    def __init__(self, proband, numbers):
+        self.__proband = proband
+        self.__numbers = numbers
+        self.__individuals = None
+
+    def __get_individuals_by_number(self):
+        """Returns the individuals having each number, built on first use
+        :rtype: dict of list
+        """
+        if self.__individuals is None:
+            self.__individuals = {}
+            for individual, individual_numbers in self.__numbers.values():
+                for number in individual_numbers:
+                    individuals = self.__individuals.get(number)
+                    if individuals is None:
+                        self.__individuals[number] = [individual]
+                    else:
+                        individuals.append(individual)
+        return self.__individuals
+
+    def get_proband(self):
+        """:rtype: IndividualElement"""
+        return self.__proband
+
+    def get_numbers(self, individual):
+        """Returns all Ahnentafel numbers of an individual in ascending order, an empty list if not an ancestor
+        :type individual: IndividualElement
+        :rtype: list of int
+        """
+        individual_numbers = self.__numbers.get(id(individual))
+        return individual_numbers[1] if individual_numbers is not None else []
+
+    def get_generations(self, individual):
+        """Returns the distinct generations of an individual in ascending order
+        :type individual: IndividualElement
+        :rtype: list of int
+        """
+        generations = []
+        for number in self.get_numbers(individual):
+            generation = number.bit_length() - 1
+            if not generations or generations[-1] != generation:
+                generations.append(generation)
+        return generations
+
+    def get_generation(self, individual):
+        """Returns the closest generation of an individual, `None` if not an ancestor
+        :type individual: IndividualElement
+        :rtype: int
+        """
+        numbers = self.get_numbers(individual)
+        return numbers[0].bit_length() - 1 if numbers else None
+
+    def get_individuals(self, number):
+        """Returns the individuals having an Ahnentafel number
+        :type number: int
+        :rtype: list of IndividualElement
+        """
+        return self.__get_individuals_by_number().get(number, [])
+
+    def get_ancestors(self, generation=None):
+        """Returns the proband and all ancestors, or those of a single generation, ordered by their lowest number
+        :type generation: int
+        :rtype: list of IndividualElement
+        """
+        ancestors = [individual_numbers for individual_numbers in self.__numbers.values()
+                     if generation is None or generation in self.get_generations(individual_numbers[0])]
+        ancestors.sort(key=lambda individual_numbers: individual_numbers[1][0])
+        return [individual for individual, individual_numbers in ancestors]
+
+    def get_collapsed_ancestors(self):
+        """Returns the ancestors having more than one Ahnentafel number due to pedigree collapse
+        :rtype: list of IndividualElement
+        """
+        return [individual for individual in self.get_ancestors() if len(self.get_numbers(individual)) > 1]
+
+    def get_max_generation(self):
+        """Returns the most distant generation of any ancestor
+        :rtype: int
+        """
+        return max(individual_numbers[-1] for individual, individual_numbers in self.__numbers.values()).bit_length() - 1
+
+    def iter_numbers(self):
+        """Yields tuples (`int` number, `IndividualElement` individual) in ascending order of numbers
+        :rtype: generator of tuple
+        """
+        individuals = self.__get_individuals_by_number()
+        for number in sorted(individuals):
+            for individual in individuals[number]:
+                yield number, individual
+
+
+class AhnentafelNumberer(object):
+    """Assigns Ahnentafel numbers, keeping the parents of every individual looked up so far"""
+
+    def __init__(self, parser, parent_type=PARENT_TYPE_ALL):
+        self.__parser = parser
+        self.__parent_type = parent_type
+        self.__parents = {}
+        # Ids of individuals whose ancestors are known to be free of loops
+        self.__checked = set()
+
+    def get_parents(self, individual):
+        """Returns the fathers and mothers of an individual as a tuple of two lists
+        :type individual: IndividualElement
+        :rtype: tuple
+        """
+        parents = self.__parents.get(id(individual))
+        if parents is None:
+            parents = self.__parents[id(individual)] = self.__find_parents(individual)
+        return parents
+
+    def __find_parents(self, individual):
+        """:rtype: tuple"""
+        element_dictionary = self.__parser.get_element_dictionary()
+        pointer = individual.get_pointer()
+        natural = self.__parent_type == PARENT_TYPE_NATURAL
+        fathers = []
+        mothers = []
+
+        for family_link in individual.get_child_elements():
+            if family_link.get_tag() != gedcom.tags.GEDCOM_TAG_FAMILY_CHILD:
+                continue
+            family = family_link.get_linked_record() or element_dictionary.get(family_link.get_value())
+            if family is None:
+                continue
+
+            follow_father = follow_mother = not natural
+            if natural:
+                for child_link in family.get_child_elements():
+                    if child_link.get_tag() == gedcom.tags.GEDCOM_TAG_CHILD and child_link.get_value() == pointer:
+                        for relationship in child_link.get_child_elements():
+                            if relationship.get_value() == "Natural":
+                                if relationship.get_tag() == gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL:
+                                    follow_father = True
+                                elif relationship.get_tag() == gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL:
+                                    follow_mother = True
+
+            for parent_link in family.get_child_elements():
+                tag = parent_link.get_tag()
+                if tag == gedcom.tags.GEDCOM_TAG_HUSBAND and follow_father:
+                    parents = fathers
+                elif tag == gedcom.tags.GEDCOM_TAG_WIFE and follow_mother:
+                    parents = mothers
+                else:
+                    continue
+                parent = parent_link.get_linked_record() or element_dictionary.get(parent_link.get_value())
+                if isinstance(parent, IndividualElement) and parent not in parents:
+                    parents.append(parent)
+
+        return fathers, mothers
+
+    def __check_ancestors(self, proband):
+        """Raises an `AncestorLoopError` if any ancestor of the proband is its own ancestor
+
+        Depth first search marking the individuals on the current line of descent. Individuals whose
+        ancestors are free of loops are remembered for all following calls.
+
+        :type proband: IndividualElement
+        """
+        checked = self.__checked
+        if id(proband) in checked:
+            return
+
+        on_path = {id(proband)}
+        fathers, mothers = self.get_parents(proband)
+        stack = [(proband, iter(fathers + mothers))]
+        while stack:
+            individual, parents = stack[-1]
+            for parent in parents:
+                if id(parent) in checked:
+                    continue
+                if id(parent) in on_path:
+                    raise AncestorLoopError("Ancestors of %s contain a loop through %s" % (
+                        proband.get_pointer(), parent.get_pointer()
+                    ))
+                on_path.add(id(parent))
+                fathers, mothers = self.get_parents(parent)
+                stack.append((parent, iter(fathers + mothers)))
+                break
+            else:
+                stack.pop()
+                on_path.discard(id(individual))
+                checked.add(id(individual))
+
+    def number(self, proband, max_generations=None):
+        """Assigns Ahnentafel numbers to the proband and all of its ancestors, up to `max_generations`
+        generations if given
+
+        Raises an `AncestorLoopError` if an individual is its own ancestor according to the data.
+
+        :type proband: IndividualElement
+        :type max_generations: int
+        :rtype: AhnentafelNumbering
+        """
+        if not isinstance(proband, IndividualElement):
+            raise NotAnActualIndividualError(
+                "Operation only valid for elements with %s tag" % gedcom.tags.GEDCOM_TAG_INDIVIDUAL
+            )
+
+        self.__check_ancestors(proband)
+
+        # Numbers of every individual, keyed by id, as pair of the individual and its list of numbers
+        numbers = {id(proband): (proband, [1])}
+        # Numbers within the current generation only, each individual of the generation being handled once
+        generation = {id(proband): (proband, [1])}
+        generation_index = 0
+
+        while generation and (max_generations is None or generation_index < max_generations):
+            next_generation = {}
+            for individual, individual_numbers in generation.values():
+                fathers, mothers = self.get_parents(individual)
+                for parents, offset in ((fathers, 0), (mothers, 1)):
+                    if not parents:
+                        continue
+                    parent_numbers = [2 * number + offset for number in individual_numbers]
+                    for parent in parents:
+                        next_numbers = next_generation.get(id(parent))
+                        if next_numbers is None:
+                            next_generation[id(parent)] = (parent, list(parent_numbers))
+                        else:
+                            next_numbers[1].extend(parent_numbers)
+
+            for key, (parent, parent_numbers) in next_generation.items():
+                all_numbers = numbers.get(key)
+                if all_numbers is None:
+                    numbers[key] = (parent, list(parent_numbers))
+                else:
+                    all_numbers[1].extend(parent_numbers)
+
+            generation = next_generation
+            generation_index += 1
+
+        for individual_numbers in numbers.values():
+            individual_numbers[1].sort()
+        return AhnentafelNumbering(proband, numbers)
+
+
+def number_ancestors(parser, proband, parent_type=PARENT_TYPE_ALL, max_generations=None):
+    """Assigns Ahnentafel numbers to the proband and all of its ancestors, see `gedcom.ahnentafel`
+    :type parser: Parser
+    :type proband: IndividualElement
+    :type parent_type: str
+    :type max_generations: int
+    :rtype: AhnentafelNumbering
+    """
+    return AhnentafelNumberer(parser, parent_type).number(proband, max_generations)
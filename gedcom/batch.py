@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Batch processing of many GEDCOM files using a pool of worker processes.
+
+Every file gets parsed with `gedcom.parser.Parser.parse_file()` within a worker process, then a
+function is called with the parser and its return value is collected. The function has to be
+defined at module level so it can be sent to the worker processes.
+
+```python
+import gedcom.batch
+
+def count_individuals(parser):
+    return len([element for element in parser.get_root_child_elements() if element.get_tag() == 'INDI'])
+
+for batch_result in gedcom.batch.run_batch('uploads/**/*.ged', count_individuals, files_per_worker=50):
+    print(batch_result.get_file_path(), batch_result.get_result(), batch_result.get_error())
+```
+
+Workers are replaced after processing about `files_per_worker` files each, which bounds the memory a worker
+can hold on to. A file whose result cannot be pickled, or whose worker process dies while processing it,
+for example by running out of memory, is reported as failed without affecting the other files.
+
+The same can be done from the command line, writing one JSON object per file to stdout:
+
+```
+python -m gedcom.batch --function mymodule:count_individuals 'uploads/**/*.ged'
+```
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import pickle
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from gedcom.parser import Parser
+import gedcom.tags
+
+
+class BatchResult(object):
+    """Result of processing a single GEDCOM file"""
+
+    def __init__(self, file_path, result=None, error=None, seconds=0.0):
+        self.__file_path = file_path
+        self.__result = result
+        self.__error = error
+        self.__seconds = seconds
+
+    def get_file_path(self):
+        """:rtype: str"""
+        return self.__file_path
+
+    def get_result(self):
+        """Returns the return value of the function called for the file, `None` if processing failed"""
+        return self.__result
+
+    def get_error(self):
+        """Returns the formatted traceback of the exception raised while processing the file, `None` on success
+        :rtype: str
+        """
+        return self.__error
+
+    def get_seconds(self):
+        """Returns the time spent on parsing and processing the file
+        :rtype: float
+        """
+        return self.__seconds
+
+    def is_successful(self):
+        """:rtype: bool"""
+        return self.__error is None
+
+    def to_dict(self):
+        """:rtype: dict"""
+        return {
+            "file": self.__file_path,
+            "seconds": self.__seconds,
+            "result": self.__result,
+            "error": self.__error,
+        }
+
+
+def element_statistics(parser):
+    """Default batch function returning the number of elements, records, individuals and families
+    :type parser: Parser
+    :rtype: dict
+    """
+    records = parser.get_root_child_elements()
+    return {
+        "elements": len(parser.get_element_list()),
+        "records": len(records),
+        "individuals": len([record for record in records if record.get_tag() == gedcom.tags.GEDCOM_TAG_INDIVIDUAL]),
+        "families": len([record for record in records if record.get_tag() == gedcom.tags.GEDCOM_TAG_FAMILY]),
+    }
+
+
+def expand_file_paths(file_paths):
+    """Expands glob patterns into the matching file paths, keeping their order and dropping duplicates
+    :type file_paths: str or list of str
+    :rtype: list of str
+    """
+    if isinstance(file_paths, str):
+        file_paths = [file_paths]
+
+    expanded_file_paths = []
+    seen = set()
+    for file_path in file_paths:
+        if glob.has_magic(file_path):
+            matches = sorted(glob.glob(file_path, recursive=True))
+        else:
+            matches = [file_path]
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                expanded_file_paths.append(match)
+    return expanded_file_paths
+
+
+def process_file(file_path, function=element_statistics, strict=True):
+    """Parses a single GEDCOM file and calls the function with the parser, catching any exception
+    :type file_path: str
+    :type function: callable
+    :type strict: bool
+    :rtype: BatchResult
+    """
+    start = perf_counter()
+    try:
+        parser = Parser()
+        parser.parse_file(file_path, strict)
+        result = function(parser)
+    except Exception:
+        return BatchResult(file_path, error=traceback.format_exc(), seconds=perf_counter() - start)
+    return BatchResult(file_path, result=result, seconds=perf_counter() - start)
+
+
+def _process_task(task):
+    """Processes a task sent to a worker process and returns a tuple of picklable data only
+
+    Returns a tuple: (`str` file path, `bytes` pickled result, `str` error, `float` seconds)
+
+    :type task: tuple
+    :rtype: tuple
+    """
+    batch_result = process_file(*task)
+    try:
+        pickled_result = pickle.dumps(batch_result.get_result())
+    except Exception:
+        return batch_result.get_file_path(), None, traceback.format_exc(), batch_result.get_seconds()
+    return batch_result.get_file_path(), pickled_result, batch_result.get_error(), batch_result.get_seconds()
+
+
+def _unpack_task_result(task_result):
+    """Returns the `BatchResult` of a tuple returned by `gedcom.batch._process_task()`
+    :type task_result: tuple
+    :rtype: BatchResult
+    """
+    file_path, pickled_result, error, seconds = task_result
+    if error is not None:
+        return BatchResult(file_path, error=error, seconds=seconds)
+    try:
+        return BatchResult(file_path, result=pickle.loads(pickled_result), seconds=seconds)
+    except Exception:
+        return BatchResult(file_path, error=traceback.format_exc(), seconds=seconds)
+
+
+def _process_task_isolated(task):
+    """Processes a task within a worker process of its own, reporting the death of the worker as error
+    :type task: tuple
+    :rtype: BatchResult
+    """
+    with ProcessPoolExecutor(1) as executor:
+        try:
+            return _unpack_task_result(executor.submit(_process_task, task).result())
+        except BrokenProcessPool:
+            return BatchResult(task[0], error="Worker process terminated abruptly while processing the file")
+
+
+def iter_batch(file_paths, function=element_statistics, processes=None, files_per_worker=100, strict=True):
+    """Processes GEDCOM files in a pool of worker processes and yields results in the order of the files
+
+    `file_paths` may contain glob patterns, see `gedcom.batch.expand_file_paths()`. `processes` defaults
+    to the number of CPUs. The pool is replaced after `processes` times `files_per_worker` files. With
+    `processes` set to `1` all files are processed within the current process.
+
+    If a worker process dies, all files not processed yet by the pool are processed again one by one,
+    each in a new worker process, so only the file causing it is reported as failed.
+
+    :type file_paths: str or list of str
+    :type function: callable
+    :type processes: int
+    :type files_per_worker: int
+    :type strict: bool
+    :rtype: generator of BatchResult
+    """
+    tasks = [(file_path, function, strict) for file_path in expand_file_paths(file_paths)]
+
+    if processes == 1:
+        for task in tasks:
+            yield process_file(*task)
+        return
+
+    processes = processes or os.cpu_count() or 1
+    tasks_per_pool = processes * files_per_worker
+
+    for pool_start in range(0, len(tasks), tasks_per_pool):
+        pool_tasks = tasks[pool_start:pool_start + tasks_per_pool]
+        with ProcessPoolExecutor(processes) as executor:
+            futures = [executor.submit(_process_task, task) for task in pool_tasks]
+            for task, future in zip(pool_tasks, futures):
+                try:
+                    batch_result = _unpack_task_result(future.result())
+                except BrokenProcessPool:
+                    batch_result = _process_task_isolated(task)
+                yield batch_result
+
+
+def run_batch(file_paths, function=element_statistics, processes=None, files_per_worker=100, strict=True):
+    """Processes GEDCOM files in a pool of worker processes, see `gedcom.batch.iter_batch()`
+    :type file_paths: str or list of str
+    :type function: callable
+    :type processes: int
+    :type files_per_worker: int
+    :type strict: bool
+    :rtype: list of BatchResult
+    """
+    return list(iter_batch(file_paths, function, processes, files_per_worker, strict))
+
+
+def load_function(name):
+    """Returns the function referenced by a `module:function` string
+    :type name: str
+    :rtype: callable
+    """
+    module_name, separator, function_name = name.partition(':')
+    if not separator or not function_name:
+        raise ValueError("Function must be given as module:function, got %r" % name)
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def main(arguments=None):
+    """Command line entry point, writes one JSON object per file to stdout
+    :type arguments: list of str
+    :rtype: int
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog="gedcom-batch",
+        description="Parse many GEDCOM files in parallel and run a function on each of them."
+    )
+    argument_parser.add_argument("files", nargs="+", help="GEDCOM files or glob patterns")
+    argument_parser.add_argument("--function", default="gedcom.batch:element_statistics",
+                                 help="function called with each parser, as module:function")
+    argument_parser.add_argument("--processes", type=int, default=None,
+                                 help="number of worker processes, defaults to the number of CPUs")
+    argument_parser.add_argument("--files-per-worker", type=int, default=100,
+                                 help="number of files after which a worker process gets replaced")
+    argument_parser.add_argument("--no-strict", action="store_true", help="disable strict parsing")
+    options = argument_parser.parse_args(arguments)
+
+    function = load_function(options.function)
+
+    failures = 0
+    for batch_result in iter_batch(options.files, function, options.processes, options.files_per_worker,
+                                   not options.no_strict):
+        if not batch_result.is_successful():
+            failures += 1
+        sys.stdout.write(json.dumps(batch_result.to_dict(), default=str) + "\n")
+        sys.stdout.flush()
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
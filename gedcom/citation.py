@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Index of the source citations within GEDCOM data.
+
+The index maps the pointer of every cited source record to its citations, giving the cited
+record (like an individual or a family), the cited element within it (like a birth event),
+and the page and quality of data given by the citation. It gets built in a single pass over
+all elements and is cached by `gedcom.parser.Parser.get_citation_index()`:
+
+```python
+from gedcom.parser import Parser
+
+parser = Parser()
+parser.parse_file(file_path)
+citation_index = parser.get_citation_index()
+
+for source_pointer in citation_index.get_source_pointers():
+    source = citation_index.get_source(source_pointer)
+    for citation in citation_index.get_citations(source_pointer):
+        print(source.get_title(), citation.get_record().get_pointer(), citation.get_cited_element().get_tag(),
+              citation.get_page(), citation.get_quality())
+```
+
+Only citations referencing a source record by its pointer are indexed, source descriptions
+written out within a citation are not.
+"""
+
+import gedcom.tags
+
+
+class Citation(object):
+    """A single citation of a source record"""
+
+    def __init__(self, citation_element, record):
+        self.__citation_element = citation_element
+        self.__record = record
+
+    def get_source_pointer(self):
+        """:rtype: str"""
+        return self.__citation_element.get_value()
+
+    def get_citation_element(self):
+        """Returns the `SOUR` element holding this citation
+        :rtype: Element
+        """
+        return self.__citation_element
+
+    def get_record(self):
+        """Returns the logical record containing this citation
+        :rtype: Element
+        """
+        return self.__record
+
+    def get_cited_element(self):
+        """Returns the element supported by this citation, like an event or a name, or the record itself
+        :rtype: Element
+        """
+        return self.__citation_element.get_parent_element()
+
+    def get_page(self):
+        """:rtype: str"""
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_PAGE)
+
+    def get_quality(self):
+        """Returns the quality of the cited information, from `0` (unreliable) to `3` (primary evidence),
+        an empty string if not given
+        :rtype: str
+        """
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_QUALITY_OF_DATA)
+
+    def __get_child_value(self, tag):
+        """:rtype: str"""
+        for child in self.__citation_element.get_child_elements():
+            if child.get_tag() == tag:
+                return child.get_multi_line_value()
+        return ""
+
+
+class CitationIndex(object):
+    """Citations of every source record, see `gedcom.citation.build_citation_index()`"""
+
+    def __init__(self, citations, sources):
+        self.__citations = citations
+        self.__sources = sources
+
+    def get_source_pointers(self):
+        """Returns the pointers of all cited sources, in order of their first citation
+        :rtype: list of str
+        """
+        return list(self.__citations)
+
+    def get_source(self, source_pointer):
+        """Returns the source record with the given pointer, `None` if there is no such record
+        :type source_pointer: str
+        :rtype: SourceElement
+        """
+        return self.__sources.get(source_pointer)
+
+    def get_citations(self, source_pointer):
+        """Returns all citations of the source with the given pointer, in document order
+        :type source_pointer: str
+        :rtype: list of Citation
+        """
+        return self.__citations.get(source_pointer, [])
+
+    def get_cited_records(self, source_pointer):
+        """Returns the records citing the source with the given pointer, each record once
+        :type source_pointer: str
+        :rtype: list of Element
+        """
+        records = []
+        seen = set()
+        for citation in self.get_citations(source_pointer):
+            record = citation.get_record()
+            if id(record) not in seen:
+                seen.add(id(record))
+                records.append(record)
+        return records
+
+    def get_uncited_sources(self):
+        """Returns the source records not cited anywhere
+        :rtype: list of SourceElement
+        """
+        return [source for source_pointer, source in self.__sources.items() if source_pointer not in self.__citations]
+
+
+def _index_citations(element, record, citations):
+    """Recursively adds the citations found below an element to a `dict` of citations keyed by source pointer
+    :type element: Element
+    :type record: Element
+    :type citations: dict
+    """
+    for child in element.get_child_elements():
+        if child.get_tag() == gedcom.tags.GEDCOM_TAG_SOURCE:
+            value = child.get_value()
+            if len(value) > 2 and value[0] == '@' and value[-1] == '@':
+                citations.setdefault(value, []).append(Citation(child, record))
+        if child.get_child_elements():
+            _index_citations(child, record, citations)
+
+
+def build_citation_index(records):
+    """Builds the citation index of the given logical records in a single pass over all their elements
+    :type records: iterable of Element
+    :rtype: CitationIndex
+    """
+    citations = {}
+    sources = {}
+
+    for record in records:
+        if record.get_tag() == gedcom.tags.GEDCOM_TAG_SOURCE and record.get_pointer():
+            sources[record.get_pointer()] = record
+        _index_citations(record, record, citations)
+
+    return CitationIndex(citations, sources)
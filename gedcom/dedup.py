@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Detection of duplicate individuals, like the same person entered twice or brought in by merging files.
+
+Comparing every individual with every other one does not scale, so individuals are grouped into blocks
+first. Individuals share a block if their surnames have the same Soundex code, they have the same sex
+and were born in the same window of years. Only individuals within the same block get compared.
+Each year is part of two overlapping windows, so individuals born a few years apart still meet.
+Blocks larger than `max_block_size` are sorted by given name and birth year, then each individual is
+only compared with the following `window` individuals. This keeps the whole run near-linear in the
+number of individuals.
+
+Individuals without birth year or with unknown sex are not put into a block. They get compared with
+all individuals of the same Soundex code instead, except those of the opposite sex, so a copy lacking
+these details still meets the other copies. Beyond `max_block_size` individuals of a code, again only
+the `window` individuals sorted next to them on either side are compared.
+
+Pairs get scored from `0` to `1` on the similarity of given names, surnames, birth and death years,
+birth places and the names of both parents. Pairs scoring at least `threshold` are duplicates, and
+duplicates of duplicates form a cluster.
+
+```python
+from gedcom.parser import Parser
+import gedcom.dedup
+
+parser = Parser()
+parser.parse_file(file_path)
+
+for cluster in gedcom.dedup.find_duplicates(parser, processes=4):
+    print([individual.get_pointer() for individual in cluster])
+```
+"""
+
+from gedcom.element.individual import IndividualElement
+from gedcom.phonetic import fold, soundex
+import gedcom.tags
+
+DEFAULT_THRESHOLD = 0.85
+DEFAULT_YEAR_BUCKET_SIZE = 10
+DEFAULT_MAX_BLOCK_SIZE = 200
+DEFAULT_WINDOW = 20
+
+# Positions within the features of an individual, see `_get_features()`
+_INDEX = 0
+_GIVEN_NAME = 1
+_SURNAME = 2
+_SEX = 3
+_BIRTH_YEAR = 4
+_DEATH_YEAR = 5
+_BIRTH_PLACE = 6
+_FATHER = 7
+_MOTHER = 8
+
+MINIMUM_WEIGHT = 4.0
+"""Minimum total weight of the features known for both individuals of a pair, below the pair scores `0`"""
+
+
+class DuplicatePair(object):
+    """Two individuals considered to be the same person"""
+
+    def __init__(self, first, second, score):
+        self.__first = first
+        self.__second = second
+        self.__score = score
+
+    def get_first(self):
+        """Returns the individual appearing first within the GEDCOM data
+        :rtype: IndividualElement
+        """
+        return self.__first
+
+    def get_second(self):
+        """:rtype: IndividualElement"""
+        return self.__second
+
+    def get_score(self):
+        """Returns the similarity of both individuals, from `0` to `1`
+        :rtype: float
+        """
+        return self.__score
+
+
+def _text_feature(text):
+    """Returns a folded text along with the set of its character bigrams, `None` for an empty text
+    :type text: str
+    :rtype: tuple
+    """
+    text = fold(text)
+    if not text:
+        return None
+    padded = " %s " % text
+    return text, frozenset(padded[index:index + 2] for index in range(len(padded) - 1))
+
+
+def _text_similarity(first, second):
+    """Returns the Dice coefficient of the character bigrams of two text features
+    :rtype: float
+    """
+    if first[0] == second[0]:
+        return 1.0
+    return 2.0 * len(first[1] & second[1]) / (len(first[1]) + len(second[1]))
+
+
+def _given_name_similarity(first, second):
+    """Compares given names, where matching first names count almost like a full match and a first name
+    shortened to the beginning of the other one, like `Max` for `Maximilian`, still counts a lot
+    :rtype: float
+    """
+    similarity = _text_similarity(first, second)
+    if similarity < 0.9:
+        first_name = first[0].split()[0]
+        second_name = second[0].split()[0]
+        if first_name == second_name:
+            return 0.9
+        if similarity < 0.8 and min(len(first_name), len(second_name)) >= 3 \
+                and (first_name.startswith(second_name) or second_name.startswith(first_name)):
+            return 0.8
+    return similarity
+
+
+def _surname_similarity(first, second):
+    """Compares surnames, where surnames sounding alike count almost like a full match
+    :rtype: float
+    """
+    similarity = _text_similarity(first, second)
+    if similarity < 0.85 and first[2] == second[2]:
+        return 0.85
+    return similarity
+
+
+def _year_similarity(first, second):
+    """:rtype: float"""
+    return max(0.0, 1.0 - abs(first - second) * 0.15)
+
+
+# Tuples of position, weight, similarity function and the total weight of the following features,
+# ordered by descending weight so hopeless pairs get ruled out early
+_FEATURE_WEIGHTS = (
+    (_GIVEN_NAME, 3.0, _given_name_similarity, 9.0),
+    (_SURNAME, 2.0, _surname_similarity, 7.0),
+    (_BIRTH_YEAR, 2.0, _year_similarity, 5.0),
+    (_FATHER, 1.5, _text_similarity, 3.5),
+    (_MOTHER, 1.5, _text_similarity, 2.0),
+    (_DEATH_YEAR, 1.0, _year_similarity, 1.0),
+    (_BIRTH_PLACE, 1.0, _text_similarity, 0.0),
+)
+
+
+def score_features(first, second, threshold=0.0):
+    """Returns the similarity of two individuals from `0` to `1`, given their features
+
+    Only features known for both individuals are taken into account. As soon as the score can not
+    reach `threshold` anymore, `0` is returned without comparing the remaining features.
+
+    :type first: tuple
+    :type second: tuple
+    :type threshold: float
+    :rtype: float
+    """
+    total = 0.0
+    total_weight = 0.0
+    for position, weight, similarity, remaining_weight in _FEATURE_WEIGHTS:
+        first_value = first[position]
+        second_value = second[position]
+        if first_value is None or second_value is None:
+            continue
+        total += weight * similarity(first_value, second_value)
+        total_weight += weight
+        if total + remaining_weight < threshold * (total_weight + remaining_weight):
+            return 0.0
+
+    if total_weight < MINIMUM_WEIGHT:
+        return 0.0
+    return total / total_weight
+
+
+def _name_feature(individual):
+    """Returns the text feature of the full name of an individual
+    :type individual: IndividualElement
+    :rtype: tuple
+    """
+    return _text_feature(" ".join(individual.get_name()))
+
+
+def _get_features(parser, index, individual):
+    """Returns the features of an individual compared by `score_features()` as tuple:
+    (`int` index, given name, surname, `str` sex, `int` birth year, `int` death year, birth place,
+    father, mother), with unknown features set to `None`
+
+    Names and places are tuples of their folded text and its character bigrams, the surname
+    additionally contains its Soundex code.
+
+    :type parser: Parser
+    :type index: int
+    :type individual: IndividualElement
+    :rtype: tuple
+    """
+    given_name, surname = individual.get_name()
+    surname_feature = _text_feature(surname)
+    if surname_feature is not None:
+        surname_feature += (soundex(surname),)
+    birth_year = individual.get_birth_year()
+    death_year = individual.get_death_year()
+    birth_place = individual.get_birth_data()[1]
+
+    father = None
+    mother = None
+    for family in parser.get_families(individual, gedcom.tags.GEDCOM_TAG_FAMILY_CHILD):
+        for husband in parser.get_family_members(family, gedcom.tags.GEDCOM_TAG_HUSBAND):
+            father = _name_feature(husband)
+        for wife in parser.get_family_members(family, gedcom.tags.GEDCOM_TAG_WIFE):
+            mother = _name_feature(wife)
+        break
+
+    return (
+        index,
+        _text_feature(given_name),
+        surname_feature,
+        individual.get_gender(),
+        birth_year if birth_year != -1 else None,
+        death_year if death_year != -1 else None,
+        _text_feature(birth_place),
+        father,
+        mother,
+    )
+
+
+_KNOWN_SEXES = frozenset(("M", "F"))
+
+
+def _get_code(features):
+    """Returns the Soundex code of the surname of an individual, an empty string without surname
+    :type features: tuple
+    :rtype: str
+    """
+    return features[_SURNAME][2] if features[_SURNAME] is not None else ""
+
+
+def _is_blockable(features):
+    """Checks if the birth year and sex of an individual are known, as needed to put it into a block
+    :type features: tuple
+    :rtype: bool
+    """
+    return features[_BIRTH_YEAR] is not None and features[_SEX] in _KNOWN_SEXES
+
+
+def _blocking_keys(features, year_bucket_size):
+    """Returns the keys of the blocks an individual with known birth year and sex belongs to
+    :type features: tuple
+    :type year_bucket_size: int
+    :rtype: list of tuple
+    """
+    code = _get_code(features)
+    birth_year = features[_BIRTH_YEAR]
+    return [
+        (code, features[_SEX], 0, birth_year // year_bucket_size),
+        (code, features[_SEX], 1, (birth_year + year_bucket_size // 2) // year_bucket_size),
+    ]
+
+
+def _sort_key(features):
+    """:rtype: tuple"""
+    return features[_GIVEN_NAME] or ("",), features[_BIRTH_YEAR] or 0
+
+
+def _compare(task):
+    """Runs a comparison task within the current or a worker process
+    :type task: tuple
+    :rtype: list of tuple
+    """
+    return task[0](task[1:])
+
+
+def _compare_block(task):
+    """Compares the individuals of a block and returns the matching pairs as tuples:
+    (`int` first index, `int` second index, `float` score)
+    :type task: tuple
+    :rtype: list of tuple
+    """
+    block, threshold, max_block_size, window = task
+    matches = []
+
+    if len(block) <= max_block_size:
+        for position, first in enumerate(block):
+            for second in block[position + 1:]:
+                score = score_features(first, second, threshold)
+                if score >= threshold:
+                    matches.append((first[_INDEX], second[_INDEX], score))
+        return matches
+
+    block = sorted(block, key=_sort_key)
+    for position, first in enumerate(block):
+        for second in block[position + 1:position + 1 + window]:
+            score = score_features(first, second, threshold)
+            if score >= threshold:
+                matches.append((first[_INDEX], second[_INDEX], score))
+    return matches
+
+
+def _compare_unblocked(task):
+    """Compares the individuals of a Soundex code lacking birth year or sex with all individuals of the
+    code, returning the matching pairs like `gedcom.dedup._compare_block()`
+    :type task: tuple
+    :rtype: list of tuple
+    """
+    blocked, unblocked, threshold, max_block_size, window = task
+    matches = []
+
+    def compare(first, second):
+        if first[_SEX] != second[_SEX] and first[_SEX] in _KNOWN_SEXES and second[_SEX] in _KNOWN_SEXES:
+            return
+        score = score_features(first, second, threshold)
+        if score >= threshold:
+            matches.append((first[_INDEX], second[_INDEX], score))
+
+    if len(blocked) + len(unblocked) <= max_block_size:
+        for position, first in enumerate(unblocked):
+            for second in unblocked[position + 1:]:
+                compare(first, second)
+            for second in blocked:
+                compare(first, second)
+        return matches
+
+    unblocked_indices = {features[_INDEX] for features in unblocked}
+    individuals = sorted(blocked + unblocked, key=_sort_key)
+    for position, first in enumerate(individuals):
+        if first[_INDEX] not in unblocked_indices:
+            continue
+        for second in individuals[max(0, position - window):position]:
+            if second[_INDEX] not in unblocked_indices:
+                compare(first, second)
+        for second in individuals[position + 1:position + 1 + window]:
+            compare(first, second)
+    return matches
+
+
+def find_duplicate_pairs(parser, threshold=DEFAULT_THRESHOLD, year_bucket_size=DEFAULT_YEAR_BUCKET_SIZE,
+                         max_block_size=DEFAULT_MAX_BLOCK_SIZE, window=DEFAULT_WINDOW, processes=1):
+    """Returns all pairs of individuals scoring at least `threshold`, in order of the GEDCOM data
+
+    Blocks get compared within the current process if `processes` is `1`, otherwise within a pool
+    of that many worker processes, or one per CPU if `None`.
+
+    :type parser: Parser
+    :type threshold: float
+    :type year_bucket_size: int
+    :type max_block_size: int
+    :type window: int
+    :type processes: int
+    :rtype: list of DuplicatePair
+    """
+    individuals = [element for element in parser.get_root_child_elements() if isinstance(element, IndividualElement)]
+
+    blocks = {}
+    # Individuals with and without known birth year and sex, by Soundex code
+    blocked = {}
+    unblocked = {}
+    for index, individual in enumerate(individuals):
+        features = _get_features(parser, index, individual)
+        if features[_GIVEN_NAME] is None and features[_SURNAME] is None:
+            continue
+        if not _is_blockable(features):
+            unblocked.setdefault(_get_code(features), []).append(features)
+            continue
+        blocked.setdefault(_get_code(features), []).append(features)
+        for key in _blocking_keys(features, year_bucket_size):
+            blocks.setdefault(key, []).append(features)
+
+    tasks = [(_compare_block, block, threshold, max_block_size, window) for block in blocks.values() if len(block) > 1]
+    tasks.extend((_compare_unblocked, blocked.get(code, []), code_unblocked, threshold, max_block_size, window)
+                 for code, code_unblocked in unblocked.items())
+
+    scores = {}
+    if processes == 1:
+        results = map(_compare, tasks)
+    else:
+        from multiprocessing import Pool
+
+        pool = Pool(processes)
+        results = pool.imap_unordered(_compare, tasks, chunksize=64)
+
+    try:
+        for matches in results:
+            for first_index, second_index, score in matches:
+                pair = (min(first_index, second_index), max(first_index, second_index))
+                scores[pair] = max(score, scores.get(pair, 0.0))
+    finally:
+        if processes != 1:
+            pool.terminate()
+            pool.join()
+
+    return [DuplicatePair(individuals[first_index], individuals[second_index], scores[(first_index, second_index)])
+            for first_index, second_index in sorted(scores)]
+
+
+def cluster_pairs(pairs):
+    """Groups duplicate pairs into clusters of individuals all considered to be the same person
+
+    Individuals are listed in order of their first appearance within the pairs, clusters in order of their
+    first individual.
+
+    :type pairs: list of DuplicatePair
+    :rtype: list of list of IndividualElement
+    """
+    parents = {}
+    order = {}
+
+    def find(key):
+        root = key
+        while parents[root] != root:
+            root = parents[root]
+        while parents[key] != root:
+            parents[key], key = root, parents[key]
+        return root
+
+    for pair in pairs:
+        for individual in (pair.get_first(), pair.get_second()):
+            if id(individual) not in parents:
+                parents[id(individual)] = id(individual)
+                order[id(individual)] = (len(order), individual)
+        first_root = find(id(pair.get_first()))
+        second_root = find(id(pair.get_second()))
+        if first_root != second_root:
+            if order[first_root][0] < order[second_root][0]:
+                parents[second_root] = first_root
+            else:
+                parents[first_root] = second_root
+
+    clusters = {}
+    for key in sorted(order, key=lambda key: order[key][0]):
+        clusters.setdefault(find(key), []).append(order[key][1])
+    return list(clusters.values())
+
+
+def find_duplicates(parser, threshold=DEFAULT_THRESHOLD, year_bucket_size=DEFAULT_YEAR_BUCKET_SIZE,
+                    max_block_size=DEFAULT_MAX_BLOCK_SIZE, window=DEFAULT_WINDOW, processes=1):
+    """Returns clusters of individuals considered to be the same person, see `gedcom.dedup.find_duplicate_pairs()`
+    :type parser: Parser
+    :type threshold: float
+    :type year_bucket_size: int
+    :type max_block_size: int
+    :type window: int
+    :type processes: int
+    :rtype: list of list of IndividualElement
+    """
+    return cluster_pairs(find_duplicate_pairs(parser, threshold, year_bucket_size, max_block_size, window, processes))
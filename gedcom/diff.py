@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Record-level comparison and three-way merging of GEDCOM data.
+
+Every logical record is reduced to a content hash over a canonical form of its subtree:
+
+* concatenation and continuation lines are folded into the value of their parent element,
+* the order of child elements is ignored, except for the relative order of the tags listed
+  in `gedcom.diff.ORDERED_TAGS` (preferred names, birth order of children and so on),
+* the pointer of the record itself is left out, so renumbered records keep their hash.
+
+Records are matched by their pointer, records without a pointer (like `HEAD` and `TRLR`) by their tag and
+occurrence. Records left over on both sides are matched by their hash to detect renumbered pointers.
+All steps are linear in the number of elements.
+
+```python
+from gedcom.parser import Parser
+import gedcom.diff
+
+old_parser = Parser()
+old_parser.parse_file(old_file_path)
+new_parser = Parser()
+new_parser.parse_file(new_file_path)
+
+record_diff = gedcom.diff.diff_records(old_parser.get_root_child_elements(), new_parser.get_root_child_elements())
+for change in record_diff.get_changed_records():
+    print(change.get_new_record().get_pointer(), len(change.get_added_elements()))
+```
+"""
+
+from collections import Counter
+from hashlib import sha1
+import gedcom.tags
+
+ORDERED_TAGS = (
+    gedcom.tags.GEDCOM_TAG_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE,
+    gedcom.tags.GEDCOM_TAG_NAME,
+)
+"""Tags whose relative order among siblings is significant and therefore part of the content hash"""
+
+MULTI_LINE_TAGS = (gedcom.tags.GEDCOM_TAG_CONCATENATION, gedcom.tags.GEDCOM_TAG_CONTINUED)
+
+
+def element_hash(element, include_pointer=True):
+    """Returns the content hash of an element and all of its sub-elements
+    :type element: Element
+    :type include_pointer: bool
+    :rtype: bytes
+    """
+    ordered_hashes = []
+    unordered_hashes = []
+
+    for child in element.get_child_elements():
+        tag = child.get_tag()
+        if tag in MULTI_LINE_TAGS:
+            continue
+        if tag in ORDERED_TAGS:
+            ordered_hashes.append(element_hash(child))
+        else:
+            unordered_hashes.append(element_hash(child))
+
+    unordered_hashes.sort()
+
+    content = sha1()
+    if include_pointer and element.get_pointer():
+        content.update(element.get_pointer().encode('utf-8'))
+    content.update(b'\x1f')
+    content.update(element.get_tag().encode('utf-8'))
+    content.update(b'\x1f')
+    content.update(element.get_multi_line_value().encode('utf-8'))
+    content.update(b'\x1e')
+    content.update(b''.join(ordered_hashes))
+    content.update(b'\x1e')
+    content.update(b''.join(unordered_hashes))
+    return content.digest()
+
+
+def record_hash(record):
+    """Returns the content hash of a logical record, ignoring its own pointer
+    :type record: Element
+    :rtype: bytes
+    """
+    return element_hash(record, include_pointer=False)
+
+
+def _index_records(records):
+    """Returns a `dict` of `(record, hash)` tuples keyed by the pointer of the record, and a `list` of the keys
+    in document order as a tuple: (`dict` index, `list` order)
+
+    Records without a pointer are keyed by a tuple of their tag and their occurrence.
+
+    :type records: iterable of Element
+    :rtype: tuple
+    """
+    index = {}
+    occurrences = Counter()
+    order = []
+
+    for record in records:
+        key = record.get_pointer()
+        if not key:
+            tag = record.get_tag()
+            key = (tag, occurrences[tag])
+            occurrences[tag] += 1
+        if key not in index:
+            order.append(key)
+        index[key] = (record, record_hash(record))
+
+    return index, order
+
+
+def _child_delta(old_record, new_record):
+    """Returns the direct child elements only found in one of both records as tuple: (`list` removed, `list` added)
+    :type old_record: Element
+    :type new_record: Element
+    :rtype: tuple
+    """
+    old_children = [(element_hash(child), child) for child in old_record.get_child_elements()
+                    if child.get_tag() not in MULTI_LINE_TAGS]
+    new_children = [(element_hash(child), child) for child in new_record.get_child_elements()
+                    if child.get_tag() not in MULTI_LINE_TAGS]
+
+    old_counts = Counter(child_hash for child_hash, child in old_children)
+    new_counts = Counter(child_hash for child_hash, child in new_children)
+
+    removed = []
+    for child_hash, child in old_children:
+        if new_counts[child_hash] > 0:
+            new_counts[child_hash] -= 1
+        else:
+            removed.append(child)
+
+    added = []
+    for child_hash, child in new_children:
+        if old_counts[child_hash] > 0:
+            old_counts[child_hash] -= 1
+        else:
+            added.append(child)
+
+    if old_record.get_multi_line_value() != new_record.get_multi_line_value():
+        removed.insert(0, old_record)
+        added.insert(0, new_record)
+
+    return removed, added
+
+
+class RecordChange(object):
+    """A logical record found in both compared sets of records but with different content"""
+
+    def __init__(self, old_record, new_record):
+        self.__old_record = old_record
+        self.__new_record = new_record
+        self.__delta = None
+
+    def get_old_record(self):
+        """:rtype: Element"""
+        return self.__old_record
+
+    def get_new_record(self):
+        """:rtype: Element"""
+        return self.__new_record
+
+    def get_removed_elements(self):
+        """Returns the direct child elements of the old record not found within the new record
+
+        If the value of the record itself changed, the old record is listed first.
+
+        :rtype: list of Element
+        """
+        if self.__delta is None:
+            self.__delta = _child_delta(self.__old_record, self.__new_record)
+        return self.__delta[0]
+
+    def get_added_elements(self):
+        """Returns the direct child elements of the new record not found within the old record
+
+        If the value of the record itself changed, the new record is listed first.
+
+        :rtype: list of Element
+        """
+        if self.__delta is None:
+            self.__delta = _child_delta(self.__old_record, self.__new_record)
+        return self.__delta[1]
+
+
+class RecordDiff(object):
+    """Result of `gedcom.diff.diff_records()`"""
+
+    def __init__(self, added, removed, changed, renumbered):
+        self.__added = added
+        self.__removed = removed
+        self.__changed = changed
+        self.__renumbered = renumbered
+
+    def get_added_records(self):
+        """Returns records only found within the new records
+        :rtype: list of Element
+        """
+        return self.__added
+
+    def get_removed_records(self):
+        """Returns records only found within the old records
+        :rtype: list of Element
+        """
+        return self.__removed
+
+    def get_changed_records(self):
+        """Returns records with the same pointer but different content
+        :rtype: list of RecordChange
+        """
+        return self.__changed
+
+    def get_renumbered_records(self):
+        """Returns records with the same content but a different pointer as tuples: (`Element` old, `Element` new)
+        :rtype: list of tuple
+        """
+        return self.__renumbered
+
+    def is_empty(self):
+        """Checks if both sets of records have the same content
+        :rtype: bool
+        """
+        return not (self.__added or self.__removed or self.__changed or self.__renumbered)
+
+
+def diff_records(old_records, new_records):
+    """Compares two sets of logical records
+    :type old_records: iterable of Element
+    :type new_records: iterable of Element
+    :rtype: RecordDiff
+    """
+    old_index, old_order = _index_records(old_records)
+    new_index, new_order = _index_records(new_records)
+
+    changed = []
+    unmatched_old = {}
+    for key in old_order:
+        old_record, old_hash = old_index[key]
+        if key in new_index:
+            new_record, new_hash = new_index[key]
+            if old_hash != new_hash:
+                changed.append(RecordChange(old_record, new_record))
+        else:
+            unmatched_old.setdefault(old_hash, []).append(old_record)
+
+    added = []
+    renumbered = []
+    for key in new_order:
+        if key in old_index:
+            continue
+        new_record, new_hash = new_index[key]
+        candidates = unmatched_old.get(new_hash)
+        if candidates and isinstance(key, str):
+            renumbered.append((candidates.pop(0), new_record))
+        else:
+            added.append(new_record)
+
+    removed_records = set(id(old_record) for candidates in unmatched_old.values() for old_record in candidates)
+    removed = [old_index[key][0] for key in old_order if id(old_index[key][0]) in removed_records]
+
+    return RecordDiff(added, removed, changed, renumbered)
+
+
+class MergeConflict(object):
+    """A logical record changed differently on both sides of a three-way merge"""
+
+    def __init__(self, key, base_record, our_record, their_record):
+        self.__key = key
+        self.__base_record = base_record
+        self.__our_record = our_record
+        self.__their_record = their_record
+
+    def get_key(self):
+        """Returns the pointer of the record, or a tuple of tag and occurrence for records without a pointer
+        :rtype: str or tuple
+        """
+        return self.__key
+
+    def get_base_record(self):
+        """Returns the record of the common base, `None` if it was added on both sides
+        :rtype: Element
+        """
+        return self.__base_record
+
+    def get_our_record(self):
+        """Returns our record, `None` if we removed it
+        :rtype: Element
+        """
+        return self.__our_record
+
+    def get_their_record(self):
+        """Returns their record, `None` if they removed it
+        :rtype: Element
+        """
+        return self.__their_record
+
+
+class RecordMerge(object):
+    """Result of `gedcom.diff.merge_records()`"""
+
+    def __init__(self, records, conflicts):
+        self.__records = records
+        self.__conflicts = conflicts
+
+    def get_records(self):
+        """Returns the merged records
+
+        Conflicting records are resolved in favor of our side, or of their side if we removed the record.
+
+        :rtype: list of Element
+        """
+        return self.__records
+
+    def get_conflicts(self):
+        """:rtype: list of MergeConflict"""
+        return self.__conflicts
+
+    def has_conflicts(self):
+        """:rtype: bool"""
+        return len(self.__conflicts) > 0
+
+
+def merge_records(base_records, our_records, their_records):
+    """Merges two sets of logical records derived from the same base records
+
+    A record changed on one side only takes that change, including removals. A record changed
+    on both sides in the same way is taken as is. Any other record is reported as conflict.
+    The merged records follow our order, followed by records only added by them.
+
+    :type base_records: iterable of Element
+    :type our_records: iterable of Element
+    :type their_records: iterable of Element
+    :rtype: RecordMerge
+    """
+    base_index, base_order = _index_records(base_records)
+    our_index, our_order = _index_records(our_records)
+    their_index, their_order = _index_records(their_records)
+
+    keys = list(our_order)
+    keys.extend(key for key in their_order if key not in our_index)
+    keys.extend(key for key in base_order if key not in our_index and key not in their_index)
+
+    records = []
+    conflicts = []
+    for key in keys:
+        base_record, base_hash = base_index.get(key, (None, None))
+        our_record, our_hash = our_index.get(key, (None, None))
+        their_record, their_hash = their_index.get(key, (None, None))
+
+        if our_hash == their_hash or their_hash == base_hash:
+            record = our_record
+        elif our_hash == base_hash:
+            record = their_record
+        else:
+            conflicts.append(MergeConflict(key, base_record, our_record, their_record))
+            record = our_record if our_record is not None else their_record
+
+        if record is not None:
+            records.append(record)
+
+    return RecordMerge(records, conflicts)
@@ -35,6 +35,9 @@ __all__ = [
     "family",
     "file",
     "individual",
+    "note",
     "object",
-    "root"
+    "repository",
+    "root",
+    "source"
 ]
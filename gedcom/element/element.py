@@ -34,6 +34,130 @@ from gedcom.helpers import deprecated
 import gedcom.tags
 
 
+class FrozenElementError(Exception):
+    pass
+
+
+_element_classes = {}
+
+
+def _get_default_element_classes():
+    """Returns the specialized element classes shipped with this package keyed by the tag of their elements
+    :rtype: dict
+    """
+    from gedcom.element.family import FamilyElement
+    from gedcom.element.file import FileElement
+    from gedcom.element.individual import IndividualElement
+    from gedcom.element.note import NoteElement
+    from gedcom.element.object import ObjectElement
+    from gedcom.element.repository import RepositoryElement
+    from gedcom.element.source import SourceElement
+
+    return {
+        gedcom.tags.GEDCOM_TAG_FAMILY: FamilyElement,
+        gedcom.tags.GEDCOM_TAG_FILE: FileElement,
+        gedcom.tags.GEDCOM_TAG_INDIVIDUAL: IndividualElement,
+        gedcom.tags.GEDCOM_TAG_NOTE: NoteElement,
+        gedcom.tags.GEDCOM_TAG_OBJECT: ObjectElement,
+        gedcom.tags.GEDCOM_TAG_REPOSITORY: RepositoryElement,
+        gedcom.tags.GEDCOM_TAG_SOURCE: SourceElement,
+    }
+
+
+def get_element_classes():
+    """Returns the `dict` of specialized element classes keyed by the tag of their elements
+
+    Tags not contained within the `dict` are represented by `gedcom.element.element.Element`.
+    The classes get imported on the first call, so importing this module stays cheap.
+
+    :rtype: dict
+    """
+    if not _element_classes:
+        _element_classes.update(_get_default_element_classes())
+    return _element_classes
+
+
+def get_element_class(tag):
+    """Returns the class of elements with the given tag
+    :type tag: str
+    :rtype: type
+    """
+    return get_element_classes().get(tag, Element)
+
+
+def register_element_class(tag, element_class):
+    """Registers a subclass of `gedcom.element.element.Element` for all elements with the given tag
+
+    The class gets used by `gedcom.parser.Parser`, `gedcom.element.element.Element.new_child_element()`
+    and when loading elements from SQLite or JSON Lines, so elements are created with their final
+    class right away. It gets constructed like `Element`, without child elements. Registering a class
+    for a tag like `INDI` replaces the class shipped with this package.
+
+    ```python
+    from gedcom.element.element import Element, register_element_class
+
+    class AncestryElement(Element):
+        def get_ancestry_id(self):
+            return self.get_value()
+
+    register_element_class('_APID', AncestryElement)
+    ```
+
+    :type tag: str
+    :type element_class: type
+    """
+    if not isinstance(element_class, type) or not issubclass(element_class, Element):
+        raise TypeError("Element classes must be subclasses of Element, got %r" % (element_class,))
+    get_element_classes()[tag] = element_class
+
+
+def unregister_element_class(tag):
+    """Restores the class shipped with this package for elements with the given tag, if any
+    :type tag: str
+    """
+    element_classes = get_element_classes()
+    default_element_classes = _get_default_element_classes()
+    if tag in default_element_classes:
+        element_classes[tag] = default_element_classes[tag]
+    else:
+        element_classes.pop(tag, None)
+
+
+def wrap_line(line, available_characters, concatenation_characters):
+    """Splits a single line of text into the chunks of a value and its concatenation lines
+
+    The first chunk holds at most `available_characters` characters, every following chunk at most
+    `concatenation_characters`. Chunks are never cut after a space unless a chunk consists of spaces
+    only, since trailing spaces of a line may get lost. The chunk boundaries are computed in one pass.
+
+    An empty line results in a single empty chunk.
+
+    :type line: str
+    :type available_characters: int
+    :type concatenation_characters: int
+    :rtype: list of str
+    """
+    chunks = []
+    size = len(line)
+    index = 0
+    concatenation_characters = max(concatenation_characters, 1)
+
+    while True:
+        remaining = size - index
+        if remaining <= available_characters:
+            chunks.append(line[index:])
+            return chunks
+
+        spaces = 0
+        while spaces < available_characters and line[index + available_characters - spaces - 1] == ' ':
+            spaces += 1
+        length = available_characters if spaces == available_characters else available_characters - spaces
+
+        chunks.append(line[index:index + length])
+        index += length
+        available_characters = concatenation_characters
+
+
 class Element(object):
     """GEDCOM element
 
@@ -73,6 +197,11 @@ class Element(object):
         # structuring
         self.__children = []
         self.__parent = None
+        self.__linked_record = None
+
+        # caching
+        self.__multi_line_value = None
+        self.__frozen = False
 
         if multi_line:
             self.set_multi_line_value(value)
@@ -105,73 +234,66 @@ class Element(object):
         """Sets the value of this element
         :type value: str
         """
+        if self.__frozen:
+            raise FrozenElementError("Frozen elements can not be modified")
         self.__value = value
+        self.__multi_line_value = None
+        if self.__parent is not None and self.__tag in (gedcom.tags.GEDCOM_TAG_CONCATENATION, gedcom.tags.GEDCOM_TAG_CONTINUED):
+            self.__parent.__multi_line_value = None
 
-    def get_multi_line_value(self):
-        """Returns the value of this element including concatenations or continuations
+    def get_crlf(self):
+        """Returns the line ending of this element from within the GEDCOM file
         :rtype: str
         """
-        result = self.get_value()
-        last_crlf = self.__crlf
-        for element in self.get_child_elements():
-            tag = element.get_tag()
-            if tag == gedcom.tags.GEDCOM_TAG_CONCATENATION:
-                result += element.get_value()
-                last_crlf = element.__crlf
-            elif tag == gedcom.tags.GEDCOM_TAG_CONTINUED:
-                result += last_crlf + element.get_value()
-                last_crlf = element.__crlf
-        return result
+        return self.__crlf
 
-    def __available_characters(self):
-        """Get the number of available characters of the elements original string
-        :rtype: int
-        """
-        element_characters = len(self.to_gedcom_string())
-        return 0 if element_characters > 255 else 255 - element_characters
+    def get_multi_line_value(self):
+        """Returns the value of this element including concatenations or continuations
 
-    def __line_length(self, line):
-        """@TODO Write docs.
-        :type line: str
-        :rtype: int
-        """
-        total_characters = len(line)
-        available_characters = self.__available_characters()
-        if total_characters <= available_characters:
-            return total_characters
-        spaces = 0
-        while spaces < available_characters and line[available_characters - spaces - 1] == ' ':
-            spaces += 1
-        if spaces == available_characters:
-            return available_characters
-        return available_characters - spaces
+        The joined value gets cached until the value of this element or one of its
+        concatenation or continuation child elements is changed.
 
-    def __set_bounded_value(self, value):
-        """@TODO Write docs.
-        :type value: str
-        :rtype: int
+        :rtype: str
         """
-        line_length = self.__line_length(value)
-        self.set_value(value[:line_length])
-        return line_length
+        if self.__multi_line_value is None:
+            result = self.get_value()
+            last_crlf = self.__crlf
+            for element in self.get_child_elements():
+                tag = element.get_tag()
+                if tag == gedcom.tags.GEDCOM_TAG_CONCATENATION:
+                    result += element.get_value()
+                    last_crlf = element.__crlf
+                elif tag == gedcom.tags.GEDCOM_TAG_CONTINUED:
+                    result += last_crlf + element.get_value()
+                    last_crlf = element.__crlf
+            self.__multi_line_value = result
+        return self.__multi_line_value
+
+    def invalidate_cache(self):
+        """Empties the cached multi-line value of this element
+
+        Concatenation and continuation changes made through `set_value()`, `add_child_element()`
+        or `set_multi_line_value()` invalidate the cache automatically. Call this method
+        after manipulating the list returned by `get_child_elements()` directly.
+
+        Frozen elements keep their cached value.
+        """
+        if not self.__frozen:
+            self.__multi_line_value = None
 
-    def __add_bounded_child(self, tag, value):
-        """@TODO Write docs.
+    def __available_characters(self, level, pointer, tag):
+        """Get the number of characters available for the value of a line with the given level, pointer and tag
+        :type level: int
+        :type pointer: str
         :type tag: str
-        :type value: str
         :rtype: int
         """
-        child = self.new_child_element(tag)
-        return child.__set_bounded_value(value)
-
-    def __add_concatenation(self, string):
-        """@TODO Write docs.
-        :rtype: str
-        """
-        index = 0
-        size = len(string)
-        while index < size:
-            index += self.__add_bounded_child(gedcom.tags.GEDCOM_TAG_CONCATENATION, string[index:])
+        if level < 0:
+            return 255
+        element_characters = len(str(level)) + 1 + len(tag) + len(self.__crlf)
+        if pointer != "":
+            element_characters += 1 + len(pointer)
+        return 0 if element_characters > 255 else 255 - element_characters
 
     def set_multi_line_value(self, value):
         """Sets the value of this element, adding concatenation and continuation lines when necessary
@@ -182,17 +304,31 @@ class Element(object):
                                         child.get_tag() not in (gedcom.tags.GEDCOM_TAG_CONCATENATION, gedcom.tags.GEDCOM_TAG_CONTINUED)]
 
         lines = value.splitlines()
-        if lines:
-            line = lines.pop(0)
-            n = self.__set_bounded_value(line)
-            self.__add_concatenation(line[n:])
-
-            for line in lines:
-                n = self.__add_bounded_child(gedcom.tags.GEDCOM_TAG_CONTINUED, line)
-                self.__add_concatenation(line[n:])
+        if not lines:
+            return
+
+        child_level = self.get_level() + 1
+        value_characters = self.__available_characters(self.get_level(), self.get_pointer(), self.get_tag())
+        concatenation_characters = self.__available_characters(child_level, "", gedcom.tags.GEDCOM_TAG_CONCATENATION)
+        continuation_characters = self.__available_characters(child_level, "", gedcom.tags.GEDCOM_TAG_CONTINUED)
+
+        tag = None
+        available_characters = value_characters
+        for line in lines:
+            for chunk in wrap_line(line, available_characters, concatenation_characters):
+                if tag is None:
+                    self.set_value(chunk)
+                else:
+                    self.add_child_element(Element(child_level, "", tag, chunk, self.__crlf, multi_line=False))
+                tag = gedcom.tags.GEDCOM_TAG_CONCATENATION
+            tag = gedcom.tags.GEDCOM_TAG_CONTINUED
+            available_characters = continuation_characters
 
     def get_child_elements(self):
         """Returns the direct child elements of this element
+
+        The child elements of a frozen element are returned as `tuple`.
+
         :rtype: list of Element
         """
         return self.__children
@@ -205,22 +341,8 @@ class Element(object):
         :type value: str
         :rtype: Element
         """
-        from gedcom.element.family import FamilyElement
-        from gedcom.element.file import FileElement
-        from gedcom.element.individual import IndividualElement
-        from gedcom.element.object import ObjectElement
-
-        # Differentiate between the type of the new child element
-        if tag == gedcom.tags.GEDCOM_TAG_FAMILY:
-            child_element = FamilyElement(self.get_level() + 1, pointer, tag, value, self.__crlf)
-        elif tag == gedcom.tags.GEDCOM_TAG_FILE:
-            child_element = FileElement(self.get_level() + 1, pointer, tag, value, self.__crlf)
-        elif tag == gedcom.tags.GEDCOM_TAG_INDIVIDUAL:
-            child_element = IndividualElement(self.get_level() + 1, pointer, tag, value, self.__crlf)
-        elif tag == gedcom.tags.GEDCOM_TAG_OBJECT:
-            child_element = ObjectElement(self.get_level() + 1, pointer, tag, value, self.__crlf)
-        else:
-            child_element = Element(self.get_level() + 1, pointer, tag, value, self.__crlf)
+        element_class = get_element_class(tag)
+        child_element = element_class(self.get_level() + 1, pointer, tag, value, self.__crlf)
 
         self.add_child_element(child_element)
 
@@ -231,9 +353,14 @@ class Element(object):
 
         :type element: Element
         """
+        if self.__frozen:
+            raise FrozenElementError("Frozen elements can not be modified")
         self.get_child_elements().append(element)
         element.set_parent_element(self)
 
+        if element.get_tag() in (gedcom.tags.GEDCOM_TAG_CONCATENATION, gedcom.tags.GEDCOM_TAG_CONTINUED):
+            self.__multi_line_value = None
+
         return element
 
     def get_parent_element(self):
@@ -250,8 +377,72 @@ class Element(object):
 
         :type element: Element
         """
+        if self.__frozen:
+            raise FrozenElementError("Frozen elements can not be modified")
         self.__parent = element
 
+    def get_linked_record(self):
+        """Returns the record referenced by the pointer value of this element
+
+        Links get attached by `gedcom.parser.Parser.resolve_links()`, before that `None` is returned.
+
+        :rtype: Element
+        """
+        return self.__linked_record
+
+    def set_linked_record(self, record):
+        """Attaches the record referenced by the pointer value of this element
+
+        :type record: Element
+        """
+        if self.__frozen:
+            raise FrozenElementError("Frozen elements can not be modified")
+        self.__linked_record = record
+
+    def is_frozen(self):
+        """Checks if this element is frozen
+        :rtype: bool
+        """
+        return self.__frozen
+
+    def freeze(self):
+        """Makes this element and all of its sub-elements read-only
+
+        The multi-line values get cached and the child elements are turned into tuples beforehand.
+        Any later attempt to modify a frozen element raises a `FrozenElementError`. Frozen elements can
+        therefore be read by multiple threads at the same time without locking.
+        """
+        elements = [self]
+        while elements:
+            element = elements.pop()
+            if element.__frozen:
+                continue
+            element.get_multi_line_value()
+            element.__children = tuple(element.__children)
+            element.__frozen = True
+            elements.extend(element.__children)
+
+    def copy(self):
+        """Returns a mutable copy of this element and all of its sub-elements, without a parent element
+        :rtype: Element
+        """
+        copied_element = self.__copy_single()
+        elements = [(self, copied_element)]
+        while elements:
+            element, copied_parent = elements.pop()
+            for child in element.__children:
+                copied_child = child.__copy_single()
+                copied_parent.__children.append(copied_child)
+                copied_child.__parent = copied_parent
+                elements.append((child, copied_child))
+        return copied_element
+
+    def __copy_single(self):
+        """Returns a copy of this element without any child elements
+        :rtype: Element
+        """
+        return self.__class__(self.__level, self.__pointer, self.__tag, self.__value, self.__crlf, multi_line=False)
+
     @deprecated
     def get_individual(self):
         """Returns this element and all of its sub-elements represented as a GEDCOM string
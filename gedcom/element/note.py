@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""GEDCOM element consisting of tag `gedcom.tags.GEDCOM_TAG_NOTE`"""
+
+from gedcom.element.element import Element
+import gedcom.tags
+
+
+class NotAnActualNoteError(Exception):
+    pass
+
+
+class NoteElement(Element):
+    """Note record, or a note within another record which may reference a note record by its pointer"""
+
+    def get_tag(self):
+        return gedcom.tags.GEDCOM_TAG_NOTE
+
+    def is_reference(self):
+        """Checks if this note references a note record instead of holding the text itself
+        :rtype: bool
+        """
+        value = self.get_value()
+        return self.get_level() > 0 and len(value) > 2 and value[0] == '@' and value[-1] == '@'
+
+    def get_text(self):
+        """Returns the text of this note, including its continuation lines
+        :rtype: str
+        """
+        return self.get_multi_line_value()
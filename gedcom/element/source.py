@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""GEDCOM element consisting of tag `gedcom.tags.GEDCOM_TAG_SOURCE`"""
+
+from gedcom.element.element import Element
+import gedcom.tags
+
+
+class NotAnActualSourceError(Exception):
+    pass
+
+
+class SourceElement(Element):
+    """Source record, or a citation of a source record within another record
+
+    Citations carry the pointer of the cited source as value, along with the page and the quality
+    of the data, see `gedcom.element.source.SourceElement.get_page()`.
+    """
+
+    def get_tag(self):
+        return gedcom.tags.GEDCOM_TAG_SOURCE
+
+    def is_citation(self):
+        """Checks if this element cites a source record, instead of being one
+        :rtype: bool
+        """
+        return self.get_level() > 0
+
+    def __get_child_value(self, tag):
+        """Returns the value of the first child element with the given tag, including its continuation lines
+        :type tag: str
+        :rtype: str
+        """
+        for child in self.get_child_elements():
+            if child.get_tag() == tag:
+                return child.get_multi_line_value()
+        return ""
+
+    def get_title(self):
+        """:rtype: str"""
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_TITLE)
+
+    def get_author(self):
+        """:rtype: str"""
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_AUTHOR)
+
+    def get_publication(self):
+        """Returns the publication facts, like place and date of publication
+        :rtype: str
+        """
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_PUBLICATION)
+
+    def get_abbreviation(self):
+        """:rtype: str"""
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_ABBREVIATION)
+
+    def get_text(self):
+        """Returns the text transcribed from the source
+        :rtype: str
+        """
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_TEXT)
+
+    def get_repository_pointer(self):
+        """Returns the pointer of the repository holding this source, an empty string if not given
+        :rtype: str
+        """
+        for child in self.get_child_elements():
+            if child.get_tag() == gedcom.tags.GEDCOM_TAG_REPOSITORY:
+                return child.get_value()
+        return ""
+
+    def get_call_number(self):
+        """Returns the call number of this source within its repository
+        :rtype: str
+        """
+        for child in self.get_child_elements():
+            if child.get_tag() == gedcom.tags.GEDCOM_TAG_REPOSITORY:
+                for repository_data in child.get_child_elements():
+                    if repository_data.get_tag() == gedcom.tags.GEDCOM_TAG_CALL_NUMBER:
+                        return repository_data.get_value()
+        return ""
+
+    def get_page(self):
+        """Returns where within the cited source the information can be found
+        :rtype: str
+        """
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_PAGE)
+
+    def get_quality(self):
+        """Returns the quality of the cited information, from `0` (unreliable) to `3` (primary evidence),
+        an empty string if not given
+        :rtype: str
+        """
+        return self.__get_child_value(gedcom.tags.GEDCOM_TAG_QUALITY_OF_DATA)
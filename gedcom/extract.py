@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Extraction of the relatives of individuals into a standalone GEDCOM file.
+
+Starting from a set of individuals the extraction follows parent families up to `ancestors`
+generations and spouse families down to `descendants` generations, with `None` meaning no limit.
+With `spouses` set the spouses of extracted descendants are included as well, without following
+their own relatives. All source, note, multimedia, repository and submitter records referenced by
+extracted records, directly or through each other, are included too.
+
+References to records not being extracted, like a sibling listed in an extracted family, are
+dropped along with their sub-elements. Pointers are kept unless `renumber` is set, which numbers
+the records anew in the order they are written.
+
+```python
+from gedcom.parser import Parser
+import gedcom.extract
+
+parser = Parser()
+parser.parse_file(file_path)
+individual = parser.get_element_dictionary()["@I1@"]
+
+gedcom.extract.write_extract_file("ancestors.ged", parser, [individual], ancestors=8)
+gedcom.extract.write_extract_file("descendants.ged", parser, [individual], descendants=None, renumber=True)
+```
+
+The same can be done from the command line:
+
+```
+python -m gedcom.extract family.ged ancestors.ged --pointer @I1@ --ancestors 8
+```
+
+Apart from the element dictionary of the parser, which is built once, the extraction only
+visits the extracted records, so it takes time linear in the size of the result.
+"""
+
+import argparse
+import sys
+from gedcom.parser import Parser
+import gedcom.tags
+
+CLOSURE_TAGS = frozenset((
+    gedcom.tags.GEDCOM_TAG_NOTE,
+    gedcom.tags.GEDCOM_TAG_OBJECT,
+    gedcom.tags.GEDCOM_TAG_REPOSITORY,
+    gedcom.tags.GEDCOM_TAG_SOURCE,
+    gedcom.tags.GEDCOM_TAG_SUBMITTER,
+))
+"""Tags of the records included whenever an extracted record references them"""
+
+RECORD_ORDER = (
+    gedcom.tags.GEDCOM_TAG_SUBMITTER,
+    gedcom.tags.GEDCOM_TAG_INDIVIDUAL,
+    gedcom.tags.GEDCOM_TAG_FAMILY,
+    gedcom.tags.GEDCOM_TAG_SOURCE,
+    gedcom.tags.GEDCOM_TAG_REPOSITORY,
+    gedcom.tags.GEDCOM_TAG_NOTE,
+    gedcom.tags.GEDCOM_TAG_OBJECT,
+)
+"""Order in which records are written by tag, records with other tags are written last"""
+
+POINTER_PREFIXES = {
+    gedcom.tags.GEDCOM_TAG_FAMILY: "F",
+    gedcom.tags.GEDCOM_TAG_INDIVIDUAL: "I",
+    gedcom.tags.GEDCOM_TAG_NOTE: "N",
+    gedcom.tags.GEDCOM_TAG_OBJECT: "O",
+    gedcom.tags.GEDCOM_TAG_REPOSITORY: "R",
+    gedcom.tags.GEDCOM_TAG_SOURCE: "S",
+    gedcom.tags.GEDCOM_TAG_SUBMITTER: "U",
+}
+"""Prefixes of renumbered pointers by tag, records with other tags get `X`"""
+
+
+def _is_pointer(value):
+    """:rtype: bool"""
+    return len(value) > 2 and value[0] == '@' and value[-1] == '@'
+
+
+def _get_record(element, element_dictionary):
+    """Returns the record referenced by the pointer value of an element, `None` if unknown
+    :rtype: Element
+    """
+    record = element.get_linked_record()
+    if record is None:
+        record = element_dictionary.get(element.get_value())
+    return record
+
+
+def get_referenced_records(records, element_dictionary, tags=CLOSURE_TAGS):
+    """Returns the records with one of the given tags referenced from the given records, directly or
+    through each other, in the order they were found
+
+    :type records: list of Element
+    :type element_dictionary: dict of Element
+    :type tags: frozenset of str
+    :rtype: list of Element
+    """
+    found = set(record.get_pointer() for record in records)
+    referenced_records = []
+    queue = list(records)
+    for record in queue:
+        elements = [record]
+        for element in elements:
+            if _is_pointer(element.get_value()):
+                linked_record = _get_record(element, element_dictionary)
+                if linked_record is not None and linked_record.get_tag() in tags \
+                        and linked_record.get_pointer() not in found:
+                    found.add(linked_record.get_pointer())
+                    referenced_records.append(linked_record)
+                    queue.append(linked_record)
+            elements.extend(element.get_child_elements())
+    return referenced_records
+
+
+class _Extraction(object):
+    """Records being extracted, keyed by pointer in the order they were found"""
+
+    def __init__(self, parser):
+        self.element_dictionary = parser.get_element_dictionary()
+        self.records = {}
+
+    def add(self, record):
+        """Adds a record and returns whether it was new
+        :rtype: bool
+        """
+        pointer = record.get_pointer()
+        if not pointer or pointer in self.records:
+            return False
+        self.records[pointer] = record
+        return True
+
+    def get_linked_records(self, record, tags):
+        """Returns the records referenced by the child elements of a record with one of the given tags
+        :rtype: list of Element
+        """
+        linked_records = []
+        for child in record.get_child_elements():
+            if child.get_tag() in tags:
+                linked_record = _get_record(child, self.element_dictionary)
+                if linked_record is not None:
+                    linked_records.append(linked_record)
+        return linked_records
+
+    def add_ancestors(self, individuals, generations):
+        """Adds the parent families and parents of individuals up to a number of generations"""
+        queue = [(individual, 0) for individual in individuals]
+        visited = set(individual.get_pointer() for individual in individuals)
+        parent_tags = (gedcom.tags.GEDCOM_TAG_HUSBAND, gedcom.tags.GEDCOM_TAG_WIFE)
+
+        for individual, generation in queue:
+            if generations is not None and generation >= generations:
+                continue
+            for family in self.get_linked_records(individual, (gedcom.tags.GEDCOM_TAG_FAMILY_CHILD,)):
+                self.add(family)
+                for parent in self.get_linked_records(family, parent_tags):
+                    self.add(parent)
+                    if parent.get_pointer() not in visited:
+                        visited.add(parent.get_pointer())
+                        queue.append((parent, generation + 1))
+
+    def add_descendants(self, individuals, generations, spouses):
+        """Adds the spouse families and children of individuals down to a number of generations"""
+        queue = [(individual, 0) for individual in individuals]
+        visited = set(individual.get_pointer() for individual in individuals)
+        spouse_tags = (gedcom.tags.GEDCOM_TAG_HUSBAND, gedcom.tags.GEDCOM_TAG_WIFE)
+
+        for individual, generation in queue:
+            if generations is not None and generation >= generations:
+                continue
+            for family in self.get_linked_records(individual, (gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE,)):
+                self.add(family)
+                if spouses:
+                    for spouse in self.get_linked_records(family, spouse_tags):
+                        self.add(spouse)
+                for child in self.get_linked_records(family, (gedcom.tags.GEDCOM_TAG_CHILD,)):
+                    self.add(child)
+                    if child.get_pointer() not in visited:
+                        visited.add(child.get_pointer())
+                        queue.append((child, generation + 1))
+
+    def add_closure(self, records):
+        """Adds the records with a tag listed in `CLOSURE_TAGS` referenced from the given records"""
+        for record in get_referenced_records(records, self.element_dictionary):
+            self.add(record)
+
+
+def collect_records(parser, individuals, ancestors=0, descendants=0, spouses=True):
+    """Returns the records extracted for the given individuals, see `gedcom.extract`
+
+    The header record is not included.
+
+    :type parser: Parser
+    :type individuals: list of IndividualElement
+    :type ancestors: int
+    :type descendants: int
+    :type spouses: bool
+    :rtype: list of Element
+    """
+    extraction = _Extraction(parser)
+    for individual in individuals:
+        extraction.add(individual)
+    if ancestors is None or ancestors > 0:
+        extraction.add_ancestors(individuals, ancestors)
+    if descendants is None or descendants > 0:
+        extraction.add_descendants(individuals, descendants, spouses)
+
+    root_child_elements = parser.get_root_child_elements()
+    header = None
+    if root_child_elements and root_child_elements[0].get_tag() == gedcom.tags.GEDCOM_TAG_HEADER:
+        header = root_child_elements[0]
+    extraction.add_closure(([header] if header is not None else []) + list(extraction.records.values()))
+
+    order = {tag: index for index, tag in enumerate(RECORD_ORDER)}
+    return sorted(extraction.records.values(), key=lambda record: order.get(record.get_tag(), len(order)))
+
+
+def _iter_element_lines(element, pointers):
+    """Yields the lines of an element and its sub-elements with the pointers replaced, skipping
+    elements referencing records not in `pointers`
+    """
+    value = element.get_value()
+    if _is_pointer(value):
+        value = pointers.get(value)
+        if value is None:
+            return
+
+    line = str(element.get_level())
+    if element.get_pointer():
+        line += ' ' + pointers.get(element.get_pointer(), element.get_pointer())
+    line += ' ' + element.get_tag()
+    if value:
+        line += ' ' + value
+    yield line + element.get_crlf()
+
+    for child in element.get_child_elements():
+        yield from _iter_element_lines(child, pointers)
+
+
+def iter_extract_lines(parser, individuals, ancestors=0, descendants=0, spouses=True, renumber=False):
+    """Yields the lines of a GEDCOM file holding the records extracted for the given individuals
+
+    The header of the parsed data is copied, or a minimal one written if there is none.
+
+    :type parser: Parser
+    :type individuals: list of IndividualElement
+    :type ancestors: int
+    :type descendants: int
+    :type spouses: bool
+    :type renumber: bool
+    :rtype: generator of str
+    """
+    records = collect_records(parser, individuals, ancestors, descendants, spouses)
+
+    if renumber:
+        counters = {}
+        pointers = {}
+        for record in records:
+            prefix = POINTER_PREFIXES.get(record.get_tag(), "X")
+            counters[prefix] = counters.get(prefix, 0) + 1
+            pointers[record.get_pointer()] = "@%s%d@" % (prefix, counters[prefix])
+    else:
+        pointers = {record.get_pointer(): record.get_pointer() for record in records}
+
+    root_child_elements = parser.get_root_child_elements()
+    if root_child_elements and root_child_elements[0].get_tag() == gedcom.tags.GEDCOM_TAG_HEADER:
+        yield from _iter_element_lines(root_child_elements[0], pointers)
+    else:
+        yield "0 %s\n" % gedcom.tags.GEDCOM_TAG_HEADER
+        yield "1 %s\n" % gedcom.tags.GEDCOM_TAG_GEDCOM
+        yield "2 %s 5.5\n" % gedcom.tags.GEDCOM_TAG_VERSION
+        yield "2 %s LINEAGE-LINKED\n" % gedcom.tags.GEDCOM_TAG_FORMAT
+        yield "1 %s UTF-8\n" % gedcom.tags.GEDCOM_TAG_CHARACTER
+
+    for record in records:
+        yield from _iter_element_lines(record, pointers)
+
+    yield "0 %s\n" % gedcom.tags.GEDCOM_TAG_TRAILER
+
+
+def write_extract(output, parser, individuals, ancestors=0, descendants=0, spouses=True, renumber=False):
+    """Writes the records extracted for the given individuals to an open text file, see
+    `gedcom.extract.iter_extract_lines()`
+    :type output: file
+    :type parser: Parser
+    :type individuals: list of IndividualElement
+    :type ancestors: int
+    :type descendants: int
+    :type spouses: bool
+    :type renumber: bool
+    """
+    for line in iter_extract_lines(parser, individuals, ancestors, descendants, spouses, renumber):
+        output.write(line)
+
+
+def write_extract_file(file_path, parser, individuals, ancestors=0, descendants=0, spouses=True, renumber=False):
+    """Writes the records extracted for the given individuals as UTF-8 encoded file, see
+    `gedcom.extract.iter_extract_lines()`
+    :type file_path: str
+    :type parser: Parser
+    :type individuals: list of IndividualElement
+    :type ancestors: int
+    :type descendants: int
+    :type spouses: bool
+    :type renumber: bool
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='') as output:
+        write_extract(output, parser, individuals, ancestors, descendants, spouses, renumber)
+
+
+def _generations(value):
+    """Parses a number of generations, `all` meaning no limit
+    :type value: str
+    :rtype: int
+    """
+    return None if value == "all" else int(value)
+
+
+def main(arguments=None):
+    """Command line entry point
+    :type arguments: list of str
+    :rtype: int
+    """
+    argument_parser = argparse.ArgumentParser(prog="python -m gedcom.extract",
+                                              description="Extract the relatives of individuals into a new GEDCOM file.")
+    argument_parser.add_argument("input", help="GEDCOM file to read")
+    argument_parser.add_argument("output", help="file to write, - for stdout")
+    argument_parser.add_argument("--pointer", action="append", required=True,
+                                 help="pointer of an individual to start from, may be given multiple times")
+    argument_parser.add_argument("--ancestors", type=_generations, default=0,
+                                 help="number of generations of ancestors, all for no limit")
+    argument_parser.add_argument("--descendants", type=_generations, default=0,
+                                 help="number of generations of descendants, all for no limit")
+    argument_parser.add_argument("--no-spouses", action="store_true", help="leave out the spouses of descendants")
+    argument_parser.add_argument("--renumber", action="store_true", help="number the extracted records anew")
+    argument_parser.add_argument("--no-strict", action="store_true", help="disable strict parsing")
+    options = argument_parser.parse_args(arguments)
+
+    parser = Parser()
+    parser.parse_file(options.input, not options.no_strict)
+    element_dictionary = parser.get_element_dictionary()
+
+    individuals = []
+    for pointer in options.pointer:
+        if pointer not in element_dictionary:
+            sys.stderr.write("Unknown pointer %s\n" % pointer)
+            return 1
+        individuals.append(element_dictionary[pointer])
+
+    arguments = (parser, individuals, options.ancestors, options.descendants, not options.no_spouses, options.renumber)
+    if options.output == "-":
+        write_extract(sys.stdout, *arguments)
+    else:
+        write_extract_file(options.output, *arguments)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Generator of synthetic GEDCOM 5.5 data for testing and benchmarking.
+
+The generated data consists of lineages. Each lineage starts with a couple of founders whose
+descendants are followed for the given number of generations. Most descendants marry a spouse
+without known ancestors, a few marry a cousin (pedigree collapse). Individuals and families come
+with dates, places, source citations, notes spanning several `CONC` and `CONT` lines and
+`_FREL`/`_MREL` relationships of children to their parents.
+
+The same seed always generates the same data. Lines are generated one by one and only the current
+generation of the current lineage is held in memory, so files of any size can be written:
+
+```python
+import gedcom.generator
+
+gedcom.generator.write_gedcom_file('synthetic.ged', individuals=1000000, generations=10, seed=1)
+```
+
+Or from the command line:
+
+```
+python -m gedcom.generator --individuals 1000000 --generations 10 --seed 1 synthetic.ged
+```
+"""
+
+import argparse
+import random
+import sys
+from gedcom.element.element import Element
+import gedcom.tags
+
+MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+GIVEN_NAMES = {
+    "M": ("Max", "Paul", "Karl", "Heinrich", "Johann", "Friedrich", "Wilhelm", "Otto", "Hans", "Peter",
+          "Jakob", "Georg", "Ludwig", "August", "Ernst", "Walter", "Hermann", "Franz", "Josef", "Anton"),
+    "F": ("Anna", "Maria", "Emma", "Berta", "Martha", "Frieda", "Elisabeth", "Clara", "Greta", "Sophie",
+          "Katharina", "Margarethe", "Luise", "Johanna", "Wilhelmine", "Dorothea", "Helene", "Ida", "Olga", "Rosa"),
+}
+
+SURNAMES = ("Mustermann", "Meyer", "Maier", "Mayer", "Schmidt", "Schmitt", "Schneider", "Fischer", "Weber",
+            "Becker", "Wagner", "Hoffmann", "Schulz", "Koch", "Bauer", "Richter", "Klein", "Wolf", "Schröder",
+            "Neumann", "Schwarz", "Zimmermann", "Braun", "Krüger", "Hofmann", "Hartmann", "Lange", "Schmitz",
+            "Werner", "Krause")
+
+PLACES = ("Musterstadt, Musterkreis, Bayern, Deutschland", "Berlin, Berlin, Deutschland",
+          "Hamburg, Hamburg, Deutschland", "Bremen, Bremen, Deutschland", "Leipzig, Leipzig, Sachsen, Deutschland",
+          "Dresden, Dresden, Sachsen, Deutschland", "Köln, Köln, Nordrhein-Westfalen, Deutschland",
+          "Mainz, Mainz, Rheinland-Pfalz, Deutschland", "Trier, Trier, Rheinland-Pfalz, Deutschland",
+          "Kiel, Kiel, Schleswig-Holstein, Deutschland", "Wien, Wien, Österreich", "Zürich, Zürich, Schweiz")
+
+OCCUPATIONS = ("Bauer", "Schmied", "Müller", "Bäcker", "Lehrer", "Pfarrer", "Händler", "Schneider", "Weber",
+               "Tagelöhner")
+
+WORDS = ("the", "family", "lived", "in", "a", "small", "house", "near", "church", "records", "show", "that",
+         "they", "moved", "after", "war", "farm", "was", "sold", "children", "baptized", "parish", "register",
+         "entry", "mentions", "witness", "godparents", "letter", "describes", "harvest", "winter", "travel")
+
+RELATIONSHIPS = ("Natural", "Natural", "Natural", "Natural", "Natural", "Natural", "Natural", "Natural",
+                 "Adopted", "Step")
+
+CURRENT_YEAR = 2020
+
+
+class _State(object):
+    """Counters and random number generator shared while generating lines"""
+
+    def __init__(self, seed, individuals, sources, repositories, notes):
+        self.rng = random.Random(seed)
+        self.individuals = individuals
+        self.individual_count = 0
+        self.family_count = 0
+        self.sources = sources
+        self.repositories = repositories
+        self.notes = notes
+
+    def new_member(self, sex, surname, family_as_child, birth_year):
+        """Returns a new member of a generation as tuple:
+        (`str` pointer, `str` sex, `str` surname, `str` family as child, `int` birth year)
+        :rtype: tuple
+        """
+        self.individual_count += 1
+        return "@I%d@" % self.individual_count, sex, surname, family_as_child, birth_year
+
+    def is_full(self):
+        """:rtype: bool"""
+        return self.individual_count >= self.individuals
+
+
+def _date(rng, year):
+    """Returns a date of the given year in one of the common GEDCOM date formats
+    :rtype: str
+    """
+    kind = rng.random()
+    if kind < 0.75:
+        return "%d %s %d" % (rng.randint(1, 28), rng.choice(MONTHS), year)
+    if kind < 0.85:
+        return "%s %d" % (rng.choice(MONTHS), year)
+    if kind < 0.95:
+        return "ABT %d" % year
+    return "BEF %d" % year
+
+
+def _text(rng, words):
+    """Returns a text of random words, split into paragraphs
+    :rtype: str
+    """
+    paragraphs = []
+    while words > 0:
+        count = min(words, rng.randint(20, 80))
+        words -= count
+        paragraphs.append(" ".join(rng.choice(WORDS) for index in range(count)).capitalize() + ".")
+    return "\n".join(paragraphs)
+
+
+def _multi_line_lines(level, pointer, tag, value):
+    """Yields the lines of an element whose value is split into concatenation and continuation lines
+    :rtype: generator of str
+    """
+    element = Element(level, pointer, tag, value)
+    yield element.to_gedcom_string()
+    for child in element.get_child_elements():
+        yield child.to_gedcom_string()
+
+
+def _citation_lines(state, level):
+    """Yields the lines of a source citation
+    :rtype: generator of str
+    """
+    rng = state.rng
+    yield "%d %s @S%d@\n" % (level, gedcom.tags.GEDCOM_TAG_SOURCE, rng.randint(1, state.sources))
+    yield "%d %s p. %d\n" % (level + 1, gedcom.tags.GEDCOM_TAG_PAGE, rng.randint(1, 500))
+    yield "%d %s %d\n" % (level + 1, gedcom.tags.GEDCOM_TAG_QUALITY_OF_DATA, rng.randint(0, 3))
+
+
+def _event_lines(state, tag, year):
+    """Yields the lines of an event with date, place and optionally a source citation
+    :rtype: generator of str
+    """
+    rng = state.rng
+    yield "1 %s\n" % tag
+    yield "2 %s %s\n" % (gedcom.tags.GEDCOM_TAG_DATE, _date(rng, year))
+    yield "2 %s %s\n" % (gedcom.tags.GEDCOM_TAG_PLACE, rng.choice(PLACES))
+    if rng.random() < 0.5:
+        for line in _citation_lines(state, 2):
+            yield line
+
+
+def _individual_lines(state, member, families_as_spouse):
+    """Yields the lines of an individual record
+    :rtype: generator of str
+    """
+    rng = state.rng
+    pointer, sex, surname, family_as_child, birth_year = member
+    given_name = rng.choice(GIVEN_NAMES[sex])
+    if rng.random() < 0.3:
+        given_name += " " + rng.choice(GIVEN_NAMES[sex])
+
+    yield "0 %s %s\n" % (pointer, gedcom.tags.GEDCOM_TAG_INDIVIDUAL)
+    yield "1 %s %s /%s/\n" % (gedcom.tags.GEDCOM_TAG_NAME, given_name, surname)
+    yield "2 %s %s\n" % (gedcom.tags.GEDCOM_TAG_GIVEN_NAME, given_name)
+    yield "2 %s %s\n" % (gedcom.tags.GEDCOM_TAG_SURNAME, surname)
+    yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_SEX, sex)
+
+    for line in _event_lines(state, gedcom.tags.GEDCOM_TAG_BIRTH, birth_year):
+        yield line
+
+    death_year = birth_year + rng.randint(1, 95)
+    if death_year < CURRENT_YEAR:
+        for line in _event_lines(state, gedcom.tags.GEDCOM_TAG_DEATH, death_year):
+            yield line
+        if rng.random() < 0.3:
+            for line in _event_lines(state, gedcom.tags.GEDCOM_TAG_BURIAL, death_year):
+                yield line
+
+    if rng.random() < 0.4:
+        yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_OCCUPATION, rng.choice(OCCUPATIONS))
+
+    if rng.random() < 0.1:
+        yield "1 %s @N%d@\n" % (gedcom.tags.GEDCOM_TAG_NOTE, rng.randint(1, state.notes))
+    elif rng.random() < 0.05:
+        for line in _multi_line_lines(1, "", gedcom.tags.GEDCOM_TAG_NOTE, _text(rng, rng.randint(10, 120))):
+            yield line
+
+    if family_as_child is not None:
+        yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_FAMILY_CHILD, family_as_child)
+    for family in families_as_spouse:
+        yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE, family)
+
+    if rng.random() < 0.3:
+        for line in _citation_lines(state, 1):
+            yield line
+
+
+def _family_lines(state, family_pointer, husband, wife, children):
+    """Yields the lines of a family record
+    :rtype: generator of str
+    """
+    rng = state.rng
+    yield "0 %s %s\n" % (family_pointer, gedcom.tags.GEDCOM_TAG_FAMILY)
+    yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_HUSBAND, husband[0])
+    yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_WIFE, wife[0])
+    for child in children:
+        yield "1 %s %s\n" % (gedcom.tags.GEDCOM_TAG_CHILD, child[0])
+        yield "2 %s %s\n" % (gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL, rng.choice(RELATIONSHIPS))
+        yield "2 %s %s\n" % (gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL, rng.choice(RELATIONSHIPS))
+    marriage_year = max(husband[4], wife[4]) + rng.randint(18, 30)
+    for line in _event_lines(state, gedcom.tags.GEDCOM_TAG_MARRIAGE, marriage_year):
+        yield line
+
+
+def _lineage_lines(state, generations, collapse_rate, start_year):
+    """Yields the lines of the individuals and families of one lineage
+    :rtype: generator of str
+    """
+    rng = state.rng
+
+    surname = rng.choice(SURNAMES)
+    generation = [state.new_member("M", surname, None, start_year + rng.randint(0, 20))]
+
+    for generation_index in range(generations):
+        if not generation:
+            break
+
+        last_generation = generation_index == generations - 1
+
+        # Pair the members of this generation, mostly with spouses without known ancestors
+        couples = []
+        singles = []
+        index = 0
+        while index < len(generation):
+            member = generation[index]
+            index += 1
+            if last_generation or state.is_full() or rng.random() > 0.75:
+                singles.append(member)
+                continue
+            cousin = generation[index] if index < len(generation) else None
+            if (cousin is not None and cousin[1] != member[1] and cousin[3] != member[3]
+                    and rng.random() < collapse_rate):
+                spouse = cousin
+                index += 1
+            else:
+                spouse = state.new_member("F" if member[1] == "M" else "M", rng.choice(SURNAMES), None,
+                                          member[4] + rng.randint(-5, 5))
+            couples.append((member, spouse) if member[1] == "M" else (spouse, member))
+
+        families = []
+        for husband, wife in couples:
+            state.family_count += 1
+            family_pointer = "@F%d@" % state.family_count
+            children = []
+            for child_index in range(rng.randint(1, 5)):
+                if state.is_full():
+                    break
+                birth_year = max(husband[4], wife[4]) + rng.randint(20, 40)
+                children.append(state.new_member(rng.choice("MF"), husband[2], family_pointer, birth_year))
+            families.append((family_pointer, husband, wife, children))
+
+        for member in singles:
+            for line in _individual_lines(state, member, ()):
+                yield line
+        for family_pointer, husband, wife, children in families:
+            for line in _individual_lines(state, husband, (family_pointer,)):
+                yield line
+            for line in _individual_lines(state, wife, (family_pointer,)):
+                yield line
+            for line in _family_lines(state, family_pointer, husband, wife, children):
+                yield line
+
+        generation = [child for family in families for child in family[3]]
+
+    for member in generation:
+        for line in _individual_lines(state, member, ()):
+            yield line
+
+
+def iter_gedcom_lines(individuals=1000, generations=8, seed=0, collapse_rate=0.02, start_year=1600):
+    """Yields the lines of synthetic GEDCOM 5.5 data, each including the new line at the end
+
+    Lineages spanning `generations` generations are generated until the given number of individuals
+    is reached. `collapse_rate` is the probability of a descendant marrying a cousin.
+
+    :type individuals: int
+    :type generations: int
+    :type seed: int
+    :type collapse_rate: float
+    :type start_year: int
+    :rtype: generator of str
+    """
+    sources = max(1, individuals // 200)
+    repositories = max(1, sources // 10)
+    notes = max(1, individuals // 100)
+    state = _State(seed, individuals, sources, repositories, notes)
+    rng = state.rng
+
+    yield "0 %s\n" % gedcom.tags.GEDCOM_TAG_HEADER
+    yield "1 %s python-gedcom\n" % gedcom.tags.GEDCOM_TAG_SOURCE
+    yield "2 %s Synthetic GEDCOM generator\n" % gedcom.tags.GEDCOM_TAG_NAME
+    yield "1 %s @U1@\n" % gedcom.tags.GEDCOM_TAG_SUBMITTER
+    yield "1 %s\n" % gedcom.tags.GEDCOM_TAG_GEDCOM
+    yield "2 %s 5.5\n" % gedcom.tags.GEDCOM_TAG_VERSION
+    yield "2 %s LINEAGE-LINKED\n" % gedcom.tags.GEDCOM_TAG_FORMAT
+    yield "1 %s UTF-8\n" % gedcom.tags.GEDCOM_TAG_CHARACTER
+    yield "0 @U1@ %s\n" % gedcom.tags.GEDCOM_TAG_SUBMITTER
+    yield "1 %s Synthetic Submitter\n" % gedcom.tags.GEDCOM_TAG_NAME
+
+    for index in range(1, repositories + 1):
+        yield "0 @R%d@ %s\n" % (index, gedcom.tags.GEDCOM_TAG_REPOSITORY)
+        yield "1 %s Archiv %s\n" % (gedcom.tags.GEDCOM_TAG_NAME, rng.choice(PLACES).split(",")[0])
+
+    for index in range(1, sources + 1):
+        place = rng.choice(PLACES).split(",")[0]
+        yield "0 @S%d@ %s\n" % (index, gedcom.tags.GEDCOM_TAG_SOURCE)
+        yield "1 %s Kirchenbuch %s %d\n" % (gedcom.tags.GEDCOM_TAG_TITLE, place, index)
+        yield "1 %s Pfarramt %s\n" % (gedcom.tags.GEDCOM_TAG_AUTHOR, place)
+        yield "1 %s %s, %d\n" % (gedcom.tags.GEDCOM_TAG_PUBLICATION, place, rng.randint(1600, 1900))
+        yield "1 %s @R%d@\n" % (gedcom.tags.GEDCOM_TAG_REPOSITORY, rng.randint(1, repositories))
+        yield "2 %s KB-%d\n" % (gedcom.tags.GEDCOM_TAG_CALL_NUMBER, index)
+        if rng.random() < 0.3:
+            for line in _multi_line_lines(1, "", gedcom.tags.GEDCOM_TAG_TEXT, _text(rng, rng.randint(30, 200))):
+                yield line
+
+    for index in range(1, notes + 1):
+        for line in _multi_line_lines(0, "@N%d@" % index, gedcom.tags.GEDCOM_TAG_NOTE,
+                                      _text(rng, rng.randint(10, 150))):
+            yield line
+
+    while not state.is_full():
+        for line in _lineage_lines(state, generations, collapse_rate, start_year + rng.randint(0, 50)):
+            yield line
+
+    yield "0 %s\n" % gedcom.tags.GEDCOM_TAG_TRAILER
+
+
+def write_gedcom(output, individuals=1000, generations=8, seed=0, collapse_rate=0.02, start_year=1600):
+    """Writes synthetic GEDCOM 5.5 data to an open text file, see `gedcom.generator.iter_gedcom_lines()`
+    :type output: file
+    :type individuals: int
+    :type generations: int
+    :type seed: int
+    :type collapse_rate: float
+    :type start_year: int
+    """
+    for line in iter_gedcom_lines(individuals, generations, seed, collapse_rate, start_year):
+        output.write(line)
+
+
+def write_gedcom_file(file_path, individuals=1000, generations=8, seed=0, collapse_rate=0.02, start_year=1600):
+    """Writes synthetic GEDCOM 5.5 data as UTF-8 encoded file, see `gedcom.generator.iter_gedcom_lines()`
+    :type file_path: str
+    :type individuals: int
+    :type generations: int
+    :type seed: int
+    :type collapse_rate: float
+    :type start_year: int
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as output:
+        write_gedcom(output, individuals, generations, seed, collapse_rate, start_year)
+
+
+def main(arguments=None):
+    """Command line entry point
+    :type arguments: list of str
+    :rtype: int
+    """
+    argument_parser = argparse.ArgumentParser(prog="python -m gedcom.generator",
+                                              description="Generate synthetic GEDCOM 5.5 data.")
+    argument_parser.add_argument("output", help="file to write, - for stdout")
+    argument_parser.add_argument("--individuals", type=int, default=1000, help="number of individuals")
+    argument_parser.add_argument("--generations", type=int, default=8, help="number of generations per lineage")
+    argument_parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    argument_parser.add_argument("--collapse-rate", type=float, default=0.02,
+                                 help="probability of a descendant marrying a cousin")
+    options = argument_parser.parse_args(arguments)
+
+    if options.output == "-":
+        write_gedcom(sys.stdout, options.individuals, options.generations, options.seed, options.collapse_rate)
+    else:
+        write_gedcom_file(options.output, options.individuals, options.generations, options.seed,
+                          options.collapse_rate)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Statistics and callback hooks recorded by an instrumented `gedcom.parser.Parser`.
+
+Instrumentation is disabled by default and costs nothing until it gets enabled:
+
+```python
+from gedcom.parser import Parser
+
+parser = Parser()
+statistics = parser.enable_instrumentation(
+    on_parse_finished=lambda statistics: print(statistics.to_dict())
+)
+parser.parse_file(file_path)
+parser.get_element_dictionary()
+
+print(statistics.get_lines_per_second(), statistics.get_tag_counts().most_common(5))
+print(statistics.get_cache_build_seconds())
+```
+
+While instrumented, parsing measures the time spent on decoding each line, on tokenizing it into
+level, pointer, tag and value, and on building the element tree. These measurements add some
+overhead of their own, so the total parse time is slightly higher than without instrumentation.
+"""
+
+from collections import Counter
+
+CACHE_ELEMENT_LIST = "element_list"
+CACHE_ELEMENT_DICTIONARY = "element_dictionary"
+
+
+class ParseStatistics(object):
+    """Statistics of all parses and cache builds of an instrumented parser"""
+
+    def __init__(self, on_element=None, on_parse_finished=None, on_cache_built=None):
+        self.__on_element = on_element
+        self.__on_parse_finished = on_parse_finished
+        self.__on_cache_built = on_cache_built
+        self.reset()
+
+    def reset(self):
+        """Sets all statistics back to zero"""
+        self.__lines = 0
+        self.__seconds = 0.0
+        self.__decode_seconds = 0.0
+        self.__tokenize_seconds = 0.0
+        self.__build_seconds = 0.0
+        self.__tag_counts = Counter()
+        self.__max_depth = 0
+        self.__cache_build_seconds = {}
+
+    def get_lines(self):
+        """Returns the number of parsed lines
+        :rtype: int
+        """
+        return self.__lines
+
+    def get_seconds(self):
+        """Returns the total time spent on parsing
+        :rtype: float
+        """
+        return self.__seconds
+
+    def get_lines_per_second(self):
+        """:rtype: float"""
+        if not self.__seconds:
+            return 0.0
+        return self.__lines / self.__seconds
+
+    def get_decode_seconds(self):
+        """Returns the time spent on decoding lines from bytes
+        :rtype: float
+        """
+        return self.__decode_seconds
+
+    def get_tokenize_seconds(self):
+        """Returns the time spent on splitting lines into level, pointer, tag and value
+        :rtype: float
+        """
+        return self.__tokenize_seconds
+
+    def get_build_seconds(self):
+        """Returns the time spent on creating elements and adding them to the tree
+        :rtype: float
+        """
+        return self.__build_seconds
+
+    def get_tag_counts(self):
+        """Returns the number of parsed elements per tag
+        :rtype: Counter
+        """
+        return self.__tag_counts
+
+    def get_max_depth(self):
+        """Returns the highest level of any parsed element
+        :rtype: int
+        """
+        return self.__max_depth
+
+    def get_cache_build_seconds(self):
+        """Returns the time spent on the latest build of each cache, keyed by `CACHE_ELEMENT_LIST`
+        and `CACHE_ELEMENT_DICTIONARY`
+        :rtype: dict of float
+        """
+        return self.__cache_build_seconds
+
+    def to_dict(self):
+        """:rtype: dict"""
+        return {
+            "lines": self.__lines,
+            "seconds": self.__seconds,
+            "lines_per_second": self.get_lines_per_second(),
+            "decode_seconds": self.__decode_seconds,
+            "tokenize_seconds": self.__tokenize_seconds,
+            "build_seconds": self.__build_seconds,
+            "tag_counts": dict(self.__tag_counts),
+            "max_depth": self.__max_depth,
+            "cache_build_seconds": dict(self.__cache_build_seconds),
+        }
+
+    # Methods called by the parser
+
+    def get_element_hook(self):
+        """Returns the callback called with the line number and element of every parsed line, `None` if not set
+        :rtype: callable
+        """
+        return self.__on_element
+
+    def record_parse(self, lines, seconds, decode_seconds, tokenize_seconds, build_seconds, tag_counts, max_depth):
+        """Adds the measurements of a finished parse and calls the `on_parse_finished` callback
+        :type lines: int
+        :type seconds: float
+        :type decode_seconds: float
+        :type tokenize_seconds: float
+        :type build_seconds: float
+        :type tag_counts: Counter
+        :type max_depth: int
+        """
+        self.__lines += lines
+        self.__seconds += seconds
+        self.__decode_seconds += decode_seconds
+        self.__tokenize_seconds += tokenize_seconds
+        self.__build_seconds += build_seconds
+        self.__tag_counts.update(tag_counts)
+        self.__max_depth = max(self.__max_depth, max_depth)
+        if self.__on_parse_finished is not None:
+            self.__on_parse_finished(self)
+
+    def record_cache_build(self, name, seconds):
+        """Stores the time spent on building a cache and calls the `on_cache_built` callback
+        :type name: str
+        :type seconds: float
+        """
+        self.__cache_build_seconds[name] = seconds
+        if self.__on_cache_built is not None:
+            self.__on_cache_built(name, seconds)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Streaming export and import of logical records as [JSON Lines](https://jsonlines.org/).
+
+Each line holds one logical record as a nested object:
+
+```json
+{"pointer": "@I1@", "tag": "INDI", "children": [{"tag": "NAME", "value": "Max /Mustermann/"}]}
+```
+
+`pointer`, `value` and `children` are left out when they are empty. `crlf` holds the line ending of an
+element, left out if it is the same as the one of its parent element or, for a record, `"\n"`.
+
+Exporting and importing work record by record, so combined with `gedcom.parser.Parser.iter_records()`
+a GEDCOM file gets converted in constant memory:
+
+```python
+from gedcom.parser import Parser
+import gedcom.jsonl
+
+with open(gedcom_file_path, 'rb') as gedcom_stream, open(jsonl_file_path, 'w') as jsonl_stream:
+    gedcom.jsonl.write_jsonl(Parser().iter_records(gedcom_stream), jsonl_stream)
+```
+
+The flattened schema written with `flatten=True` contains one object per individual and cannot be imported.
+"""
+
+import json
+from gedcom.element.element import get_element_class
+from gedcom.element.individual import IndividualElement
+import gedcom.tags
+
+
+def element_to_dict(element, crlf="\n"):
+    """Returns an element and all of its sub-elements as nested `dict`
+
+    The line ending is only included if it differs from `crlf`, the one of the parent element.
+
+    :type element: Element
+    :type crlf: str
+    :rtype: dict
+    """
+    data = {}
+    if element.get_pointer():
+        data["pointer"] = element.get_pointer()
+    data["tag"] = element.get_tag()
+    if element.get_value():
+        data["value"] = element.get_value()
+    if element.get_crlf() != crlf:
+        data["crlf"] = element.get_crlf()
+    if element.get_child_elements():
+        data["children"] = [element_to_dict(child, element.get_crlf()) for child in element.get_child_elements()]
+    return data
+
+
+def individual_to_flat_dict(individual):
+    """Returns the most relevant data of an individual as flat `dict`
+    :type individual: IndividualElement
+    :rtype: dict
+    """
+    given_name, surname = individual.get_name()
+    birth_date, birth_place, birth_sources = individual.get_birth_data()
+    death_date, death_place, death_sources = individual.get_death_data()
+
+    families_as_child = []
+    families_as_spouse = []
+    for child in individual.get_child_elements():
+        if child.get_tag() == gedcom.tags.GEDCOM_TAG_FAMILY_CHILD:
+            families_as_child.append(child.get_value())
+        elif child.get_tag() == gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE:
+            families_as_spouse.append(child.get_value())
+
+    return {
+        "pointer": individual.get_pointer(),
+        "given_name": given_name,
+        "surname": surname,
+        "gender": individual.get_gender(),
+        "birth_date": birth_date,
+        "birth_place": birth_place,
+        "death_date": death_date,
+        "death_place": death_place,
+        "occupation": individual.get_occupation(),
+        "families_as_child": families_as_child,
+        "families_as_spouse": families_as_spouse,
+    }
+
+
+def dict_to_element(data, level=0, crlf="\n"):
+    """Returns an element and all of its sub-elements built from a nested `dict`
+
+    `crlf` is the line ending used unless the `dict` holds one.
+
+    :type data: dict
+    :type level: int
+    :type crlf: str
+    :rtype: Element
+    """
+    tag = data["tag"]
+    pointer = data.get("pointer", "")
+    value = data.get("value", "")
+    crlf = data.get("crlf", crlf)
+
+    element = get_element_class(tag)(level, pointer, tag, value, crlf, multi_line=False)
+
+    for child_data in data.get("children", ()):
+        element.add_child_element(dict_to_element(child_data, level + 1, crlf))
+
+    return element
+
+
+def iter_jsonl(records, flatten=False):
+    """Yields one JSON encoded line, including the new line at the end, per logical record
+
+    With `flatten` set to `True` only individuals are exported, using the flattened schema
+    of `gedcom.jsonl.individual_to_flat_dict()`.
+
+    :type records: iterable of Element
+    :type flatten: bool
+    :rtype: generator of str
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    for record in records:
+        if not flatten:
+            yield encoder.encode(element_to_dict(record)) + "\n"
+        elif isinstance(record, IndividualElement):
+            yield encoder.encode(individual_to_flat_dict(record)) + "\n"
+
+
+def write_jsonl(records, output, flatten=False):
+    """Writes logical records as JSON Lines to an open text file
+    :type records: iterable of Element
+    :type output: file
+    :type flatten: bool
+    """
+    for line in iter_jsonl(records, flatten):
+        output.write(line)
+
+
+def read_jsonl(jsonl_stream):
+    """Yields logical records read from a stream, or an array of lines, of JSON Lines in the nested schema
+
+    Empty lines are skipped.
+
+    :type jsonl_stream: a file stream, or str array of lines
+    :rtype: generator of Element
+    """
+    decoder = json.JSONDecoder()
+    for line in jsonl_stream:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8-sig')
+        line = line.strip()
+        if line:
+            yield dict_to_element(decoder.decode(line))
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Kinship and inbreeding coefficients of individuals.
+
+The kinship coefficient of two individuals is the probability that alleles picked at random from
+each of them at the same locus are identical by descent. The inbreeding coefficient of an
+individual is the kinship coefficient of its parents. Individuals are ordered topologically along
+their `FAMC` links, parents first, and founders without known parents are assumed unrelated.
+
+Coefficients follow the sparse method of Meuwissen and Luo (1992): the relationship matrix is
+`A = L D L'`, where row `i` of `L` holds the contribution of every ancestor to individual `i`. Such a
+row is found by tracing the ancestors of `i` only, so neither `L` nor `A` is ever stored and the
+work per individual depends on the size of its pedigree, not on the size of the tree:
+
+```python
+from gedcom.parser import Parser
+import gedcom.kinship
+
+parser = Parser()
+parser.parse_file(file_path)
+
+calculator = gedcom.kinship.KinshipCalculator(parser)
+for individual, coefficient in calculator.get_inbreeding_coefficients():
+    if coefficient > 0:
+        print(individual.get_pointer(), coefficient)
+
+element_dictionary = parser.get_element_dictionary()
+calculator.get_kinship(element_dictionary["@I1@"], element_dictionary["@I2@"])
+```
+
+`gedcom.kinship.KinshipCalculator.get_kinship_matrix()` returns the coefficients of all pairs of
+a group of individuals. If NumPy is installed (`pip install python-gedcom[numpy]`) and the pedigree of
+the group is small enough, the matrix is filled with vectorized row operations over that pedigree.
+
+As with `gedcom.parser.Parser.get_parents()` the parent type `"NAT"` only follows natural parents.
+With several parent families the first father and mother found are used.
+"""
+
+from heapq import heappop, heappush
+from gedcom.ahnentafel import PARENT_TYPE_ALL, AhnentafelNumberer, AncestorLoopError
+from gedcom.element.individual import IndividualElement
+
+# Largest number of individuals within the pedigree of a group for which the kinship matrix of the
+# whole pedigree is held in memory, 4000 individuals taking 128 MB
+MAX_DENSE_PEDIGREE_SIZE = 4000
+
+
+def _import_numpy():
+    """Returns the `numpy` module, `None` if not installed"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class KinshipCalculator(object):
+    """Kinship and inbreeding coefficients of all individuals of a parser"""
+
+    def __init__(self, parser, parent_type=PARENT_TYPE_ALL):
+        numberer = AhnentafelNumberer(parser, parent_type)
+        individuals = [record for record in parser.get_root_child_elements() if isinstance(record, IndividualElement)]
+
+        parents = {}
+        for individual in individuals:
+            fathers, mothers = numberer.get_parents(individual)
+            parents[id(individual)] = (fathers[0] if fathers else None, mothers[0] if mothers else None)
+
+        # Index 0 stands for an unknown parent, individuals get indices from 1 in topological order
+        self.__individuals = [None]
+        self.__indices = {}
+        for individual in individuals:
+            if id(individual) in self.__indices:
+                continue
+            stack = [(individual, False)]
+            on_stack = set()
+            while stack:
+                current, parents_added = stack.pop()
+                if id(current) in self.__indices:
+                    continue
+                if parents_added:
+                    on_stack.discard(id(current))
+                    self.__indices[id(current)] = len(self.__individuals)
+                    self.__individuals.append(current)
+                    continue
+                if id(current) in on_stack:
+                    raise AncestorLoopError("Individual %s is listed among its own ancestors" % current.get_pointer())
+                on_stack.add(id(current))
+                stack.append((current, True))
+                for parent in parents.get(id(current), (None, None)):
+                    if parent is not None and id(parent) not in self.__indices:
+                        if id(parent) in on_stack:
+                            raise AncestorLoopError(
+                                "Individual %s is listed among its own ancestors" % parent.get_pointer()
+                            )
+                        stack.append((parent, False))
+
+        self.__fathers = [0]
+        self.__mothers = [0]
+        for individual in self.__individuals[1:]:
+            father, mother = parents.get(id(individual), (None, None))
+            self.__fathers.append(self.__indices[id(father)] if father is not None else 0)
+            self.__mothers.append(self.__indices[id(mother)] if mother is not None else 0)
+
+        self.__inbreeding = None
+        self.__variances = None
+
+    def get_order(self):
+        """Returns all individuals in topological order, parents before their children
+        :rtype: list of IndividualElement
+        """
+        return self.__individuals[1:]
+
+    def __get_index(self, individual):
+        """:rtype: int"""
+        index = self.__indices.get(id(individual))
+        if index is None:
+            raise ValueError("Individual %s is not part of the parsed data" % individual.get_pointer())
+        return index
+
+    def __trace(self, index):
+        """Returns row `index` of `L`, the contributions of the individual and its ancestors by index
+        :rtype: dict of float
+        """
+        fathers = self.__fathers
+        mothers = self.__mothers
+        row = {index: 1.0}
+        heap = [-index]
+        while heap:
+            current = -heappop(heap)
+            contribution = row[current] * 0.5
+            for parent in (fathers[current], mothers[current]):
+                if parent:
+                    if parent in row:
+                        row[parent] += contribution
+                    else:
+                        row[parent] = contribution
+                        heappush(heap, -parent)
+        return row
+
+    def __compute_inbreeding(self):
+        """Computes the inbreeding coefficients and the Mendelian sampling variances `D` of all individuals"""
+        fathers = self.__fathers
+        mothers = self.__mothers
+        # The inbreeding coefficient of an unknown parent is taken as -1 for the variances
+        inbreeding = [-1.0]
+        variances = [0.0]
+        self.__inbreeding = inbreeding
+        self.__variances = variances
+        family_inbreeding = {}
+
+        for index in range(1, len(self.__individuals)):
+            father = fathers[index]
+            mother = mothers[index]
+            variances.append(0.5 - 0.25 * (inbreeding[father] + inbreeding[mother]))
+            if not father or not mother:
+                inbreeding.append(0.0)
+                continue
+            coefficient = family_inbreeding.get((father, mother))
+            if coefficient is None:
+                row = self.__trace(index)
+                coefficient = sum(value * value * variances[ancestor] for ancestor, value in row.items()) - 1.0
+                family_inbreeding[(father, mother)] = coefficient
+            inbreeding.append(coefficient)
+
+    def __get_variances(self):
+        """:rtype: list of float"""
+        if self.__variances is None:
+            self.__compute_inbreeding()
+        return self.__variances
+
+    def get_inbreeding(self, individual):
+        """Returns the inbreeding coefficient of an individual
+        :type individual: IndividualElement
+        :rtype: float
+        """
+        index = self.__get_index(individual)
+        self.__get_variances()
+        return max(self.__inbreeding[index], 0.0)
+
+    def get_inbreeding_coefficients(self):
+        """Returns tuples (`IndividualElement` individual, `float` coefficient) of all individuals in topological order
+        :rtype: list of tuple
+        """
+        self.__get_variances()
+        return [(individual, max(self.__inbreeding[index], 0.0))
+                for index, individual in enumerate(self.__individuals) if index]
+
+    def get_kinship(self, first, second):
+        """Returns the kinship coefficient of two individuals, `0` for unrelated individuals and `0.5 * (1 + F)`
+        for an individual with itself, `F` being its inbreeding coefficient
+        :type first: IndividualElement
+        :type second: IndividualElement
+        :rtype: float
+        """
+        return self.get_kinships([(first, second)])[0]
+
+    def get_kinships(self, pairs):
+        """Returns the kinship coefficients of many pairs of individuals, tracing each individual only once
+        :type pairs: list of tuple
+        :rtype: list of float
+        """
+        self.__get_variances()
+        rows = {}
+        kinships = []
+        for first, second in pairs:
+            first_index = self.__get_index(first)
+            second_index = self.__get_index(second)
+            for index in (first_index, second_index):
+                if index not in rows:
+                    rows[index] = self.__trace(index)
+            kinships.append(self.__get_kinship(rows[first_index], rows[second_index]))
+        return kinships
+
+    def __get_kinship(self, first_row, second_row):
+        """Returns the kinship coefficient of two individuals from their rows of `L`
+        :type first_row: dict of float
+        :type second_row: dict of float
+        :rtype: float
+        """
+        variances = self.__variances
+        if len(first_row) > len(second_row):
+            first_row, second_row = second_row, first_row
+        relationship = sum(value * second_row[ancestor] * variances[ancestor]
+                           for ancestor, value in first_row.items() if ancestor in second_row)
+        return relationship / 2
+
+    def get_kinship_matrix(self, individuals, use_numpy=None, max_dense_size=MAX_DENSE_PEDIGREE_SIZE):
+        """Returns the kinship coefficients of all pairs of the given individuals as matrix
+
+        With NumPy installed, unless `use_numpy` is `False`, the matrix is a `numpy.ndarray`, otherwise
+        a list of lists. `use_numpy` set to `True` raises an `ImportError` without NumPy.
+
+        Coefficients are computed from the traced ancestors of each pair. Only with NumPy and at most
+        `max_dense_size` individuals within the pedigree of the group, the kinship matrix of the whole
+        pedigree is filled at once instead.
+
+        :type individuals: list of IndividualElement
+        :type use_numpy: bool
+        :type max_dense_size: int
+        :rtype: list of list of float
+        """
+        numpy = _import_numpy() if use_numpy is not False else None
+        if use_numpy and numpy is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+
+        self.__get_variances()
+        indices = [self.__get_index(individual) for individual in individuals]
+        rows = {}
+        for index in indices:
+            if index not in rows:
+                rows[index] = self.__trace(index)
+
+        if numpy is not None:
+            pedigree = set()
+            for row in rows.values():
+                pedigree.update(row)
+            if len(pedigree) <= max_dense_size:
+                return self.__get_dense_kinship_matrix(numpy, indices, sorted(pedigree))
+
+        matrix = [[0.0] * len(indices) for index in indices]
+        for row_number, first_index in enumerate(indices):
+            for column_number in range(row_number, len(indices)):
+                kinship = self.__get_kinship(rows[first_index], rows[indices[column_number]])
+                matrix[row_number][column_number] = matrix[column_number][row_number] = kinship
+        return numpy.array(matrix) if numpy is not None else matrix
+
+    def __get_dense_kinship_matrix(self, numpy, indices, pedigree):
+        """Returns the kinship matrix of the individuals at the given indices by the tabular method over
+        their pedigree, given as sorted indices
+        :type indices: list of int
+        :type pedigree: list of int
+        :rtype: numpy.ndarray
+        """
+        positions = {index: position for position, index in enumerate(pedigree)}
+
+        kinships = numpy.zeros((len(pedigree), len(pedigree)))
+        for position, index in enumerate(pedigree):
+            father = positions.get(self.__fathers[index])
+            mother = positions.get(self.__mothers[index])
+            if father is not None:
+                kinships[position, :position] += 0.5 * kinships[father, :position]
+            if mother is not None:
+                kinships[position, :position] += 0.5 * kinships[mother, :position]
+            kinships[:position, position] = kinships[position, :position]
+            kinships[position, position] = 0.5 * (1.0 + (kinships[father, mother]
+                                                         if father is not None and mother is not None else 0.0))
+
+        selection = [positions[index] for index in indices]
+        return kinships[numpy.ix_(selection, selection)]
+
+
+def compute_inbreeding_coefficients(parser, parent_type=PARENT_TYPE_ALL):
+    """Returns tuples (`IndividualElement` individual, `float` coefficient) of all individuals in topological order
+    :type parser: Parser
+    :type parent_type: str
+    :rtype: list of tuple
+    """
+    return KinshipCalculator(parser, parent_type).get_inbreeding_coefficients()
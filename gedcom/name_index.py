@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Index of the names of all individuals for looking them up by spelling variants.
+
+Given names and surnames are indexed in their folded form, see `gedcom.phonetic.fold()`, and
+keyed by their Soundex, Daitch-Mokotoff and Metaphone codes. The index is built once from the
+names returned by `gedcom.element.individual.IndividualElement.get_all_names()`, so every lookup
+only touches the distinct names instead of every individual. It is cached by
+`gedcom.parser.Parser.get_name_index()`:
+
+```python
+from gedcom.parser import Parser
+import gedcom.name_index
+
+parser = Parser()
+parser.parse_file(file_path)
+name_index = parser.get_name_index()
+
+name_index.find(surname="Meier", method=gedcom.name_index.MATCH_DAITCH_MOKOTOFF)
+name_index.find(surname="Schroder", given_name="Anna", method=gedcom.name_index.MATCH_EXACT)
+name_index.find(surname="Müllr", method=gedcom.name_index.MATCH_FUZZY, max_distance=1)
+```
+
+Fuzzy lookups find names within an edit distance, see `gedcom.phonetic.levenshtein()`. Only names
+sharing enough trigrams with the searched one get compared, using an index of the trigrams of all
+distinct names that is built on the first fuzzy lookup.
+"""
+
+from gedcom.element.individual import IndividualElement
+from gedcom.phonetic import daitch_mokotoff, fold, levenshtein, metaphone, soundex
+
+MATCH_EXACT = "exact"
+MATCH_SOUNDEX = "soundex"
+MATCH_DAITCH_MOKOTOFF = "daitch_mokotoff"
+MATCH_METAPHONE = "metaphone"
+MATCH_FUZZY = "fuzzy"
+
+PHONETIC_ALGORITHMS = {
+    MATCH_SOUNDEX: lambda name: [soundex(name)],
+    MATCH_DAITCH_MOKOTOFF: daitch_mokotoff,
+    MATCH_METAPHONE: lambda name: [metaphone(name)],
+}
+"""Functions returning the list of phonetic codes of a name, by match method"""
+
+DEFAULT_MAX_DISTANCE = 2
+
+
+class _NamePartIndex(object):
+    """Index of either the given names or the surnames"""
+
+    def __init__(self):
+        self.__postings = {}
+        self.__codes = None
+        self.__trigrams = None
+
+    def add(self, name, index):
+        """Adds a folded name of the individual at the given index
+        :type name: str
+        :type index: int
+        """
+        postings = self.__postings.get(name)
+        if postings is None:
+            self.__postings[name] = [index]
+        elif postings[-1] != index:
+            postings.append(index)
+
+    def build_codes(self):
+        """Keys all distinct names by their phonetic codes"""
+        self.__codes = {method: {} for method in PHONETIC_ALGORITHMS}
+        for name in self.__postings:
+            for method, algorithm in PHONETIC_ALGORITHMS.items():
+                codes = self.__codes[method]
+                for code in algorithm(name):
+                    if code:
+                        codes.setdefault(code, []).append(name)
+
+    def build_trigrams(self):
+        """Lists all distinct names by their trigrams for fuzzy lookups"""
+        self.__trigrams = self.__build_trigrams()
+
+    def get_names(self):
+        """:rtype: list of str"""
+        return list(self.__postings)
+
+    def find_similar_names(self, name, max_distance):
+        """Returns the indexed names within the edit distance of a folded name as tuples (`str` name, `int` distance)
+        :type name: str
+        :type max_distance: int
+        :rtype: list of tuple
+        """
+        if self.__trigrams is None:
+            self.__trigrams = self.__build_trigrams()
+
+        # Every edit changes at most three trigrams, so a name within the edit distance has to share the rest
+        trigrams = _get_trigrams(name)
+        minimum_shared_trigrams = len(trigrams) - 3 * max_distance
+        if minimum_shared_trigrams > 0:
+            shared_trigrams = {}
+            for trigram in trigrams:
+                for indexed_name in self.__trigrams.get(trigram, ()):
+                    shared_trigrams[indexed_name] = shared_trigrams.get(indexed_name, 0) + 1
+            candidates = [indexed_name for indexed_name, count in shared_trigrams.items()
+                          if count >= minimum_shared_trigrams]
+        else:
+            candidates = self.__postings
+
+        similar_names = []
+        for candidate in candidates:
+            distance = levenshtein(name, candidate, max_distance)
+            if distance <= max_distance:
+                similar_names.append((candidate, distance))
+
+        similar_names.sort(key=lambda similar_name: (similar_name[1], similar_name[0]))
+        return similar_names
+
+    def __build_trigrams(self):
+        """Returns the names listed by each of their trigrams
+        :rtype: dict of list
+        """
+        trigrams = {}
+        for name in self.__postings:
+            for trigram in _get_trigrams(name):
+                trigrams.setdefault(trigram, []).append(name)
+        return trigrams
+
+    def find_names(self, name, method, max_distance):
+        """Returns the indexed names matching a name
+        :type name: str
+        :type method: str
+        :type max_distance: int
+        :rtype: list of str
+        """
+        name = fold(name)
+        if method == MATCH_EXACT:
+            return [name] if name in self.__postings else []
+        if method == MATCH_FUZZY:
+            return [similar_name for similar_name, distance in self.find_similar_names(name, max_distance)]
+        if method not in PHONETIC_ALGORITHMS:
+            raise ValueError("Unknown match method %r" % method)
+
+        codes = self.__codes[method]
+        names = []
+        for code in PHONETIC_ALGORITHMS[method](name):
+            for indexed_name in codes.get(code, ()):
+                if indexed_name not in names:
+                    names.append(indexed_name)
+        return names
+
+    def find_indices(self, name, method, max_distance):
+        """Returns the indices of the individuals with a name matching the given one
+        :type name: str
+        :type method: str
+        :type max_distance: int
+        :rtype: set of int
+        """
+        indices = set()
+        for indexed_name in self.find_names(name, method, max_distance):
+            indices.update(self.__postings[indexed_name])
+        return indices
+
+
+def _get_trigrams(name):
+    """Returns the distinct trigrams of a name padded with two spaces on either side
+    :type name: str
+    :rtype: set of str
+    """
+    padded_name = "  %s  " % name
+    return {padded_name[position:position + 3] for position in range(len(padded_name) - 2)}
+
+
+def _split_name(name):
+    """Splits the value of a `NAME` element into its folded given names and surname
+    :type name: str
+    :rtype: tuple
+    """
+    parts = name.split('/')
+    given_names = fold(parts[0]).split()
+    surname = fold(parts[1]) if len(parts) > 1 else ""
+    return given_names, surname
+
+
+class NameIndex(object):
+    """Index of the given names and surnames of individuals, see `gedcom.name_index.build_name_index()`"""
+
+    def __init__(self):
+        self.__individuals = []
+        self.__given_names = _NamePartIndex()
+        self.__surnames = _NamePartIndex()
+        self.__split_names = {}
+
+    def add_individual(self, individual):
+        """Adds all names of an individual, use `gedcom.name_index.build_name_index()` to add many at once
+        :type individual: IndividualElement
+        """
+        index = len(self.__individuals)
+        self.__individuals.append(individual)
+
+        names = []
+        for name in individual.get_all_names():
+            if name:
+                split_name = self.__split_names.get(name)
+                if split_name is None:
+                    split_name = self.__split_names[name] = _split_name(name)
+                names.append(split_name)
+        if not names:
+            given_name, surname = individual.get_name()
+            names = [(fold(given_name).split(), fold(surname))]
+
+        for given_names, surname in names:
+            for given_name in given_names:
+                self.__given_names.add(given_name, index)
+            if surname:
+                self.__surnames.add(surname, index)
+
+    def build_codes(self):
+        """Keys all names added so far by their phonetic codes, needs to be called again after adding individuals"""
+        self.__given_names.build_codes()
+        self.__surnames.build_codes()
+        self.__split_names = {}
+
+    def build_trigrams(self):
+        """Builds the trigrams of fuzzy lookups right away instead of on the first fuzzy lookup"""
+        self.__given_names.build_trigrams()
+        self.__surnames.build_trigrams()
+
+    def get_individuals(self):
+        """:rtype: list of IndividualElement"""
+        return self.__individuals
+
+    def get_surnames(self):
+        """Returns all distinct surnames in their folded form
+        :rtype: list of str
+        """
+        return self.__surnames.get_names()
+
+    def get_given_names(self):
+        """Returns all distinct given names in their folded form
+        :rtype: list of str
+        """
+        return self.__given_names.get_names()
+
+    def find_similar_surnames(self, surname, max_distance=DEFAULT_MAX_DISTANCE):
+        """Returns the folded surnames within an edit distance as tuples (`str` surname, `int` distance),
+        closest first
+        :type surname: str
+        :type max_distance: int
+        :rtype: list of tuple
+        """
+        return self.__surnames.find_similar_names(fold(surname), max_distance)
+
+    def find_similar_given_names(self, given_name, max_distance=DEFAULT_MAX_DISTANCE):
+        """Returns the folded given names within an edit distance as tuples (`str` given name, `int` distance),
+        closest first
+        :type given_name: str
+        :type max_distance: int
+        :rtype: list of tuple
+        """
+        return self.__given_names.find_similar_names(fold(given_name), max_distance)
+
+    def find(self, surname=None, given_name=None, method=MATCH_EXACT, max_distance=DEFAULT_MAX_DISTANCE):
+        """Returns the individuals with a name matching the given surname and given names, in the order they were added
+
+        `method` is one of `MATCH_EXACT`, `MATCH_SOUNDEX`, `MATCH_DAITCH_MOKOTOFF`, `MATCH_METAPHONE`
+        and `MATCH_FUZZY`, the latter matching names within `max_distance` edits. With multiple given
+        names each of them has to match one of the given names of an individual.
+
+        :type surname: str
+        :type given_name: str
+        :type method: str
+        :type max_distance: int
+        :rtype: list of IndividualElement
+        """
+        if method != MATCH_EXACT and method != MATCH_FUZZY and method not in PHONETIC_ALGORITHMS:
+            raise ValueError("Unknown match method %r" % method)
+
+        queries = []
+        if surname:
+            queries.append((self.__surnames, surname))
+        if given_name:
+            queries.extend((self.__given_names, name) for name in fold(given_name).split())
+        if not queries:
+            raise ValueError("A surname or given name is required")
+
+        indices = None
+        for name_part_index, name in queries:
+            matching_indices = name_part_index.find_indices(name, method, max_distance)
+            indices = matching_indices if indices is None else indices & matching_indices
+            if not indices:
+                return []
+
+        return [self.__individuals[index] for index in sorted(indices)]
+
+
+def build_name_index(records):
+    """Builds the name index of all individual records
+    :type records: list of Element
+    :rtype: NameIndex
+    """
+    name_index = NameIndex()
+    for record in records:
+        if isinstance(record, IndividualElement):
+            name_index.add_individual(record)
+    name_index.build_codes()
+    return name_index
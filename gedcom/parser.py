@@ -32,12 +32,12 @@ which can in return be manipulated.
 
 import re as regex
 from sys import version_info
-from gedcom.element.element import Element
+from time import perf_counter
+from gedcom.element.element import Element, get_element_classes
 from gedcom.element.family import FamilyElement, NotAnActualFamilyError
-from gedcom.element.file import FileElement
 from gedcom.element.individual import IndividualElement, NotAnActualIndividualError
-from gedcom.element.object import ObjectElement
 from gedcom.element.root import RootElement
+from gedcom.instrumentation import CACHE_ELEMENT_DICTIONARY, CACHE_ELEMENT_LIST, ParseStatistics
 import gedcom.tags
 
 FAMILY_MEMBERS_TYPE_ALL = "ALL"
@@ -46,11 +46,53 @@ FAMILY_MEMBERS_TYPE_HUSBAND = gedcom.tags.GEDCOM_TAG_HUSBAND
 FAMILY_MEMBERS_TYPE_PARENTS = "PARENTS"
 FAMILY_MEMBERS_TYPE_WIFE = gedcom.tags.GEDCOM_TAG_WIFE
 
+LINK_TAGS = frozenset([
+    gedcom.tags.GEDCOM_TAG_ASSOCIATES,
+    gedcom.tags.GEDCOM_TAG_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE,
+    gedcom.tags.GEDCOM_TAG_HUSBAND,
+    gedcom.tags.GEDCOM_TAG_NOTE,
+    gedcom.tags.GEDCOM_TAG_OBJECT,
+    gedcom.tags.GEDCOM_TAG_REPOSITORY,
+    gedcom.tags.GEDCOM_TAG_SOURCE,
+    gedcom.tags.GEDCOM_TAG_SUBMITTER,
+    gedcom.tags.GEDCOM_TAG_WIFE,
+])
+"""Tags of elements whose pointer values get linked to their records by `gedcom.parser.Parser.resolve_links()`"""
+
+# Level must start with non-negative int, no leading zeros.
+LEVEL_REGEX = '^(0|[1-9]+[0-9]*) '
+
+# Pointer optional, if it exists it must be flanked by `@`
+POINTER_REGEX = '(@[^@]+@ |)'
+
+# Tag must be an alphanumeric string
+TAG_REGEX = '([A-Za-z0-9_]+)'
+
+# Value optional, consists of anything after a space to end of line
+VALUE_REGEX = '( [^\n\r]*|)'
+
+# End of line defined by `\n` or `\r`
+END_OF_LINE_REGEX = '([\r\n]{1,2})'
+
+LINE_PATTERN = regex.compile(LEVEL_REGEX + POINTER_REGEX + TAG_REGEX + VALUE_REGEX + END_OF_LINE_REGEX)
+"""Grammar of a GEDCOM 5.5 line, matching the groups: level, pointer, tag, value and end of line"""
+
+LAST_LINE_PATTERN = regex.compile(LEVEL_REGEX + POINTER_REGEX + TAG_REGEX + VALUE_REGEX)
+"""Grammar of a GEDCOM 5.5 line without end of line, as the last line of a file might be"""
+
+CONTINUATION_LINE_PATTERN = regex.compile('([^\n\r]*|)' + END_OF_LINE_REGEX)
+
 
 class GedcomFormatViolationError(Exception):
     pass
 
 
+class FrozenParserError(Exception):
+    pass
+
+
 class Parser(object):
     """Parses and manipulates GEDCOM 5.5 format data
 
@@ -62,21 +104,43 @@ class Parser(object):
 
     * a `list` through `gedcom.parser.Parser.get_element_list()`
     * a `dict` through `gedcom.parser.Parser.get_element_dictionary()`
+
+    A read-only snapshot which can be shared between threads is returned by `gedcom.parser.Parser.freeze()`.
+
+    Parse and cache build times are recorded after calling `gedcom.parser.Parser.enable_instrumentation()`.
+
+    Elements are created with the class registered for their tag, see
+    `gedcom.element.element.register_element_class()`. Classes used by this parser only can be
+    given as `dict` keyed by tag through `element_classes`.
     """
 
-    def __init__(self):
+    def __init__(self, element_classes=None):
         self.__element_list = []
         self.__element_dictionary = {}
         self.__root_element = RootElement()
+        self.__frozen = False
+        self.__statistics = None
+        self.__element_classes = dict(element_classes) if element_classes else None
+        self.__citation_index = None
+        self.__name_index = None
+        self.__tag_index = None
+        self.__unresolved_links = None
 
     def invalidate_cache(self):
         """Empties the element list and dictionary to cause `gedcom.parser.Parser.get_element_list()`
         and `gedcom.parser.Parser.get_element_dictionary()` to return updated data.
 
         The update gets deferred until each of the methods actually gets called.
+        Frozen parsers keep their caches.
         """
+        if self.__frozen:
+            return
         self.__element_list = []
         self.__element_dictionary = {}
+        self.__citation_index = None
+        self.__name_index = None
+        self.__tag_index = None
+        self.__unresolved_links = None
 
     def get_element_list(self):
         """Returns a list containing all elements from within the GEDCOM file
@@ -92,9 +156,12 @@ class Parser(object):
 
         :rtype: list of Element
         """
-        if not self.__element_list:
+        if not self.__element_list and not self.__frozen:
+            start = perf_counter() if self.__statistics is not None else None
             for element in self.get_root_child_elements():
                 self.__build_list(element, self.__element_list)
+            if start is not None:
+                self.__statistics.record_cache_build(CACHE_ELEMENT_LIST, perf_counter() - start)
         return self.__element_list
 
     def get_element_dictionary(self):
@@ -109,13 +176,184 @@ class Parser(object):
 
         :rtype: dict of Element
         """
-        if not self.__element_dictionary:
+        if not self.__element_dictionary and not self.__frozen:
+            start = perf_counter() if self.__statistics is not None else None
             self.__element_dictionary = {
                 element.get_pointer(): element for element in self.get_root_child_elements() if element.get_pointer()
             }
+            if start is not None:
+                self.__statistics.record_cache_build(CACHE_ELEMENT_DICTIONARY, perf_counter() - start)
 
         return self.__element_dictionary
 
+    def get_citation_index(self):
+        """Returns the index of all source citations, see `gedcom.citation.CitationIndex`
+
+        The index gets built in one pass over all elements and is cached like the element list.
+        If the database was modified, call `gedcom.parser.Parser.invalidate_cache()` once to let
+        this method return updated data.
+
+        :rtype: CitationIndex
+        """
+        if self.__citation_index is None:
+            from gedcom.citation import build_citation_index
+
+            self.__citation_index = build_citation_index(self.get_root_child_elements())
+
+        return self.__citation_index
+
+    def get_name_index(self):
+        """Returns the index of the names of all individuals, see `gedcom.name_index.NameIndex`
+
+        The index is cached like the element list. If the database was modified, call
+        `gedcom.parser.Parser.invalidate_cache()` once to let this method return updated data.
+
+        :rtype: NameIndex
+        """
+        if self.__name_index is None:
+            from gedcom.name_index import build_name_index
+
+            self.__name_index = build_name_index(self.get_root_child_elements())
+
+        return self.__name_index
+
+    def get_tag_index(self):
+        """Returns the records and elements grouped by tag, see `gedcom.query.TagIndex`
+
+        The index is cached like the element list and used by `gedcom.query`. If the database was
+        modified, call `gedcom.parser.Parser.invalidate_cache()` once to let this method return updated data.
+
+        :rtype: TagIndex
+        """
+        if self.__tag_index is None:
+            from gedcom.query import build_tag_index
+
+            self.__tag_index = build_tag_index(self)
+
+        return self.__tag_index
+
+    def resolve_links(self):
+        """Attaches the referenced record to every element with a pointer value and returns the elements
+        whose pointer references no record
+
+        Only elements with a tag listed in `gedcom.parser.LINK_TAGS` are linked, see
+        `gedcom.element.element.Element.get_linked_record()`. Afterwards methods like
+        `gedcom.parser.Parser.get_families()` follow the links instead of looking up pointers.
+        Links are dropped by `gedcom.parser.Parser.invalidate_cache()` and have to be resolved again
+        after modifying the database. Snapshots returned by `gedcom.parser.Parser.freeze()` are already
+        linked, resolving their links again raises a `FrozenParserError`.
+
+        :rtype: list of Element
+        """
+        self.__check_not_frozen()
+        element_dictionary = self.get_element_dictionary()
+        unresolved_links = []
+
+        for element in self.get_element_list():
+            if element.get_tag() in LINK_TAGS:
+                value = element.get_value()
+                if len(value) > 2 and value[0] == '@' and value[-1] == '@':
+                    record = element_dictionary.get(value)
+                    if record is None:
+                        unresolved_links.append(element)
+                    element.set_linked_record(record)
+
+        self.__unresolved_links = unresolved_links
+        return unresolved_links
+
+    def has_resolved_links(self):
+        """Checks if `gedcom.parser.Parser.resolve_links()` has been called since the last change
+        :rtype: bool
+        """
+        return self.__unresolved_links is not None
+
+    def get_unresolved_links(self):
+        """Returns the elements whose pointer value references no record, as found by
+        `gedcom.parser.Parser.resolve_links()`
+        :rtype: list of Element
+        """
+        if self.__unresolved_links is None:
+            return []
+        return self.__unresolved_links
+
+    def is_frozen(self):
+        """Checks if this parser is a read-only snapshot returned by `gedcom.parser.Parser.freeze()`
+        :rtype: bool
+        """
+        return self.__frozen
+
+    def freeze(self):
+        """Returns a read-only snapshot of the current GEDCOM data
+
+        The snapshot holds a frozen copy of all elements, see `gedcom.element.element.Element.freeze()`.
+        Its element list, dictionary, citation index, name index and tag index are built and its links
+        are resolved beforehand, the list and dictionary are returned as `tuple` and read-only mapping. Parsing into the snapshot raises a `FrozenParserError`, modifying one of its elements
+        raises a `gedcom.element.element.FrozenElementError`.
+
+        Since nothing gets built lazily anymore, the snapshot can be read by multiple threads at the
+        same time without locking. Changes made to this parser afterwards do not affect the snapshot.
+
+        :rtype: Parser
+        """
+        from types import MappingProxyType
+
+        root_element = RootElement()
+        for element in self.get_root_child_elements():
+            root_element.add_child_element(element.copy())
+
+        snapshot = Parser()
+        snapshot.__root_element = root_element
+        snapshot.__element_list = tuple(snapshot.get_element_list())
+        snapshot.__element_dictionary = MappingProxyType(snapshot.get_element_dictionary())
+        snapshot.get_citation_index()
+        snapshot.get_tag_index().build()
+        snapshot.get_name_index().build_trigrams()
+        snapshot.resolve_links()
+        root_element.freeze()
+        snapshot.__frozen = True
+
+        return snapshot
+
+    def enable_instrumentation(self, on_element=None, on_parse_finished=None, on_cache_built=None):
+        """Starts recording statistics of `gedcom.parser.Parser.parse()` and of cache builds
+
+        The optional callbacks get called with the line number and element of every parsed line,
+        with the statistics after each finished parse, and with the name and build time of each
+        built cache. Statistics of multiple parses add up.
+
+        :type on_element: callable
+        :type on_parse_finished: callable
+        :type on_cache_built: callable
+        :rtype: ParseStatistics
+        """
+        self.__statistics = ParseStatistics(on_element, on_parse_finished, on_cache_built)
+        return self.__statistics
+
+    def disable_instrumentation(self):
+        """Stops recording statistics, without any overhead left on parsing"""
+        self.__statistics = None
+
+    def get_statistics(self):
+        """Returns the statistics recorded since enabling instrumentation, `None` if disabled
+        :rtype: ParseStatistics
+        """
+        return self.__statistics
+
+    def __get_element_classes(self):
+        """Returns the element classes keyed by tag, including the classes given to this parser
+        :rtype: dict
+        """
+        if self.__element_classes is None:
+            return get_element_classes()
+        element_classes = dict(get_element_classes())
+        element_classes.update(self.__element_classes)
+        return element_classes
+
+    def __check_not_frozen(self):
+        """Raises a `FrozenParserError` if this parser is frozen"""
+        if self.__frozen:
+            raise FrozenParserError("Frozen parsers can not parse, load or link data")
+
     def get_root_element(self):
         """Returns a virtual root element containing all logical records as children
 
@@ -134,33 +372,218 @@ class Parser(object):
         """
         return self.get_root_element().get_child_elements()
 
-    def parse_file(self, file_path, strict=True):
+    def parse_file(self, file_path, strict=True, element_filter=None, record_tags=None):
         """Opens and parses a file, from the given file path, as GEDCOM 5.5 formatted data
         :type file_path: str
         :type strict: bool
+        :type element_filter: callable
+        :type record_tags: collection of str
         """
         with open(file_path, 'rb') as gedcom_stream:
-            self.parse(gedcom_stream, strict)
+            self.parse(gedcom_stream, strict, element_filter, record_tags)
 
-    def parse(self, gedcom_stream, strict=True):
+    def parse(self, gedcom_stream, strict=True, element_filter=None, record_tags=None):
         """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data
+
+        Only elements kept by `element_filter` are created, see `gedcom.projection`. Lines of dropped
+        elements are neither decoded nor checked against the GEDCOM format, and parse statistics are
+        not recorded for filtered parsing.
+
+        Only records with a tag within `record_tags` are read, if given, see
+        `gedcom.projection.iter_projected_lines()`. Line numbers of format violations then count the
+        lines of these records only.
+
         :type gedcom_stream: a file stream, or str array of lines with new line at the end
         :type strict: bool
+        :type element_filter: callable
+        :type record_tags: collection of str
         """
+        self.__check_not_frozen()
         self.invalidate_cache()
         self.__root_element = RootElement()
 
+        if record_tags is not None:
+            import gedcom.projection
+            gedcom_stream = gedcom.projection.iter_projected_lines(gedcom_stream, record_tags)
+
+        if element_filter is not None:
+            self.__parse_filtered(gedcom_stream, strict, element_filter)
+            return
+
+        if self.__statistics is not None:
+            self.__parse_instrumented(gedcom_stream, strict)
+            return
+
         line_number = 1
         last_element = self.get_root_element()
+        element_classes = self.__get_element_classes()
 
         for line in gedcom_stream:
-            last_element = self.__parse_line(line_number, line.decode('utf-8-sig'), last_element, strict)
+            last_element = self.__parse_line(line_number, line.decode('utf-8-sig'), last_element, strict,
+                                             element_classes)
             line_number += 1
 
+    def __parse_instrumented(self, gedcom_stream, strict):
+        """Same as `gedcom.parser.Parser.parse()`, measuring each step into the parser statistics
+        :type gedcom_stream: a file stream, or str array of lines with new line at the end
+        :type strict: bool
+        """
+        from collections import Counter
+
+        on_element = self.__statistics.get_element_hook()
+        decode_seconds = 0.0
+        tokenize_seconds = 0.0
+        build_seconds = 0.0
+        tag_counts = Counter()
+        max_depth = 0
+
+        line_number = 1
+        last_element = self.get_root_element()
+        element_classes = self.__get_element_classes()
+        start = perf_counter()
+
+        try:
+            for line in gedcom_stream:
+                decode_start = perf_counter()
+                line = line.decode('utf-8-sig')
+                tokenize_start = perf_counter()
+                level, pointer, tag, value, crlf = self.__tokenize_line(line_number, line, last_element, strict)
+                build_start = perf_counter()
+                last_element = self.__build_element(line_number, level, pointer, tag, value, crlf, last_element,
+                                                    element_classes)
+                build_end = perf_counter()
+
+                decode_seconds += tokenize_start - decode_start
+                tokenize_seconds += build_start - tokenize_start
+                build_seconds += build_end - build_start
+                tag_counts[tag] += 1
+                if level > max_depth:
+                    max_depth = level
+
+                if on_element is not None:
+                    on_element(line_number, last_element)
+                line_number += 1
+        finally:
+            self.__statistics.record_parse(line_number - 1, perf_counter() - start, decode_seconds,
+                                           tokenize_seconds, build_seconds, tag_counts, max_depth)
+
+    def __parse_filtered(self, gedcom_stream, strict, element_filter):
+        """Same as `gedcom.parser.Parser.parse()`, skipping the lines of elements dropped by `element_filter`
+        :type gedcom_stream: a file stream, or str array of lines with new line at the end
+        :type strict: bool
+        :type element_filter: callable
+        """
+        line_number = 0
+        last_element = self.get_root_element()
+        element_classes = self.__get_element_classes()
+        # Tags of the last tokenized element and its parent elements, indexed by level
+        path = []
+        skip_level = None
+
+        for line in gedcom_stream:
+            line_number += 1
+
+            if skip_level is not None:
+                # Within a dropped element only the level of each line is looked at
+                level = line.split(b' ', 1)[0]
+                if not level.isdigit() or int(level) > skip_level:
+                    continue
+                skip_level = None
+
+            level, pointer, tag, value, crlf = self.__tokenize_line(line_number, line.decode('utf-8-sig'),
+                                                                    last_element, strict)
+            if level <= len(path):
+                del path[level:]
+                path.append(tag)
+                if not element_filter(path[0], tuple(path)):
+                    skip_level = level
+                    continue
+
+            last_element = self.__build_element(line_number, level, pointer, tag, value, crlf, last_element,
+                                                element_classes)
+
+    async def parse_async(self, gedcom_stream, strict=True, lines_per_yield=1000):
+        """Parses an asynchronous stream of bytes as GEDCOM 5.5 formatted data
+
+        The stream may yield chunks of any size, like an `asyncio.StreamReader` or the body of an upload.
+        Lines are parsed as soon as they are complete and control is given back to the event loop
+        every `lines_per_yield` lines.
+
+        :type gedcom_stream: asynchronous iterable of bytes
+        :type strict: bool
+        :type lines_per_yield: int
+        """
+        from asyncio import sleep
+
+        self.__check_not_frozen()
+        self.invalidate_cache()
+        self.__root_element = RootElement()
+
+        line_number = 1
+        last_element = self.get_root_element()
+        element_classes = self.__get_element_classes()
+        remainder = b''
+
+        async for chunk in gedcom_stream:
+            lines = (remainder + chunk).split(b'\n')
+            remainder = lines.pop()
+
+            for line in lines:
+                last_element = self.__parse_line(line_number, (line + b'\n').decode('utf-8-sig'), last_element,
+                                                 strict, element_classes)
+                line_number += 1
+
+                if line_number % lines_per_yield == 0:
+                    await sleep(0)
+
+        if remainder:
+            self.__parse_line(line_number, remainder.decode('utf-8-sig'), last_element, strict, element_classes)
+
+    def iter_records(self, gedcom_stream, strict=True):
+        """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data and yields one logical record at a time
+
+        Unlike `gedcom.parser.Parser.parse()` the records are not added to the root element of this parser.
+        Each record gets yielded as soon as the line of the following record has been read, so only one
+        record is held in memory at a time.
+
+        :type gedcom_stream: a file stream, or str array of lines with new line at the end
+        :type strict: bool
+        :rtype: generator of Element
+        """
+        root_element = RootElement()
+        records = root_element.get_child_elements()
+
+        line_number = 1
+        last_element = root_element
+        element_classes = self.__get_element_classes()
+
+        for line in gedcom_stream:
+            last_element = self.__parse_line(line_number, line.decode('utf-8-sig'), last_element, strict,
+                                             element_classes)
+            line_number += 1
+
+            if len(records) > 1:
+                yield records.pop(0)
+
+        while records:
+            yield records.pop(0)
+
+    def load_sqlite(self, database_path):
+        """Loads GEDCOM data from a SQLite database written by `gedcom.parser.Parser.to_sqlite()`
+        :type database_path: str
+        """
+        import gedcom.sqlite
+
+        self.__check_not_frozen()
+        self.invalidate_cache()
+        self.__root_element = RootElement()
+
+        gedcom.sqlite.import_sqlite(database_path, self.get_root_element())
+
     # Private methods
 
     @staticmethod
-    def __parse_line(line_number, line, last_element, strict=True):
+    def __parse_line(line_number, line, last_element, strict, element_classes):
         """Parse a line from a GEDCOM 5.5 formatted document
 
         Each line should have the following (bracketed items optional):
@@ -170,28 +593,27 @@ class Parser(object):
         :type line: str
         :type last_element: Element
         :type strict: bool
+        :type element_classes: dict
 
         :rtype: Element
         """
+        level, pointer, tag, value, crlf = Parser.__tokenize_line(line_number, line, last_element, strict)
+        return Parser.__build_element(line_number, level, pointer, tag, value, crlf, last_element, element_classes)
 
-        # Level must start with non-negative int, no leading zeros.
-        level_regex = '^(0|[1-9]+[0-9]*) '
-
-        # Pointer optional, if it exists it must be flanked by `@`
-        pointer_regex = '(@[^@]+@ |)'
-
-        # Tag must be an alphanumeric string
-        tag_regex = '([A-Za-z0-9_]+)'
+    @staticmethod
+    def __tokenize_line(line_number, line, last_element, strict=True):
+        """Splits a line from a GEDCOM 5.5 formatted document into its parts
 
-        # Value optional, consists of anything after a space to end of line
-        value_regex = '( [^\n\r]*|)'
+        Returns a tuple: (`int` level, `str` pointer, `str` tag, `str` value, `str` crlf)
 
-        # End of line defined by `\n` or `\r`
-        end_of_line_regex = '([\r\n]{1,2})'
+        :type line_number: int
+        :type line: str
+        :type last_element: Element
+        :type strict: bool
 
-        # Complete regex
-        gedcom_line_regex = level_regex + pointer_regex + tag_regex + value_regex + end_of_line_regex
-        regex_match = regex.match(gedcom_line_regex, line)
+        :rtype: tuple
+        """
+        regex_match = LINE_PATTERN.match(line)
 
         if regex_match is None:
             if strict:
@@ -200,8 +622,7 @@ class Parser(object):
                 raise GedcomFormatViolationError(error_message)
             else:
                 # Quirk check - see if this is a line without a CRLF (which could be the last line)
-                last_line_regex = level_regex + pointer_regex + tag_regex + value_regex
-                regex_match = regex.match(last_line_regex, line)
+                regex_match = LAST_LINE_PATTERN.match(line)
                 if regex_match is not None:
                     line_parts = regex_match.groups()
 
@@ -214,9 +635,7 @@ class Parser(object):
                     # Quirk check - Sometimes a gedcom has a text field with a CR.
                     # This creates a line without the standard level and pointer.
                     # If this is detected then turn it into a CONC or CONT.
-                    line_regex = '([^\n\r]*|)'
-                    cont_line_regex = line_regex + end_of_line_regex
-                    regex_match = regex.match(cont_line_regex, line)
+                    regex_match = CONTINUATION_LINE_PATTERN.match(line)
                     line_parts = regex_match.groups()
                     level = last_element.get_level()
                     tag = last_element.get_tag()
@@ -236,6 +655,27 @@ class Parser(object):
             value = line_parts[3][1:]
             crlf = line_parts[4]
 
+        return level, pointer, tag, value, crlf
+
+    @staticmethod
+    def __build_element(line_number, level, pointer, tag, value, crlf, last_element, element_classes):
+        """Creates the element of a tokenized line and adds it to the tree of the last element
+
+        The class of the element is looked up by its tag within `element_classes`, see
+        `gedcom.element.element.get_element_classes()`.
+
+        :type line_number: int
+        :type level: int
+        :type pointer: str
+        :type tag: str
+        :type value: str
+        :type crlf: str
+        :type last_element: Element
+        :type element_classes: dict
+
+        :rtype: Element
+        """
+
         # Check level: should never be more than one higher than previous line.
         if level > last_element.get_level() + 1:
             error_message = ("Line %d of document violates GEDCOM format 5.5" % line_number
@@ -244,16 +684,7 @@ class Parser(object):
             raise GedcomFormatViolationError(error_message)
 
         # Create element. Store in list and dict, create children and parents.
-        if tag == gedcom.tags.GEDCOM_TAG_INDIVIDUAL:
-            element = IndividualElement(level, pointer, tag, value, crlf, multi_line=False)
-        elif tag == gedcom.tags.GEDCOM_TAG_FAMILY:
-            element = FamilyElement(level, pointer, tag, value, crlf, multi_line=False)
-        elif tag == gedcom.tags.GEDCOM_TAG_FILE:
-            element = FileElement(level, pointer, tag, value, crlf, multi_line=False)
-        elif tag == gedcom.tags.GEDCOM_TAG_OBJECT:
-            element = ObjectElement(level, pointer, tag, value, crlf, multi_line=False)
-        else:
-            element = Element(level, pointer, tag, value, crlf, multi_line=False)
+        element = element_classes.get(tag, Element)(level, pointer, tag, value, crlf, multi_line=False)
 
         # Start with last element as parent, back up if necessary.
         parent_element = last_element
@@ -377,12 +808,21 @@ class Parser(object):
             )
 
         families = []
+
+        if self.__unresolved_links is not None:
+            for child_element in individual.get_child_elements():
+                if child_element.get_tag() == family_type:
+                    family = child_element.get_linked_record()
+                    if isinstance(family, FamilyElement):
+                        families.append(family)
+            return families
+
         element_dictionary = self.get_element_dictionary()
 
         for child_element in individual.get_child_elements():
             is_family = (child_element.get_tag() == family_type
                          and child_element.get_value() in element_dictionary
-                         and element_dictionary[child_element.get_value()].is_family())
+                         and isinstance(element_dictionary[child_element.get_value()], FamilyElement))
             if is_family:
                 families.append(element_dictionary[child_element.get_value()])
 
@@ -492,7 +932,8 @@ class Parser(object):
             )
 
         family_members = []
-        element_dictionary = self.get_element_dictionary()
+        links_resolved = self.__unresolved_links is not None
+        element_dictionary = None if links_resolved else self.get_element_dictionary()
 
         for child_element in family.get_child_elements():
             # Default is ALL
@@ -510,7 +951,12 @@ class Parser(object):
             elif members_type == FAMILY_MEMBERS_TYPE_CHILDREN:
                 is_family = child_element.get_tag() == gedcom.tags.GEDCOM_TAG_CHILD
 
-            if is_family and child_element.get_value() in element_dictionary:
+            if not is_family:
+                continue
+            if links_resolved:
+                if child_element.get_linked_record() is not None:
+                    family_members.append(child_element.get_linked_record())
+            elif child_element.get_value() in element_dictionary:
                 family_members.append(element_dictionary[child_element.get_value()])
 
         return family_members
@@ -532,6 +978,19 @@ class Parser(object):
 
         return output
 
+    def to_sqlite(self, database_path, batch_size=10000):
+        """Writes all elements into a SQLite database, see `gedcom.sqlite` for the tables being created
+
+        Besides the elements themselves the database contains indexed tables of records, pointers,
+        individuals, families, events and family links. All rows are written within a single
+        transaction in batches of `batch_size` rows. Tables of a previous export are replaced.
+
+        :type database_path: str
+        :type batch_size: int
+        """
+        import gedcom.sqlite
+        gedcom.sqlite.export_sqlite(self.get_root_child_elements(), database_path, batch_size)
+
     def print_gedcom(self):
         """Write GEDCOM data to stdout"""
         from sys import stdout
@@ -543,3 +1002,34 @@ class Parser(object):
         :type recursive: bool
         """
         open_file.write(self.to_gedcom_string(recursive))
+
+    async def save_gedcom_async(self, sink, recursive=True, encoding=None, records_per_yield=100):
+        """Save GEDCOM data to an asynchronous sink, one logical record at a time
+
+        `sink.write()` may either be a coroutine function or a plain method like the one of
+        `asyncio.StreamWriter`. If the sink provides a `drain()` coroutine it is awaited after every
+        record to respect flow control, otherwise control is given back to the event loop every
+        `records_per_yield` records. Data is written as `str`, unless an `encoding` is given.
+
+        :type sink: asyncio.StreamWriter or any object with a `write()` method
+        :type recursive: bool
+        :type encoding: str
+        :type records_per_yield: int
+        """
+        from asyncio import sleep
+
+        drain = getattr(sink, 'drain', None)
+
+        for index, element in enumerate(self.get_root_child_elements(), 1):
+            data = element.to_gedcom_string(recursive)
+            if encoding is not None:
+                data = data.encode(encoding)
+
+            result = sink.write(data)
+            if hasattr(result, '__await__'):
+                await result
+
+            if drain is not None:
+                await drain()
+            elif index % records_per_yield == 0:
+                await sleep(0)
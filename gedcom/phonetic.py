@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Phonetic codes and normalized forms of names, used to find names spelled differently.
+
+```python
+import gedcom.phonetic
+
+gedcom.phonetic.soundex("Meyer") == gedcom.phonetic.soundex("Maier")  # True, both are M600
+gedcom.phonetic.daitch_mokotoff("Peters")  # ['734000', '739400']
+gedcom.phonetic.metaphone("Kathryn")  # 'K0RN'
+gedcom.phonetic.fold("Schröder")  # 'schroder'
+gedcom.phonetic.levenshtein("schroder", "schroeder")  # 1
+```
+"""
+
+import unicodedata
+
+SOUNDEX_CODES = {
+    letter: digit
+    for letters, digit in (("BFPV", "1"), ("CGJKQSXZ", "2"), ("DT", "3"), ("L", "4"), ("MN", "5"), ("R", "6"))
+    for letter in letters
+}
+"""Soundex digits of the consonants, all other letters are left out of the code"""
+
+VOWELS = "AEIOU"
+
+DAITCH_MOKOTOFF_CODES = {}
+"""Daitch-Mokotoff codes of letter sequences as list of alternatives, each being a tuple of the codes used
+at the start of a name, before a vowel and in any other position, with `None` for not coded"""
+
+for _sequences, _alternatives in (
+        ("AI AJ AY EI EJ EY OI OJ OY UI UJ UY", (("0", "1", None),)),
+        ("AU", (("0", "7", None),)),
+        ("A E I O U UE", (("0", None, None),)),
+        ("EU", (("1", "1", None),)),
+        ("IA IE IO IU", (("1", None, None),)),
+        ("Y", (("1", None, None),)),
+        ("B F FB P PF PH V W", (("7", "7", "7"),)),
+        ("CHS KS X", (("5", "54", "54"),)),
+        ("CH", (("5", "5", "5"), ("4", "4", "4"))),
+        ("CK", (("5", "5", "5"), ("45", "45", "45"))),
+        ("C", (("5", "5", "5"), ("4", "4", "4"))),
+        ("CS CSZ CZ CZS DRS DRZ DS DSH DSZ DZ DZH DZS SH SCH SZ S TCH TTCH TTSCH TRS TRZ TSCH TSH TS TTS TTSZ TC "
+         "TZ TTZ TZS TSZ ZH ZS ZSCH ZSH Z", (("4", "4", "4"),)),
+        ("D DT T TH", (("3", "3", "3"),)),
+        ("G K KH Q", (("5", "5", "5"),)),
+        ("H", (("5", "5", None),)),
+        ("J", (("1", "1", "1"), ("4", "4", "4"))),
+        ("L", (("8", "8", "8"),)),
+        ("M N", (("6", "6", "6"),)),
+        ("MN NM", (("66", "66", "66"),)),
+        ("R", (("9", "9", "9"),)),
+        ("RS RZ", (("94", "94", "94"), ("4", "4", "4"))),
+        ("SC SCHTSCH SCHTSH SCHTCH SHCH SHTCH SHTSH STCH STSCH STRS STRZ STSH SZCS SZCZ ZDZ ZDZH ZHDZH",
+         (("2", "4", "4"),)),
+        ("SCHD SCHT SD SHD SHT ST SZD SZT ZD ZHD", (("2", "43", "43"),)),
+):
+    for _sequence in _sequences.split():
+        DAITCH_MOKOTOFF_CODES[_sequence] = _alternatives
+del _sequences, _alternatives, _sequence
+
+DAITCH_MOKOTOFF_MAXIMUM_LENGTH = max(len(sequence) for sequence in DAITCH_MOKOTOFF_CODES)
+
+
+def fold(text):
+    """Returns a name without diacritics, in lower case and with single spaces between its words
+    :type text: str
+    :rtype: str
+    """
+    try:
+        text.encode("ascii")
+    except UnicodeEncodeError:
+        pass
+    else:
+        return " ".join(text.lower().split())
+
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return " ".join("".join(character for character in decomposed if not unicodedata.combining(character)).split())
+
+
+def soundex(name):
+    """Returns the American Soundex code of a name, like `M600` for `Meyer`, or an empty string if the
+    name contains no letters
+
+    Diacritics are ignored, any characters besides the letters A to Z are skipped.
+
+    :type name: str
+    :rtype: str
+    """
+    letters = [character for character in fold(name).upper() if "A" <= character <= "Z"]
+    if not letters:
+        return ""
+
+    code = letters[0]
+    last_digit = SOUNDEX_CODES.get(letters[0], "")
+    for letter in letters[1:]:
+        digit = SOUNDEX_CODES.get(letter, "")
+        if digit and digit != last_digit:
+            code += digit
+            if len(code) == 4:
+                break
+        # H and W do not separate letters with the same code, vowels do
+        if letter not in "HW":
+            last_digit = digit
+
+    return code.ljust(4, "0")
+
+
+def _letters(name):
+    """Returns the letters A to Z of a name in upper case, after removing diacritics
+    :type name: str
+    :rtype: str
+    """
+    return "".join(character for character in fold(name).upper() if "A" <= character <= "Z")
+
+
+def daitch_mokotoff(name):
+    """Returns the Daitch-Mokotoff Soundex codes of a name, like `['734000', '739400']` for `Peters`
+
+    Some letters sound differently depending on the origin of a name, so a name may have several
+    codes. Names sound alike if they have at least one code in common. An empty list is returned
+    if the name contains no letters.
+
+    :type name: str
+    :rtype: list of str
+    """
+    letters = _letters(name)
+    # Every branch holds the code so far and the digits appended last, `None` after a letter not coded
+    branches = [("", None)]
+    position = 0
+
+    while position < len(letters):
+        for length in range(min(DAITCH_MOKOTOFF_MAXIMUM_LENGTH, len(letters) - position), 0, -1):
+            sequence = letters[position:position + length]
+            if sequence in DAITCH_MOKOTOFF_CODES:
+                break
+        position += length
+
+        if position - length == 0:
+            context = 0
+        elif position < len(letters) and letters[position] in VOWELS:
+            context = 1
+        else:
+            context = 2
+
+        new_branches = []
+        for code, last_code in branches:
+            for alternative in DAITCH_MOKOTOFF_CODES.get(sequence, ((None, None, None),)):
+                digits = alternative[context]
+                if digits is None:
+                    new_branches.append((code, None))
+                elif digits == last_code:
+                    new_branches.append((code, last_code))
+                else:
+                    new_branches.append((code + digits, digits))
+        branches = new_branches
+
+    codes = []
+    for code, last_code in branches:
+        code = code[:6].ljust(6, "0")
+        if code not in codes:
+            codes.append(code)
+    return sorted(codes) if letters else []
+
+
+def metaphone(name):
+    """Returns the Metaphone code of a name as described by Lawrence Philips, like `K0RN` for both `Catherine` and `Kathryn`
+
+    Unlike Soundex the code is not truncated to a fixed length. `0` stands for the `TH` sound and
+    `X` for the `SH` sound. An empty string is returned if the name contains no letters.
+
+    :type name: str
+    :rtype: str
+    """
+    word = _letters(name)
+    if word[:2] in ("AE", "GN", "KN", "PN", "WR"):
+        word = word[1:]
+    elif word[:2] == "WH":
+        word = "W" + word[2:]
+    elif word[:1] == "X":
+        word = "S" + word[1:]
+
+    length = len(word)
+    code = []
+    skip_until = 0
+
+    for position, letter in enumerate(word):
+        if position < skip_until:
+            continue
+        previous_letter = word[position - 1] if position > 0 else ""
+        next_letter = word[position + 1] if position + 1 < length else ""
+        after_next_letter = word[position + 2] if position + 2 < length else ""
+
+        if letter == previous_letter and letter != "C":
+            continue
+
+        if letter in VOWELS:
+            if position == 0:
+                code.append(letter)
+        elif letter == "B":
+            if not (previous_letter == "M" and next_letter == ""):
+                code.append("B")
+        elif letter == "C":
+            if previous_letter == "S" and next_letter in ("E", "I", "Y") and next_letter:
+                pass
+            elif word.startswith("CIA", position):
+                code.append("X")
+            elif next_letter in ("E", "I", "Y") and next_letter:
+                code.append("S")
+            elif previous_letter == "S" and next_letter == "H":
+                code.append("K")
+            elif next_letter == "H":
+                code.append("K" if position == 0 and after_next_letter not in VOWELS else "X")
+            else:
+                code.append("K")
+        elif letter == "D":
+            if next_letter == "G" and after_next_letter in ("E", "I", "Y") and after_next_letter:
+                code.append("J")
+                skip_until = position + 2
+            else:
+                code.append("T")
+        elif letter == "G":
+            if next_letter == "H" and (after_next_letter == "" or after_next_letter not in VOWELS):
+                pass
+            elif position > 0 and word[position + 1:] in ("N", "NED"):
+                pass
+            elif next_letter in ("E", "I", "Y") and next_letter and previous_letter != "G":
+                code.append("J")
+            else:
+                code.append("K")
+        elif letter == "H":
+            if next_letter and next_letter in VOWELS and previous_letter not in ("C", "G", "P", "S", "T"):
+                code.append("H")
+        elif letter == "K":
+            if previous_letter != "C":
+                code.append("K")
+        elif letter == "P":
+            code.append("F" if next_letter == "H" else "P")
+        elif letter == "Q":
+            code.append("K")
+        elif letter == "S":
+            if next_letter == "H" or word.startswith(("SIO", "SIA"), position):
+                code.append("X")
+            else:
+                code.append("S")
+        elif letter == "T":
+            if word.startswith(("TIA", "TIO"), position):
+                code.append("X")
+            elif word.startswith("TCH", position):
+                pass
+            elif next_letter == "H":
+                code.append("0")
+            else:
+                code.append("T")
+        elif letter == "V":
+            code.append("F")
+        elif letter in ("W", "Y"):
+            if next_letter and next_letter in VOWELS:
+                code.append(letter)
+        elif letter == "X":
+            code.append("KS")
+        elif letter == "Z":
+            code.append("S")
+        else:
+            code.append(letter)
+
+    return "".join(code)
+
+
+def levenshtein(first, second, maximum=None):
+    """Returns the number of inserted, deleted or replaced characters needed to turn one string into the other
+
+    With `maximum` given the calculation stops as soon as the distance is known to exceed it, in
+    which case `maximum + 1` is returned.
+
+    :type first: str
+    :type second: str
+    :type maximum: int
+    :rtype: int
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    if maximum is not None and len(first) - len(second) > maximum:
+        return maximum + 1
+
+    previous_row = list(range(len(second) + 1))
+    for index, character in enumerate(first, 1):
+        row = [index]
+        for other_index, other_character in enumerate(second, 1):
+            row.append(min(
+                previous_row[other_index] + 1,
+                row[other_index - 1] + 1,
+                previous_row[other_index - 1] + (character != other_character)
+            ))
+        if maximum is not None and min(row) > maximum:
+            return maximum + 1
+        previous_row = row
+    return previous_row[-1]
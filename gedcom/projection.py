@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Filters selecting the elements to keep while parsing GEDCOM data.
+
+An element filter is a callable taking the tag of the record an element belongs to and the tags on
+the path from that record down to the element, like `("INDI", "BIRT", "SOUR")`. It returns whether
+the element gets kept. Elements dropped by `gedcom.parser.Parser.parse()` are skipped along with
+all their child elements right after reading their tag, no `gedcom.element.element.Element` gets
+created for any of these lines:
+
+```python
+from gedcom.parser import Parser
+import gedcom.projection
+
+# Only names, vitals and family links of individuals and families
+element_filter = gedcom.projection.make_tag_filter(
+    record_tags=gedcom.projection.FAMILY_RECORD_TAGS,
+    exclude_tags=gedcom.projection.SOURCE_TAGS,
+)
+
+parser = Parser()
+parser.parse_file(file_path, element_filter=element_filter)
+```
+
+Any other callable works as filter as well, e.g. one keeping the sources of births only:
+
+```python
+def element_filter(record_tag, path):
+    return path[-1] != "SOUR" or path[-2:] == ("BIRT", "SOUR")
+```
+
+Records not needed at all are better left out by their type through `record_tags`. Their lines are
+not even split or tokenized: after reading the header of an unwanted record the raw bytes are
+searched for the next line starting with `0 `, which is where the next record begins:
+
+```python
+parser.parse_file(file_path, record_tags=gedcom.projection.FAMILY_RECORD_TAGS)
+```
+"""
+
+from functools import partial
+import gedcom.tags
+
+# Tags of the records of individuals and families
+FAMILY_RECORD_TAGS = frozenset([
+    gedcom.tags.GEDCOM_TAG_INDIVIDUAL,
+    gedcom.tags.GEDCOM_TAG_FAMILY,
+])
+
+# Tags of sources, notes and multimedia, be it as record or as citation within another record
+SOURCE_TAGS = frozenset([
+    gedcom.tags.GEDCOM_TAG_SOURCE,
+    gedcom.tags.GEDCOM_TAG_NOTE,
+    gedcom.tags.GEDCOM_TAG_OBJECT,
+])
+
+
+def make_tag_filter(record_tags=None, include_tags=None, exclude_tags=None):
+    """Returns an element filter keeping elements by their tags
+
+    Only records with a tag within `record_tags` are kept, and of their direct child elements only
+    those with a tag within `include_tags`, along with `CONC` and `CONT` lines continuing the value of
+    a record. Any element with a tag within `exclude_tags` is dropped,
+    whatever its level. `None` keeps all tags.
+
+    :type record_tags: collection of str
+    :type include_tags: collection of str
+    :type exclude_tags: collection of str
+    :rtype: callable
+    """
+    record_tags = frozenset(record_tags) if record_tags is not None else None
+    if include_tags is not None:
+        include_tags = frozenset(include_tags) | {gedcom.tags.GEDCOM_TAG_CONCATENATION, gedcom.tags.GEDCOM_TAG_CONTINUED}
+    exclude_tags = frozenset(exclude_tags) if exclude_tags is not None else frozenset()
+
+    def element_filter(record_tag, path):
+        tag = path[-1]
+        if tag in exclude_tags:
+            return False
+        if len(path) == 1:
+            return record_tags is None or tag in record_tags
+        if len(path) == 2:
+            return include_tags is None or tag in include_tags
+        return True
+
+    return element_filter
+
+
+# Number of bytes read from a file stream at once by `gedcom.projection.iter_projected_lines()`
+CHUNK_SIZE = 1 << 20
+
+
+def _get_record_tag(header):
+    """Returns the tag of the header line of a record, `None` if not found
+    :type header: bytes
+    :rtype: bytes
+    """
+    parts = header.split(None, 3)
+    if len(parts) > 1 and parts[1].startswith(b'@'):
+        parts.pop(1)
+    return parts[1] if len(parts) > 1 else None
+
+
+def _iter_lines(data):
+    """Yields the lines of the given data, each with its new line
+    :type data: bytes
+    :rtype: generator of bytes
+    """
+    lines = data.split(b'\n')
+    last_line = lines.pop()
+    for line in lines:
+        yield line + b'\n'
+    if last_line:
+        yield last_line
+
+
+def iter_projected_lines(gedcom_stream, record_tags, chunk_size=CHUNK_SIZE):
+    """Yields the lines of records with a tag within `record_tags` only, as read from a file stream or
+    an array of lines
+
+    The lines of other records are skipped by searching the raw bytes for the start of the next
+    record, without splitting them into lines. Records with a header line not starting like
+    `0 TAG` or `0 @POINTER@ TAG` are kept.
+
+    :type gedcom_stream: a file stream, or bytes array of lines with new line at the end
+    :type record_tags: collection of str
+    :type chunk_size: int
+    :rtype: generator of bytes
+    """
+    record_tags = frozenset(tag.encode('ascii') for tag in record_tags)
+    if hasattr(gedcom_stream, 'read'):
+        gedcom_stream = iter(partial(gedcom_stream.read, chunk_size), b'')
+
+    # The buffer always starts with the byte preceding `start`, a new line at the start of a line
+    buffer = b'\n'
+    start = 1
+    # Whether the record at `start` is kept, `None` if its header has not been read yet
+    keep = None
+
+    for chunk in gedcom_stream:
+        buffer += chunk
+
+        while True:
+            if keep is None:
+                header_end = buffer.find(b'\n', start)
+                if header_end < 0:
+                    break
+                tag = _get_record_tag(buffer[start:header_end])
+                keep = tag is None or tag in record_tags
+                boundary = buffer.find(b'\n0 ', header_end)
+            else:
+                boundary = buffer.find(b'\n0 ', start - 1)
+
+            if boundary < 0:
+                if keep:
+                    # Pass on the complete lines read so far
+                    line_end = buffer.rfind(b'\n', start - 1)
+                    for line in _iter_lines(buffer[start:line_end + 1]):
+                        yield line
+                    start = line_end + 1
+                else:
+                    # Keep the last bytes only, they may be part of the next record's start
+                    start = max(start, len(buffer) - 1)
+                break
+
+            if keep:
+                for line in _iter_lines(buffer[start:boundary + 1]):
+                    yield line
+            start = boundary + 1
+            keep = None
+
+        buffer = buffer[start - 1:]
+        start = 1
+
+    if keep is None and len(buffer) > start:
+        tag = _get_record_tag(buffer[start:])
+        keep = tag is None or tag in record_tags
+    if keep:
+        for line in _iter_lines(buffer[start:]):
+            yield line
@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Path queries selecting elements from GEDCOM data without writing nested loops.
+
+A path is a sequence of steps separated by `/`, each step matching the tag of child elements.
+The first step matches the tag of logical records:
+
+```
+INDI/BIRT/PLAC            places of birth of all individuals
+FAM/*/DATE                dates of all family events
+INDI//DATE                all dates at any depth within individuals
+//PLAC                    all places at any depth
+INDI[SEX=F]/NAME          names of all women
+INDI[DEAT]/NAME           names of all individuals having a death event
+INDI[NAME~^Anna ]/BIRT    births of all individuals with a name starting with "Anna "
+FAM/HUSB@/NAME            names of all husbands, following the pointer to their record
+```
+
+`*` matches any tag and `//` matches elements at any depth below. Predicates in brackets filter
+elements by the value of the element itself (`[=M]`) or of a child path (`[BIRT/DATE=1850]`),
+using `=` for equal values, `!=` for different values and `~` for a regular expression search.
+Without a value the predicate checks that the child path exists. Values may be quoted with `"`
+if they contain `]`. A step ending with `@` follows the pointer value of the matched element to
+the referenced record.
+
+A query is compiled once into a chain of generators and can be evaluated many times. The first
+step uses the index of records and elements by tag, see `gedcom.parser.Parser.get_tag_index()`:
+
+```python
+from gedcom.parser import Parser
+import gedcom.query
+
+parser = Parser()
+parser.parse_file(file_path)
+
+query = gedcom.query.compile_query("INDI[SEX=F]/BIRT/PLAC")
+for element in query.evaluate(parser):
+    print(element.get_value())
+
+for element in gedcom.query.select(parser, "FAM/MARR/DATE"):
+    print(element.get_value())
+```
+
+Results are yielded lazily in document order of the traversal. Elements reached through
+different paths, like a family record dereferenced by both spouses, are yielded each time.
+"""
+
+import re
+
+AXIS_CHILD = "child"
+AXIS_DESCENDANT = "descendant"
+
+OPERATOR_EXISTS = None
+OPERATOR_EQUAL = "="
+OPERATOR_NOT_EQUAL = "!="
+OPERATOR_SEARCH = "~"
+
+COMPILED_QUERY_CACHE_SIZE = 128
+
+_TAG_PATTERN = re.compile(r"\*|[A-Za-z0-9_]+")
+_PREDICATE_PATTERN = re.compile(r"""\[\s*((?:[A-Za-z0-9_]+|\*)(?:/(?:[A-Za-z0-9_]+|\*))*)?\s*"""
+                                r"""(?:(!=|=|~)\s*(?:"((?:[^"\\]|\\.)*)"|([^\]]*)))?\]""")
+
+
+class QuerySyntaxError(Exception):
+    pass
+
+
+class TagIndex(object):
+    """Logical records and all elements grouped by their tag, in document order"""
+
+    def __init__(self, parser):
+        self.__parser = parser
+        self.__records_by_tag = None
+        self.__elements_by_tag = None
+
+    def get_records(self, tag):
+        """Returns the logical records with the given tag
+        :type tag: str
+        :rtype: list of Element
+        """
+        if self.__records_by_tag is None:
+            self.__records_by_tag = _group_by_tag(self.__parser.get_root_child_elements())
+        return self.__records_by_tag.get(tag, [])
+
+    def get_elements(self, tag):
+        """Returns all elements with the given tag at any level
+        :type tag: str
+        :rtype: list of Element
+        """
+        if self.__elements_by_tag is None:
+            self.__elements_by_tag = _group_by_tag(self.__parser.get_element_list())
+        return self.__elements_by_tag.get(tag, [])
+
+    def build(self):
+        """Groups the records and elements right away instead of on their first lookup"""
+        if self.__records_by_tag is None:
+            self.__records_by_tag = _group_by_tag(self.__parser.get_root_child_elements())
+        if self.__elements_by_tag is None:
+            self.__elements_by_tag = _group_by_tag(self.__parser.get_element_list())
+
+    def is_built(self):
+        """Checks if both records and elements have been grouped already
+        :rtype: bool
+        """
+        return self.__records_by_tag is not None and self.__elements_by_tag is not None
+
+
+def _group_by_tag(elements):
+    """:rtype: dict of list"""
+    groups = {}
+    for element in elements:
+        tag = element.get_tag()
+        group = groups.get(tag)
+        if group is None:
+            groups[tag] = [element]
+        else:
+            group.append(element)
+    return groups
+
+
+def build_tag_index(parser):
+    """Returns the tag index of the records and elements of a parser, use `gedcom.parser.Parser.get_tag_index()`
+
+    Records and elements are grouped on the first lookup of either, or by `gedcom.query.TagIndex.build()`.
+
+    :type parser: Parser
+    :rtype: TagIndex
+    """
+    return TagIndex(parser)
+
+
+class Step(object):
+    """A single step of a path query"""
+
+    def __init__(self, axis, tag, predicates, dereference):
+        self.__axis = axis
+        self.__tag = tag
+        self.__predicates = predicates
+        self.__dereference = dereference
+
+    def get_axis(self):
+        """Returns either `AXIS_CHILD` or `AXIS_DESCENDANT`
+        :rtype: str
+        """
+        return self.__axis
+
+    def get_tag(self):
+        """Returns the tag to match, `None` for any tag
+        :rtype: str
+        """
+        return self.__tag
+
+    def get_predicates(self):
+        """Returns the predicates as tuples (`list` of `str` child path, `str` operator, `str` value)
+        :rtype: list of tuple
+        """
+        return self.__predicates
+
+    def is_dereference(self):
+        """Checks if the pointer value of the matched element gets followed to the referenced record
+        :rtype: bool
+        """
+        return self.__dereference
+
+
+def _parse_steps(path):
+    """Parses a path into its steps
+    :type path: str
+    :rtype: list of Step
+    """
+    steps = []
+    position = 0
+    path = path.strip()
+
+    while True:
+        if path.startswith("//", position):
+            axis = AXIS_DESCENDANT
+            position += 2
+        elif path.startswith("/", position):
+            axis = AXIS_CHILD
+            position += 1
+        elif not steps:
+            axis = AXIS_CHILD
+        else:
+            raise QuerySyntaxError("Expected / at position %d of query %r" % (position, path))
+
+        tag_match = _TAG_PATTERN.match(path, position)
+        if tag_match is None:
+            raise QuerySyntaxError("Expected a tag or * at position %d of query %r" % (position, path))
+        tag = None if tag_match.group() == "*" else tag_match.group().upper()
+        position = tag_match.end()
+
+        predicates = []
+        while path.startswith("[", position):
+            predicate_match = _PREDICATE_PATTERN.match(path, position)
+            if predicate_match is None:
+                raise QuerySyntaxError("Invalid predicate at position %d of query %r" % (position, path))
+            child_path, operator, quoted_value, value = predicate_match.groups()
+            if child_path is None and operator is None:
+                raise QuerySyntaxError("Empty predicate at position %d of query %r" % (position, path))
+            if quoted_value is not None:
+                value = re.sub(r"\\(.)", r"\1", quoted_value)
+            elif value is not None:
+                value = value.strip()
+            if operator == OPERATOR_SEARCH:
+                try:
+                    value = re.compile(value)
+                except re.error as error:
+                    raise QuerySyntaxError("Invalid regular expression in query %r: %s" % (path, error))
+            tags = [None if tag == "*" else tag.upper() for tag in child_path.split("/")] if child_path else []
+            predicates.append((tags, operator, value))
+            position = predicate_match.end()
+
+        dereference = path.startswith("@", position)
+        if dereference:
+            position += 1
+
+        steps.append(Step(axis, tag, predicates, dereference))
+
+        if position == len(path):
+            return steps
+
+
+def _iter_children(elements, tag):
+    for element in elements:
+        for child in element.get_child_elements():
+            if tag is None or child.get_tag() == tag:
+                yield child
+
+
+def _iter_descendants_of(element, tag):
+    for child in element.get_child_elements():
+        if tag is None or child.get_tag() == tag:
+            yield child
+        if child.get_child_elements():
+            yield from _iter_descendants_of(child, tag)
+
+
+def _iter_descendants(elements, tag):
+    for element in elements:
+        yield from _iter_descendants_of(element, tag)
+
+
+def _get_predicate_elements(element, tags):
+    """Returns the elements reached from an element through a child path
+    :rtype: list of Element
+    """
+    elements = [element]
+    for tag in tags:
+        elements = [child for parent in elements for child in parent.get_child_elements()
+                    if tag is None or child.get_tag() == tag]
+        if not elements:
+            break
+    return elements
+
+
+def _compile_predicate(predicate):
+    """Returns a function checking if an element matches a predicate
+    :type predicate: tuple
+    :rtype: callable
+    """
+    tags, operator, value = predicate
+
+    if operator is OPERATOR_EXISTS:
+        if len(tags) == 1 and tags[0] is not None:
+            tag = tags[0]
+            return lambda element: any(child.get_tag() == tag for child in element.get_child_elements())
+        return lambda element: bool(_get_predicate_elements(element, tags))
+    if operator == OPERATOR_EQUAL:
+        def matches(candidate):
+            return candidate.get_multi_line_value() == value
+    elif operator == OPERATOR_NOT_EQUAL:
+        def matches(candidate):
+            return candidate.get_multi_line_value() != value
+    else:
+        def matches(candidate):
+            return value.search(candidate.get_multi_line_value()) is not None
+
+    if not tags:
+        return matches
+    if len(tags) == 1 and tags[0] is not None:
+        tag = tags[0]
+
+        def matches_child(element):
+            for child in element.get_child_elements():
+                if child.get_tag() == tag and matches(child):
+                    return True
+            return False
+
+        return matches_child
+    return lambda element: any(matches(candidate) for candidate in _get_predicate_elements(element, tags))
+
+
+class Query(object):
+    """Compiled path query, see `gedcom.query.compile_query()`"""
+
+    def __init__(self, path):
+        self.__path = path
+        self.__steps = _parse_steps(path)
+        self.__stages = [self.__compile_step(step) for step in self.__steps]
+
+    def get_path(self):
+        """:rtype: str"""
+        return self.__path
+
+    def get_steps(self):
+        """:rtype: list of Step"""
+        return self.__steps
+
+    @staticmethod
+    def __compile_step(step):
+        """Returns a function turning an iterable of elements into an iterable of the elements selected by a step
+        :type step: Step
+        :rtype: callable
+        """
+        tag = step.get_tag()
+        traverse = _iter_descendants if step.get_axis() == AXIS_DESCENDANT else _iter_children
+        predicates = [_compile_predicate(predicate) for predicate in step.get_predicates()]
+        dereference = step.is_dereference()
+
+        def stage(elements, element_dictionary, from_index=False):
+            selected = elements if from_index else traverse(elements, tag)
+            for predicate in predicates:
+                selected = filter(predicate, selected)
+            if dereference:
+                selected = _dereference(selected, element_dictionary)
+            return selected
+
+        return stage
+
+    def __run(self, elements, element_dictionary, from_index):
+        for index, stage in enumerate(self.__stages):
+            elements = stage(elements, element_dictionary, from_index and index == 0)
+        return elements
+
+    def evaluate(self, parser):
+        """Yields the elements selected from all logical records of a parser
+
+        The first step is looked up in the tag index of the parser if it matches a specific tag.
+
+        :type parser: Parser
+        :rtype: generator of Element
+        """
+        first_step = self.__steps[0]
+        element_dictionary = parser.get_element_dictionary() if self.__has_dereference() else None
+
+        if first_step.get_tag() is None:
+            elements = self.__run([parser.get_root_element()], element_dictionary, False)
+        elif first_step.get_axis() == AXIS_DESCENDANT:
+            elements = self.__run(parser.get_tag_index().get_elements(first_step.get_tag()), element_dictionary, True)
+        else:
+            elements = self.__run(parser.get_tag_index().get_records(first_step.get_tag()), element_dictionary, True)
+
+        yield from elements
+
+    def evaluate_element(self, element, parser=None):
+        """Yields the elements selected from the child elements of a single element
+
+        Pointers are followed using the linked records, see `gedcom.parser.Parser.resolve_links()`,
+        or using the element dictionary if `parser` is given.
+
+        :type element: Element
+        :type parser: Parser
+        :rtype: generator of Element
+        """
+        element_dictionary = parser.get_element_dictionary() if parser is not None and self.__has_dereference() else None
+        yield from self.__run([element], element_dictionary, False)
+
+    def __has_dereference(self):
+        """:rtype: bool"""
+        return any(step.is_dereference() for step in self.__steps)
+
+
+def _dereference(elements, element_dictionary):
+    """Yields the records referenced by the pointer values of elements, skipping unknown pointers"""
+    for element in elements:
+        record = element.get_linked_record()
+        if record is None and element_dictionary is not None:
+            record = element_dictionary.get(element.get_value())
+        if record is not None:
+            yield record
+
+
+_compiled_queries = {}
+
+
+def compile_query(path):
+    """Compiles a path query, raising a `QuerySyntaxError` if the path is invalid
+    :type path: str
+    :rtype: Query
+    """
+    return Query(path)
+
+
+def select(parser, path):
+    """Yields the elements selected by a path query from all logical records of a parser
+
+    Compiled queries are cached, so the same path is only compiled once.
+
+    :type parser: Parser
+    :type path: str
+    :rtype: generator of Element
+    """
+    query = _compiled_queries.get(path)
+    if query is None:
+        if len(_compiled_queries) >= COMPILED_QUERY_CACHE_SIZE:
+            _compiled_queries.clear()
+        query = _compiled_queries[path] = compile_query(path)
+    return query.evaluate(parser)
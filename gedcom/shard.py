@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Splitting of huge GEDCOM files into independent shards for distributed processing.
+
+Individuals and families linked through `FAMC`, `FAMS`, `HUSB`, `WIFE` or `CHIL` form connected
+components, found in a single union-find pass over all records. Components are packed into
+`shard_count` shards of about the same number of elements, largest first. Every shard gets a copy
+of the header along with all source, note, multimedia, repository and submitter records referenced
+by its records, so records shared by several shards are copied into each of them. Records neither
+part of a component nor referenced by one go into the first shard.
+
+```python
+from gedcom.parser import Parser
+import gedcom.shard
+
+parser = Parser()
+parser.parse_file(file_path)
+manifest = gedcom.shard.write_shards(parser, "shards/", 8)
+
+# ... process and possibly modify each shard file ...
+
+gedcom.shard.combine_shards("shards/manifest.json", "combined.ged")
+```
+
+The manifest written along with the shards lists the file and contents of every shard, the shard
+holding each individual and family, and the shards holding copies of each shared record. Other
+references between shards, like an association of individuals in different components, are kept
+as they are and can be looked up in the manifest.
+
+The same can be done from the command line:
+
+```
+python -m gedcom.shard family.ged shards/ --shards 8
+```
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+from gedcom.extract import get_referenced_records
+from gedcom.parser import Parser
+import gedcom.tags
+
+FAMILY_LINK_TAGS = frozenset((
+    gedcom.tags.GEDCOM_TAG_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE,
+    gedcom.tags.GEDCOM_TAG_HUSBAND,
+    gedcom.tags.GEDCOM_TAG_WIFE,
+))
+"""Tags of the elements linking individuals and families"""
+
+COMPONENT_TAGS = frozenset((
+    gedcom.tags.GEDCOM_TAG_FAMILY,
+    gedcom.tags.GEDCOM_TAG_INDIVIDUAL,
+))
+"""Tags of the records forming connected components"""
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+MANIFEST_VERSION = 1
+
+
+class ShardManifestError(Exception):
+    pass
+
+
+def find_components(parser):
+    """Returns the connected components of individuals and families, each a list of records in
+    document order, largest component first
+    :type parser: Parser
+    :rtype: list of list of Element
+    """
+    records = [record for record in parser.get_root_child_elements()
+               if record.get_tag() in COMPONENT_TAGS and record.get_pointer()]
+    indices = {record.get_pointer(): index for index, record in enumerate(records)}
+    parents = list(range(len(records)))
+    sizes = [1] * len(records)
+
+    def find(index):
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for index, record in enumerate(records):
+        for child in record.get_child_elements():
+            if child.get_tag() in FAMILY_LINK_TAGS:
+                other_index = indices.get(child.get_value())
+                if other_index is None:
+                    continue
+                root = find(index)
+                other_root = find(other_index)
+                if root != other_root:
+                    if sizes[root] < sizes[other_root]:
+                        root, other_root = other_root, root
+                    parents[other_root] = root
+                    sizes[root] += sizes[other_root]
+
+    components = {}
+    for index, record in enumerate(records):
+        components.setdefault(find(index), []).append(record)
+    return sorted(components.values(), key=len, reverse=True)
+
+
+def _count_elements(element):
+    """Returns the number of elements within a record, including the record itself
+    :rtype: int
+    """
+    count = 1
+    for child in element.get_child_elements():
+        count += _count_elements(child)
+    return count
+
+
+def pack_components(components, shard_count):
+    """Distributes components over shards, each time adding the largest remaining component to the
+    shard with the fewest elements so far
+
+    Returns the lists of components of every shard, shards without components being left out.
+
+    :type components: list of list of Element
+    :type shard_count: int
+    :rtype: list of list of list of Element
+    """
+    if shard_count < 1:
+        raise ValueError("Number of shards has to be at least 1, got %d" % shard_count)
+
+    weights = [sum(_count_elements(record) for record in component) for component in components]
+    order = sorted(range(len(components)), key=lambda index: weights[index], reverse=True)
+
+    shards = [[] for _ in range(shard_count)]
+    loads = [(0, shard_index) for shard_index in range(shard_count)]
+    for index in order:
+        load, shard_index = heapq.heappop(loads)
+        shards[shard_index].append(components[index])
+        heapq.heappush(loads, (load + weights[index], shard_index))
+
+    return [shard for shard in shards if shard]
+
+
+def write_shards(parser, directory, shard_count, prefix="shard"):
+    """Writes the connected components of the parsed data into shard files along with a manifest,
+    see `gedcom.shard`, and returns the manifest
+    :type parser: Parser
+    :type directory: str
+    :type shard_count: int
+    :type prefix: str
+    :rtype: dict
+    """
+    element_dictionary = parser.get_element_dictionary()
+    root_child_elements = parser.get_root_child_elements()
+    header = None
+    if root_child_elements and root_child_elements[0].get_tag() == gedcom.tags.GEDCOM_TAG_HEADER:
+        header = root_child_elements[0]
+
+    shards = [[record for component in components for record in component]
+              for components in pack_components(find_components(parser), shard_count)]
+    if not shards:
+        shards = [[]]
+
+    shared_records = [get_referenced_records(([header] if header is not None else []) + records, element_dictionary)
+                      for records in shards]
+
+    # Records left out of every shard go into the first one
+    placed = set()
+    for records, referenced_records in zip(shards, shared_records):
+        placed.update(id(record) for record in records)
+        placed.update(id(record) for record in referenced_records)
+    left_out_records = [record for record in root_child_elements if id(record) not in placed and record is not header
+                        and record.get_tag() != gedcom.tags.GEDCOM_TAG_TRAILER]
+    if left_out_records:
+        shards[0].extend(left_out_records)
+        shared_records[0] = get_referenced_records(([header] if header is not None else []) + shards[0],
+                                                   element_dictionary)
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "shards": [],
+        "records": {},
+        "shared_records": {},
+    }
+    for shard_index, (records, referenced_records) in enumerate(zip(shards, shared_records)):
+        file_name = "%s-%03d.ged" % (prefix, shard_index)
+        with open(os.path.join(directory, file_name), 'w', encoding='utf-8', newline='') as output:
+            if header is not None:
+                output.write(header.to_gedcom_string(True))
+            for record in referenced_records + records:
+                output.write(record.to_gedcom_string(True))
+            output.write("0 %s\n" % gedcom.tags.GEDCOM_TAG_TRAILER)
+
+        for record in records:
+            if record.get_pointer():
+                manifest["records"][record.get_pointer()] = shard_index
+        for record in referenced_records:
+            manifest["shared_records"].setdefault(record.get_pointer(), []).append(shard_index)
+        manifest["shards"].append({
+            "file": file_name,
+            "individuals": sum(1 for record in records if record.get_tag() == gedcom.tags.GEDCOM_TAG_INDIVIDUAL),
+            "families": sum(1 for record in records if record.get_tag() == gedcom.tags.GEDCOM_TAG_FAMILY),
+            "records": len(records),
+            "shared_records": len(referenced_records),
+        })
+
+    with open(os.path.join(directory, MANIFEST_FILE_NAME), 'w', encoding='utf-8') as manifest_file:
+        manifest_file.write(json.dumps(manifest, indent=2, sort_keys=True))
+
+    return manifest
+
+
+def load_manifest(manifest_path):
+    """Reads a manifest written by `gedcom.shard.write_shards()`
+    :type manifest_path: str
+    :rtype: dict
+    """
+    with open(manifest_path, encoding='utf-8') as manifest_file:
+        manifest = json.load(manifest_file)
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise ShardManifestError("File %s is not a shard manifest of version %d" % (manifest_path, MANIFEST_VERSION))
+    return manifest
+
+
+def combine_shards(manifest_path, output_path, strict=True):
+    """Combines the shard files listed in a manifest into one GEDCOM file
+
+    The header is taken from the first shard. Shared records are written once, taken from the
+    first shard holding a copy of them.
+
+    :type manifest_path: str
+    :type output_path: str
+    :type strict: bool
+    """
+    manifest = load_manifest(manifest_path)
+    directory = os.path.dirname(manifest_path)
+    shared_records = manifest["shared_records"]
+
+    with open(output_path, 'w', encoding='utf-8', newline='') as output:
+        for shard_index, shard in enumerate(manifest["shards"]):
+            parser = Parser()
+            parser.parse_file(os.path.join(directory, shard["file"]), strict)
+            for record in parser.get_root_child_elements():
+                tag = record.get_tag()
+                if tag == gedcom.tags.GEDCOM_TAG_TRAILER:
+                    continue
+                if tag == gedcom.tags.GEDCOM_TAG_HEADER and shard_index > 0:
+                    continue
+                shard_indices = shared_records.get(record.get_pointer())
+                if shard_indices is not None and shard_indices[0] != shard_index:
+                    continue
+                output.write(record.to_gedcom_string(True))
+        output.write("0 %s\n" % gedcom.tags.GEDCOM_TAG_TRAILER)
+
+
+def main(arguments=None):
+    """Command line entry point
+    :type arguments: list of str
+    :rtype: int
+    """
+    argument_parser = argparse.ArgumentParser(prog="python -m gedcom.shard",
+                                              description="Split a GEDCOM file into shards of connected families.")
+    argument_parser.add_argument("input", help="GEDCOM file to read")
+    argument_parser.add_argument("directory", help="directory to write the shards and manifest to")
+    argument_parser.add_argument("--shards", type=int, default=4, help="number of shards")
+    argument_parser.add_argument("--prefix", default="shard", help="prefix of the shard file names")
+    argument_parser.add_argument("--no-strict", action="store_true", help="disable strict parsing")
+    options = argument_parser.parse_args(arguments)
+
+    parser = Parser()
+    parser.parse_file(options.input, not options.no_strict)
+    manifest = write_shards(parser, options.directory, options.shards, options.prefix)
+
+    for shard in manifest["shards"]:
+        sys.stdout.write("%s  %d individuals  %d families  %d shared records\n" % (
+            shard["file"], shard["individuals"], shard["families"], shard["shared_records"]
+        ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
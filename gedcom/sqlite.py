@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Export of parsed GEDCOM data into a SQLite database, and loading it back.
+
+The database contains the following tables:
+
+* `elements`: every element with its level, pointer, tag, value and the id of its parent element.
+  Element ids follow the order of the elements within the GEDCOM data.
+* `records`: the logical records (elements of level 0).
+* `pointers`: every element whose value points to another record.
+* `individuals`: name, gender, birth and death data of every `INDI` record.
+* `families`: husband and wife of every `FAM` record.
+* `events`: date and place of the events listed in `gedcom.sqlite.EVENT_TAGS` of individuals and families.
+* `family_links`: the members of every family with their role and relationship to the parents.
+
+Use `gedcom.parser.Parser.to_sqlite()` and `gedcom.parser.Parser.load_sqlite()` instead of calling
+the functions of this module directly.
+"""
+
+import sqlite3
+from gedcom.element.element import get_element_class
+from gedcom.element.family import FamilyElement
+from gedcom.element.individual import IndividualElement
+import gedcom.tags
+
+EVENT_TAGS = (
+    gedcom.tags.GEDCOM_TAG_ADOPTION,
+    gedcom.tags.GEDCOM_TAG_ANNULMENT,
+    gedcom.tags.GEDCOM_TAG_BAPTISM,
+    gedcom.tags.GEDCOM_TAG_BAR_MITZVAH,
+    gedcom.tags.GEDCOM_TAG_BAS_MITZVAH,
+    gedcom.tags.GEDCOM_TAG_BIRTH,
+    gedcom.tags.GEDCOM_TAG_BLESSING,
+    gedcom.tags.GEDCOM_TAG_BURIAL,
+    gedcom.tags.GEDCOM_TAG_CENSUS,
+    gedcom.tags.GEDCOM_TAG_CHRISTENING,
+    gedcom.tags.GEDCOM_TAG_ADULT_CHRISTENING,
+    gedcom.tags.GEDCOM_TAG_CONFIRMATION,
+    gedcom.tags.GEDCOM_TAG_CREMATION,
+    gedcom.tags.GEDCOM_TAG_DEATH,
+    gedcom.tags.GEDCOM_TAG_DIVORCE,
+    gedcom.tags.GEDCOM_TAG_DIVORCE_FILED,
+    gedcom.tags.GEDCOM_TAG_EMIGRATION,
+    gedcom.tags.GEDCOM_TAG_ENGAGEMENT,
+    gedcom.tags.GEDCOM_TAG_EVENT,
+    gedcom.tags.GEDCOM_TAG_FIRST_COMMUNION,
+    gedcom.tags.GEDCOM_TAG_GRADUATION,
+    gedcom.tags.GEDCOM_TAG_IMMIGRATION,
+    gedcom.tags.GEDCOM_TAG_MARRIAGE_BANN,
+    gedcom.tags.GEDCOM_TAG_MARR_CONTRACT,
+    gedcom.tags.GEDCOM_TAG_MARR_LICENSE,
+    gedcom.tags.GEDCOM_TAG_MARRIAGE,
+    gedcom.tags.GEDCOM_TAG_MARR_SETTLEMENT,
+    gedcom.tags.GEDCOM_TAG_NATURALIZATION,
+    gedcom.tags.GEDCOM_TAG_ORDINATION,
+    gedcom.tags.GEDCOM_TAG_PROBATE,
+    gedcom.tags.GEDCOM_TAG_RESIDENCE,
+    gedcom.tags.GEDCOM_TAG_RETIREMENT,
+    gedcom.tags.GEDCOM_TAG_WILL,
+)
+"""Tags of the individual and family events written into the `events` table"""
+
+POINTER_TAGS = (
+    gedcom.tags.GEDCOM_TAG_ASSOCIATES,
+    gedcom.tags.GEDCOM_TAG_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_CHILD,
+    gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE,
+    gedcom.tags.GEDCOM_TAG_HUSBAND,
+    gedcom.tags.GEDCOM_TAG_NOTE,
+    gedcom.tags.GEDCOM_TAG_OBJECT,
+    gedcom.tags.GEDCOM_TAG_REPOSITORY,
+    gedcom.tags.GEDCOM_TAG_SOURCE,
+    gedcom.tags.GEDCOM_TAG_SUBMITTER,
+    gedcom.tags.GEDCOM_TAG_WIFE,
+)
+"""Tags whose values are written into the `pointers` table when they are shaped like a pointer"""
+
+SCHEMA = """
+CREATE TABLE elements (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER,
+    record_id INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    pointer TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    value TEXT NOT NULL,
+    crlf TEXT NOT NULL
+);
+CREATE TABLE records (
+    id INTEGER PRIMARY KEY,
+    pointer TEXT NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE TABLE pointers (
+    element_id INTEGER PRIMARY KEY,
+    record_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    target TEXT NOT NULL
+);
+CREATE TABLE individuals (
+    record_id INTEGER PRIMARY KEY,
+    pointer TEXT NOT NULL,
+    given_name TEXT NOT NULL,
+    surname TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    birth_place TEXT NOT NULL,
+    birth_year INTEGER,
+    death_date TEXT NOT NULL,
+    death_place TEXT NOT NULL,
+    death_year INTEGER
+);
+CREATE TABLE families (
+    record_id INTEGER PRIMARY KEY,
+    pointer TEXT NOT NULL,
+    husband TEXT,
+    wife TEXT
+);
+CREATE TABLE events (
+    element_id INTEGER PRIMARY KEY,
+    record_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    date TEXT NOT NULL,
+    place TEXT NOT NULL
+);
+CREATE TABLE family_links (
+    element_id INTEGER PRIMARY KEY,
+    family TEXT NOT NULL,
+    individual TEXT NOT NULL,
+    role TEXT NOT NULL,
+    father_relationship TEXT NOT NULL,
+    mother_relationship TEXT NOT NULL
+);
+CREATE INDEX elements_parent_id ON elements (parent_id);
+CREATE INDEX elements_record_id ON elements (record_id);
+CREATE INDEX elements_tag ON elements (tag);
+CREATE INDEX records_pointer ON records (pointer);
+CREATE INDEX records_tag ON records (tag);
+CREATE INDEX pointers_record_id ON pointers (record_id);
+CREATE INDEX pointers_target ON pointers (target);
+CREATE INDEX individuals_pointer ON individuals (pointer);
+CREATE INDEX individuals_surname ON individuals (surname);
+CREATE INDEX individuals_birth_year ON individuals (birth_year);
+CREATE INDEX individuals_death_year ON individuals (death_year);
+CREATE INDEX families_pointer ON families (pointer);
+CREATE INDEX families_husband ON families (husband);
+CREATE INDEX families_wife ON families (wife);
+CREATE INDEX events_record_id ON events (record_id);
+CREATE INDEX events_tag ON events (tag);
+CREATE INDEX family_links_family ON family_links (family);
+CREATE INDEX family_links_individual ON family_links (individual);
+"""
+
+TABLES = ("elements", "records", "pointers", "individuals", "families", "events", "family_links")
+
+DEFAULT_BATCH_SIZE = 10000
+
+
+def _is_pointer(value):
+    """Checks if a value is shaped like a pointer
+    :type value: str
+    :rtype: bool
+    """
+    return len(value) > 2 and value[0] == '@' and value[-1] == '@'
+
+
+def _get_date_and_place(element):
+    """Returns the date and place of an event as a tuple: (`str` date, `str` place)
+    :type element: Element
+    :rtype: tuple
+    """
+    date = ""
+    place = ""
+    for child in element.get_child_elements():
+        if child.get_tag() == gedcom.tags.GEDCOM_TAG_DATE:
+            date = child.get_value()
+        elif child.get_tag() == gedcom.tags.GEDCOM_TAG_PLACE:
+            place = child.get_value()
+    return date, place
+
+
+class _Writer(object):
+    """Collects rows and flushes them batch by batch with `executemany`"""
+
+    STATEMENTS = {
+        "elements": "INSERT INTO elements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        "records": "INSERT INTO records VALUES (?, ?, ?)",
+        "pointers": "INSERT INTO pointers VALUES (?, ?, ?, ?)",
+        "individuals": "INSERT INTO individuals VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        "families": "INSERT INTO families VALUES (?, ?, ?, ?)",
+        "events": "INSERT INTO events VALUES (?, ?, ?, ?, ?)",
+        "family_links": "INSERT INTO family_links VALUES (?, ?, ?, ?, ?, ?)",
+    }
+
+    def __init__(self, connection, batch_size):
+        self.__connection = connection
+        self.__batch_size = batch_size
+        self.__rows = {table: [] for table in TABLES}
+
+    def add(self, table, row):
+        rows = self.__rows[table]
+        rows.append(row)
+        if len(rows) >= self.__batch_size:
+            self.flush(table)
+
+    def flush(self, table=None):
+        for name in ((table,) if table else TABLES):
+            if self.__rows[name]:
+                self.__connection.executemany(self.STATEMENTS[name], self.__rows[name])
+                self.__rows[name] = []
+
+
+def _write_record(writer, record, record_id):
+    """Writes a logical record with all of its sub-elements, returns the next free element id
+    :type writer: _Writer
+    :type record: Element
+    :type record_id: int
+    :rtype: int
+    """
+    next_id = record_id
+    stack = [(record, None)]
+
+    while stack:
+        element, parent_id = stack.pop()
+        element_id = next_id
+        next_id += 1
+
+        tag = element.get_tag()
+        value = element.get_value()
+        writer.add("elements", (
+            element_id, parent_id, record_id, element.get_level(), element.get_pointer() or "",
+            tag, value, element.get_crlf()
+        ))
+
+        if tag in POINTER_TAGS and _is_pointer(value):
+            writer.add("pointers", (element_id, record_id, tag, value))
+
+        if parent_id == record_id:
+            _write_related_rows(writer, record, element, element_id, record_id)
+
+        # Push children in reverse to keep element ids in document order
+        for child in reversed(element.get_child_elements()):
+            stack.append((child, element_id))
+
+    return next_id
+
+
+def _write_related_rows(writer, record, element, element_id, record_id):
+    """Writes the derived rows of a direct child element of a logical record
+    :type writer: _Writer
+    :type record: Element
+    :type element: Element
+    :type element_id: int
+    :type record_id: int
+    """
+    tag = element.get_tag()
+
+    if tag in EVENT_TAGS and isinstance(record, (IndividualElement, FamilyElement)):
+        date, place = _get_date_and_place(element)
+        writer.add("events", (element_id, record_id, tag, date, place))
+
+    if isinstance(record, FamilyElement) and tag in (gedcom.tags.GEDCOM_TAG_HUSBAND,
+                                                     gedcom.tags.GEDCOM_TAG_WIFE,
+                                                     gedcom.tags.GEDCOM_TAG_CHILD):
+        father_relationship = ""
+        mother_relationship = ""
+        for child in element.get_child_elements():
+            if child.get_tag() == gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL:
+                father_relationship = child.get_value()
+            elif child.get_tag() == gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL:
+                mother_relationship = child.get_value()
+        writer.add("family_links", (
+            element_id, record.get_pointer(), element.get_value(), tag, father_relationship, mother_relationship
+        ))
+
+
+def export_sqlite(records, database_path, batch_size=DEFAULT_BATCH_SIZE):
+    """Writes logical records into a new SQLite database within a single transaction
+
+    Existing tables of a previous export in the same database are replaced.
+
+    :type records: list of Element
+    :type database_path: str
+    :type batch_size: int
+    """
+    # Without implicit transactions, so that dropping and creating the tables is part of the transaction
+    connection = sqlite3.connect(database_path, isolation_level=None)
+    try:
+        connection.execute("BEGIN")
+        try:
+            for table in TABLES:
+                connection.execute("DROP TABLE IF EXISTS %s" % table)
+            for statement in SCHEMA.split(';'):
+                if statement.strip():
+                    connection.execute(statement)
+
+            writer = _Writer(connection, batch_size)
+            record_id = 1
+            for record in records:
+                writer.add("records", (record_id, record.get_pointer() or "", record.get_tag()))
+
+                if isinstance(record, IndividualElement):
+                    given_name, surname = record.get_name()
+                    birth_date, birth_place, birth_sources = record.get_birth_data()
+                    death_date, death_place, death_sources = record.get_death_data()
+                    birth_year = record.get_birth_year()
+                    death_year = record.get_death_year()
+                    writer.add("individuals", (
+                        record_id, record.get_pointer(), given_name, surname, record.get_gender(),
+                        birth_date, birth_place, birth_year if birth_year != -1 else None,
+                        death_date, death_place, death_year if death_year != -1 else None
+                    ))
+                elif isinstance(record, FamilyElement):
+                    husband = None
+                    wife = None
+                    for child in record.get_child_elements():
+                        if child.get_tag() == gedcom.tags.GEDCOM_TAG_HUSBAND and husband is None:
+                            husband = child.get_value()
+                        elif child.get_tag() == gedcom.tags.GEDCOM_TAG_WIFE and wife is None:
+                            wife = child.get_value()
+                    writer.add("families", (record_id, record.get_pointer(), husband, wife))
+
+                record_id = _write_record(writer, record, record_id)
+
+            writer.flush()
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
+
+
+def _new_element(level, pointer, tag, value, crlf):
+    """Creates an element of the class matching its tag
+    :rtype: Element
+    """
+    return get_element_class(tag)(level, pointer, tag, value, crlf, multi_line=False)
+
+
+def import_sqlite(database_path, root_element):
+    """Reads all elements of a database written by `gedcom.sqlite.export_sqlite()` into the given root element
+    :type database_path: str
+    :type root_element: RootElement
+    """
+    connection = sqlite3.connect(database_path)
+    try:
+        elements = {}
+        cursor = connection.execute(
+            "SELECT id, parent_id, level, pointer, tag, value, crlf FROM elements ORDER BY id"
+        )
+        for element_id, parent_id, level, pointer, tag, value, crlf in cursor:
+            element = _new_element(level, pointer, tag, value, crlf)
+            parent_element = root_element if parent_id is None else elements[parent_id]
+            parent_element.add_child_element(element)
+            elements[element_id] = element
+    finally:
+        connection.close()
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+
+"""
+Full-text index of the notes, source texts, page references and titles within GEDCOM data.
+
+The index is built in one pass over the values of all `NOTE`, `TEXT`, `PAGE` and `TITL` elements,
+joined with their concatenations and continuations. Values are folded, see `gedcom.phonetic.fold()`,
+and split into terms. Queries return the logical records containing the matching text:
+
+```python
+from gedcom.parser import Parser
+import gedcom.text_index
+
+parser = Parser()
+parser.parse_file(file_path)
+text_index = gedcom.text_index.build_text_index(parser.get_root_child_elements())
+
+text_index.find("emigrated hamburg")  # all terms
+text_index.find_phrase("emigrated to America")
+text_index.find_prefix("emigr")
+```
+
+After editing a record, call `gedcom.text_index.TextIndex.update_record()` to index its new text.
+The index can be saved to disk and loaded again for the same GEDCOM data:
+
+```python
+text_index.save("notes.idx.json")
+text_index = gedcom.text_index.load_text_index("notes.idx.json", parser.get_root_child_elements())
+```
+"""
+
+import json
+import re
+from bisect import bisect_left
+from gedcom.phonetic import fold
+import gedcom.tags
+
+TEXT_TAGS = frozenset((
+    gedcom.tags.GEDCOM_TAG_NOTE,
+    gedcom.tags.GEDCOM_TAG_PAGE,
+    gedcom.tags.GEDCOM_TAG_TEXT,
+    gedcom.tags.GEDCOM_TAG_TITLE,
+))
+"""Tags of the elements whose values get indexed"""
+
+TERM_PATTERN = re.compile(r"\w+")
+
+FILE_FORMAT_VERSION = 2
+
+
+class TextIndexFormatError(Exception):
+    pass
+
+
+def get_terms(text):
+    """Returns the folded terms of a text in their order
+    :type text: str
+    :rtype: list of str
+    """
+    return TERM_PATTERN.findall(fold(text))
+
+
+def get_record_key(record, position):
+    """Returns the pointer of a record, or for records without pointer like `HEAD` its tag along with
+    its position among all records
+    :type record: Element
+    :type position: int
+    :rtype: str
+    """
+    return record.get_pointer() or "%s:%d" % (record.get_tag(), position)
+
+
+def _get_texts(element, texts):
+    """Appends the values of all elements with a tag listed in `TEXT_TAGS` below an element
+    :type element: Element
+    :type texts: list of str
+    """
+    for child in element.get_child_elements():
+        if child.get_tag() in TEXT_TAGS:
+            value = child.get_value()
+            if not (value.startswith('@') and value.endswith('@')):
+                texts.append(child.get_multi_line_value())
+        if child.get_child_elements():
+            _get_texts(child, texts)
+
+
+def get_record_terms(record):
+    """Returns the positions of every term within the text of a record as `dict` of lists
+
+    Each indexed value starts one position after the end of the previous one, so phrases do not
+    match across values.
+
+    :type record: Element
+    :rtype: dict of list
+    """
+    texts = []
+    if record.get_tag() in TEXT_TAGS:
+        value = record.get_value()
+        if not (value.startswith('@') and value.endswith('@')):
+            texts.append(record.get_multi_line_value())
+    _get_texts(record, texts)
+
+    positions = {}
+    position = 0
+    for text in texts:
+        for term in get_terms(text):
+            term_positions = positions.get(term)
+            if term_positions is None:
+                positions[term] = [position]
+            else:
+                term_positions.append(position)
+            position += 1
+        position += 1
+    return positions
+
+
+class TextIndex(object):
+    """Inverted index mapping every term to the records containing it along with its positions"""
+
+    def __init__(self):
+        self.__records = {}
+        self.__order = {}
+        self.__record_terms = {}
+        self.__postings = {}
+        self.__sorted_terms = None
+        # Keys of the indexed records without pointer, by id of the record
+        self.__keys_without_pointer = {}
+
+    def __get_key(self, record):
+        """Returns the key of a record, `None` for records without pointer not indexed
+        :type record: Element
+        :rtype: str
+        """
+        return record.get_pointer() or self.__keys_without_pointer.get(id(record))
+
+    def add_record(self, record, position=None):
+        """Indexes the text of a record, replacing the text indexed for it before
+
+        Records without pointer are told apart by their `position` among all records, see
+        `gedcom.text_index.get_record_key()`. It defaults to the number of records indexed so far.
+
+        :type record: Element
+        :type position: int
+        """
+        key = self.__get_key(record)
+        if key is None:
+            if position is None:
+                position = len(self.__order)
+            key = get_record_key(record, position)
+            while key in self.__records:
+                position += 1
+                key = get_record_key(record, position)
+            self.__keys_without_pointer[id(record)] = key
+        elif key in self.__records:
+            self.remove_record(record)
+            if not record.get_pointer():
+                self.__keys_without_pointer[id(record)] = key
+        positions = get_record_terms(record)
+
+        self.__records[key] = record
+        self.__order.setdefault(key, len(self.__order))
+        self.__record_terms[key] = list(positions)
+        for term, term_positions in positions.items():
+            postings = self.__postings.get(term)
+            if postings is None:
+                self.__postings[term] = {key: term_positions}
+                self.__sorted_terms = None
+            else:
+                postings[key] = term_positions
+
+    def remove_record(self, record):
+        """Removes a record from the index, if indexed
+        :type record: Element
+        """
+        key = self.__get_key(record)
+        if key not in self.__records:
+            return
+
+        del self.__records[key]
+        self.__keys_without_pointer.pop(id(record), None)
+        for term in self.__record_terms.pop(key):
+            postings = self.__postings[term]
+            del postings[key]
+            if not postings:
+                del self.__postings[term]
+                self.__sorted_terms = None
+
+    def update_record(self, record):
+        """Indexes the current text of a record after it was edited
+        :type record: Element
+        """
+        self.add_record(record)
+
+    def get_records(self):
+        """Returns all indexed records
+        :rtype: list of Element
+        """
+        return list(self.__records.values())
+
+    def get_terms(self):
+        """Returns all indexed terms in sorted order
+        :rtype: list of str
+        """
+        if self.__sorted_terms is None:
+            self.__sorted_terms = sorted(self.__postings)
+        return self.__sorted_terms
+
+    def get_positions(self, record):
+        """Returns the positions of every term within the indexed text of a record
+        :type record: Element
+        :rtype: dict of list
+        """
+        key = self.__get_key(record)
+        return {term: self.__postings[term][key] for term in self.__record_terms.get(key, ())}
+
+    def __to_records(self, keys):
+        """Returns the records of the given keys in the order they were indexed
+        :type keys: set of str
+        :rtype: list of Element
+        """
+        return [self.__records[key] for key in sorted(keys, key=self.__order.__getitem__)]
+
+    def __find_keys(self, terms):
+        """Returns the keys of the records containing all terms
+        :type terms: list of str
+        :rtype: set of str
+        """
+        keys = None
+        for term in sorted(terms, key=lambda term: len(self.__postings.get(term, ()))):
+            postings = self.__postings.get(term)
+            if not postings:
+                return set()
+            keys = set(postings) if keys is None else keys.intersection(postings)
+            if not keys:
+                break
+        return keys or set()
+
+    def find(self, text):
+        """Returns the records containing every term of a text, in any order
+        :type text: str
+        :rtype: list of Element
+        """
+        return self.__to_records(self.__find_keys(get_terms(text)))
+
+    def find_phrase(self, phrase):
+        """Returns the records containing the terms of a phrase next to each other and in order
+        :type phrase: str
+        :rtype: list of Element
+        """
+        terms = get_terms(phrase)
+        keys = set()
+        for key in self.__find_keys(terms):
+            positions = [self.__postings[term][key] for term in terms]
+            following_positions = [set(term_positions) for term_positions in positions[1:]]
+            for start in positions[0]:
+                if all(start + offset in term_positions
+                       for offset, term_positions in enumerate(following_positions, 1)):
+                    keys.add(key)
+                    break
+        return self.__to_records(keys)
+
+    def find_prefix(self, prefix):
+        """Returns the records containing a term starting with a prefix
+        :type prefix: str
+        :rtype: list of Element
+        """
+        prefix = fold(prefix)
+        terms = self.get_terms()
+        keys = set()
+        for index in range(bisect_left(terms, prefix), len(terms)):
+            if not terms[index].startswith(prefix):
+                break
+            keys.update(self.__postings[terms[index]])
+        return self.__to_records(keys)
+
+    def save(self, file_path):
+        """Writes the index as JSON to a file
+        :type file_path: str
+        """
+        data = {
+            "version": FILE_FORMAT_VERSION,
+            "records": sorted(self.__records, key=self.__order.__getitem__),
+            "postings": self.__postings,
+        }
+        with open(file_path, "w", encoding="utf-8") as index_file:
+            index_file.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+    def load(self, file_path, records):
+        """Replaces the content of this index with an index saved to a file, attaching it to the given records
+
+        Records are matched by pointer, or by tag and position for records without pointer. Indexed records
+        missing from `records` are dropped. Records edited since saving the index have to be
+        updated with `gedcom.text_index.TextIndex.update_record()`.
+
+        :type file_path: str
+        :type records: list of Element
+        """
+        with open(file_path, encoding="utf-8") as index_file:
+            data = json.load(index_file)
+        if not isinstance(data, dict) or data.get("version") != FILE_FORMAT_VERSION:
+            raise TextIndexFormatError("File %s is not a text index of version %d" % (file_path, FILE_FORMAT_VERSION))
+
+        records_by_key = {}
+        for position, record in enumerate(records):
+            records_by_key.setdefault(get_record_key(record, position), record)
+
+        self.__records = {}
+        self.__keys_without_pointer = {}
+        self.__order = {}
+        self.__record_terms = {}
+        for key in data["records"]:
+            record = records_by_key.get(key)
+            if record is not None:
+                self.__records[key] = record
+                if not record.get_pointer():
+                    self.__keys_without_pointer[id(record)] = key
+                self.__order[key] = len(self.__order)
+                self.__record_terms[key] = []
+
+        self.__postings = {}
+        self.__sorted_terms = None
+        for term, postings in data["postings"].items():
+            for key in list(postings):
+                record_terms = self.__record_terms.get(key)
+                if record_terms is None:
+                    del postings[key]
+                else:
+                    record_terms.append(term)
+            if postings:
+                self.__postings[term] = postings
+
+
+def build_text_index(records):
+    """Builds the full-text index of the given logical records
+    :type records: list of Element
+    :rtype: TextIndex
+    """
+    text_index = TextIndex()
+    for position, record in enumerate(records):
+        text_index.add_record(record, position)
+    return text_index
+
+
+def load_text_index(file_path, records):
+    """Reads an index saved by `gedcom.text_index.TextIndex.save()`, see `gedcom.text_index.TextIndex.load()`
+    :type file_path: str
+    :type records: list of Element
+    :rtype: TextIndex
+    """
+    text_index = TextIndex()
+    text_index.load(file_path, records)
+    return text_index
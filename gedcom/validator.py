@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Python GEDCOM Parser
+#
+# Copyright (C) 2018 Damon Brodie (damon.brodie at gmail.com)
+# Copyright (C) 2018-2019 Nicklas Reincke (contact at reynke.com)
+# Copyright (C) 2016 Andreas Oberritter
+# Copyright (C) 2012 Madeleine Price Ball
+# Copyright (C) 2005 Daniel Zappala (zappala at cs.byu.edu)
+# Copyright (C) 2005 Brigham Young University
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Further information about the license: http://www.gnu.org/licenses/gpl-2.0.html
+
+"""
+Streaming validation of GEDCOM 5.5 data, without building the element tree.
+
+The validator reads the data once, line by line, using the same line grammar as `gedcom.parser.Parser`.
+Instead of stopping at the first problem it reports every problem found, along with its line number.
+Only the pointers of records and pointers referenced by values are held in memory.
+
+```python
+import gedcom.validator
+
+problems = gedcom.validator.validate_file(file_path)
+for problem in problems:
+    print(problem.get_line_number(), problem.get_code(), problem.get_message())
+```
+
+Or from the command line, exiting with `1` if any problem was found:
+
+```
+python -m gedcom.validator upload.ged
+```
+"""
+
+import argparse
+import re as regex
+import sys
+from gedcom.parser import LAST_LINE_PATTERN, LINE_PATTERN
+import gedcom.tags
+
+PROBLEM_MALFORMED_LINE = "malformed_line"
+PROBLEM_LEVEL_JUMP = "level_jump"
+PROBLEM_LINE_TOO_LONG = "line_too_long"
+PROBLEM_DUPLICATE_POINTER = "duplicate_pointer"
+PROBLEM_DANGLING_POINTER = "dangling_pointer"
+PROBLEM_MISSING_HEADER = "missing_header"
+PROBLEM_MISSING_TRAILER = "missing_trailer"
+PROBLEM_RECORD_AFTER_TRAILER = "record_after_trailer"
+
+MAX_LINE_LENGTH = 255
+"""Maximum length of a line without its end of line, as defined by GEDCOM 5.5"""
+
+POINTER_REFERENCE_PATTERN = regex.compile('^@[^@#][^@]*@$')
+"""Values matching this pattern reference the record with this pointer, escapes like `@#DJULIAN@` do not"""
+
+
+class ValidationProblem(object):
+    """A problem found within GEDCOM data"""
+
+    def __init__(self, line_number, code, message):
+        self.__line_number = line_number
+        self.__code = code
+        self.__message = message
+
+    def get_line_number(self):
+        """:rtype: int"""
+        return self.__line_number
+
+    def get_code(self):
+        """Returns one of the `PROBLEM_*` constants of `gedcom.validator`
+        :rtype: str
+        """
+        return self.__code
+
+    def get_message(self):
+        """:rtype: str"""
+        return self.__message
+
+    def __str__(self):
+        return "Line %d: %s" % (self.__line_number, self.__message)
+
+
+def iter_problems(gedcom_stream, strict=True, max_line_length=MAX_LINE_LENGTH):
+    """Reads a stream, or an array of lines, of GEDCOM 5.5 formatted data and yields every problem found
+
+    Problems within single lines are yielded as soon as the line has been read. Dangling pointers and
+    a missing trailer can only be known at the end of the data, so they are yielded last. With `strict`
+    set to `False` a last line without end of line is accepted, as it is by `gedcom.parser.Parser`.
+
+    :type gedcom_stream: a file stream, or bytes array of lines with new line at the end
+    :type strict: bool
+    :type max_line_length: int
+    :rtype: generator of ValidationProblem
+    """
+    defined_pointers = set()
+    referenced_pointers = {}
+
+    line_number = 0
+    last_level = -1
+    has_record = False
+    has_trailer = False
+
+    for line in gedcom_stream:
+        line_number += 1
+
+        try:
+            line = line.decode('utf-8-sig' if line_number == 1 else 'utf-8')
+        except UnicodeDecodeError as error:
+            yield ValidationProblem(line_number, PROBLEM_MALFORMED_LINE, "Line is not UTF-8 encoded: %s" % error)
+            continue
+
+        if len(line.rstrip('\r\n')) > max_line_length:
+            yield ValidationProblem(line_number, PROBLEM_LINE_TOO_LONG,
+                                    "Line is longer than %d characters" % max_line_length)
+
+        regex_match = LINE_PATTERN.match(line)
+        if regex_match is None and not strict:
+            regex_match = LAST_LINE_PATTERN.match(line)
+        if regex_match is None:
+            yield ValidationProblem(line_number, PROBLEM_MALFORMED_LINE, "Line violates GEDCOM format 5.5: %r" % line)
+            continue
+
+        line_parts = regex_match.groups()
+        level = int(line_parts[0])
+        pointer = line_parts[1].rstrip(' ')
+        tag = line_parts[2]
+        value = line_parts[3][1:]
+
+        if level > last_level + 1:
+            yield ValidationProblem(line_number, PROBLEM_LEVEL_JUMP,
+                                    "Level %d follows level %d, levels may only increase by one" % (level, last_level))
+        last_level = level
+
+        if level == 0:
+            if not has_record and tag != gedcom.tags.GEDCOM_TAG_HEADER:
+                yield ValidationProblem(line_number, PROBLEM_MISSING_HEADER,
+                                        "Data starts with %s instead of %s" % (tag, gedcom.tags.GEDCOM_TAG_HEADER))
+            has_record = True
+            if has_trailer:
+                yield ValidationProblem(line_number, PROBLEM_RECORD_AFTER_TRAILER,
+                                        "Record %s follows the %s record" % (tag, gedcom.tags.GEDCOM_TAG_TRAILER))
+            has_trailer = tag == gedcom.tags.GEDCOM_TAG_TRAILER
+
+        if pointer:
+            if pointer in defined_pointers:
+                yield ValidationProblem(line_number, PROBLEM_DUPLICATE_POINTER, "Pointer %s is already defined" % pointer)
+            defined_pointers.add(pointer)
+
+        if value and value[0] == '@' and POINTER_REFERENCE_PATTERN.match(value):
+            referenced_pointers.setdefault(value, line_number)
+
+    if line_number == 0:
+        yield ValidationProblem(1, PROBLEM_MISSING_HEADER, "Data is empty")
+        return
+
+    if not has_record:
+        yield ValidationProblem(line_number, PROBLEM_MISSING_HEADER, "Data contains no record")
+
+    for pointer, reference_line_number in sorted(referenced_pointers.items(), key=lambda item: item[1]):
+        if pointer not in defined_pointers:
+            yield ValidationProblem(reference_line_number, PROBLEM_DANGLING_POINTER,
+                                    "Pointer %s references no record" % pointer)
+
+    if not has_trailer:
+        yield ValidationProblem(line_number, PROBLEM_MISSING_TRAILER,
+                                "Data does not end with a %s record" % gedcom.tags.GEDCOM_TAG_TRAILER)
+
+
+def validate(gedcom_stream, strict=True, max_line_length=MAX_LINE_LENGTH):
+    """Returns every problem found within a stream, see `gedcom.validator.iter_problems()`
+    :type gedcom_stream: a file stream, or bytes array of lines with new line at the end
+    :type strict: bool
+    :type max_line_length: int
+    :rtype: list of ValidationProblem
+    """
+    return list(iter_problems(gedcom_stream, strict, max_line_length))
+
+
+def validate_file(file_path, strict=True, max_line_length=MAX_LINE_LENGTH):
+    """Returns every problem found within a file, see `gedcom.validator.iter_problems()`
+    :type file_path: str
+    :type strict: bool
+    :type max_line_length: int
+    :rtype: list of ValidationProblem
+    """
+    with open(file_path, 'rb') as gedcom_stream:
+        return validate(gedcom_stream, strict, max_line_length)
+
+
+def main(arguments=None):
+    """Command line entry point, writes one problem per line to stdout
+    :type arguments: list of str
+    :rtype: int
+    """
+    argument_parser = argparse.ArgumentParser(prog="python -m gedcom.validator",
+                                              description="Validate GEDCOM 5.5 files without parsing them.")
+    argument_parser.add_argument("files", nargs="+", help="GEDCOM files to validate")
+    argument_parser.add_argument("--no-strict", action="store_true", help="accept a last line without end of line")
+    options = argument_parser.parse_args(arguments)
+
+    problems_found = False
+    for file_path in options.files:
+        with open(file_path, 'rb') as gedcom_stream:
+            for problem in iter_problems(gedcom_stream, not options.no_strict):
+                problems_found = True
+                sys.stdout.write("%s:%d: %s: %s\n" % (file_path, problem.get_line_number(), problem.get_code(),
+                                                      problem.get_message()))
+
+    return 1 if problems_found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
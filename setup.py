@@ -30,11 +30,17 @@ setup(
         'Programming Language :: Python :: 3.8',
     ],
     keywords='python gedcom parser',
-    packages=find_packages(exclude=['contrib', 'docs', 'tests']),
+    packages=find_packages(exclude=['benchmarks', 'contrib', 'docs', 'tests']),
     install_requires=[],
     extras_require={
         'dev': ['setuptools', 'wheel', 'twine', 'pdoc3'],
         'test': ['tox'],
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': [
+            'gedcom-batch=gedcom.batch:main',
+        ],
     },
     package_data={},
     data_files=[],
@@ -0,0 +1,8 @@
+from gedcom.parser import Parser
+
+
+def parse_lines(lines, line_ending="\n", **options):
+    """Returns a parser holding the given GEDCOM lines, each given without its line ending"""
+    parser = Parser()
+    parser.parse(((line + line_ending).encode('utf-8') for line in lines), **options)
+    return parser
@@ -1,6 +1,61 @@
-from gedcom.element.element import Element
+import pytest
+from gedcom.element.element import Element, FrozenElementError, get_element_class
+from gedcom.element.individual import IndividualElement
 
 
 def test_initialization():
     element = Element(level=-1, pointer="", tag="", value="")
     assert isinstance(element, Element)
+
+
+def test_set_multi_line_value():
+    value = "First line " + "x" * 600 + "\nSecond line\n\nFourth line"
+    element = Element(level=1, pointer="", tag="NOTE", value=value)
+
+    for line in element.to_gedcom_string(True).splitlines():
+        assert len(line) <= 255
+
+    tags = [child.get_tag() for child in element.get_child_elements()]
+    assert tags == ["CONC", "CONC", "CONT", "CONT", "CONT"]
+    assert element.get_multi_line_value() == value
+
+
+def test_get_multi_line_value_cache():
+    element = Element(level=1, pointer="", tag="NOTE", value="First")
+    assert element.get_multi_line_value() == "First"
+
+    continuation = element.new_child_element(tag="CONT", value="Second")
+    assert element.get_multi_line_value() == "First\nSecond"
+
+    continuation.set_value("Changed")
+    assert element.get_multi_line_value() == "First\nChanged"
+
+    element.set_multi_line_value("Replaced")
+    assert element.get_multi_line_value() == "Replaced"
+    assert len(element.get_child_elements()) == 0
+
+
+def test_freeze():
+    element = Element(level=0, pointer="@N1@", tag="NOTE", value="First\nSecond")
+    copied_element = element.copy()
+    element.freeze()
+
+    assert element.is_frozen()
+    assert element.get_child_elements()[0].is_frozen()
+    assert element.get_multi_line_value() == "First\nSecond"
+
+    with pytest.raises(FrozenElementError):
+        element.set_multi_line_value("Third")
+    with pytest.raises(FrozenElementError):
+        element.get_child_elements()[0].set_value("Third")
+
+    assert not copied_element.is_frozen()
+    copied_element.set_multi_line_value("Third")
+    assert copied_element.get_multi_line_value() == "Third"
+    assert element.get_multi_line_value() == "First\nSecond"
+
+
+def test_get_element_class():
+    assert get_element_class('INDI') is IndividualElement
+    assert get_element_class('NAME') is Element
+    assert isinstance(Element(0, '', 'ROOT', '').new_child_element('INDI', '@I1@'), IndividualElement)
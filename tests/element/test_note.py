@@ -0,0 +1,18 @@
+from gedcom.element.element import Element
+from gedcom.element.note import NoteElement
+import gedcom.tags
+
+
+def test_initialization():
+    note_element = NoteElement(level=-1, pointer="", tag=gedcom.tags.GEDCOM_TAG_NOTE, value="")
+    assert isinstance(note_element, Element)
+    assert isinstance(note_element, NoteElement)
+
+
+def test_get_text():
+    element = NoteElement(level=0, pointer="@N1@", tag="NOTE", value="First line\nSecond line")
+    assert element.get_text() == "First line\nSecond line"
+    assert not element.is_reference()
+
+    reference = Element(level=0, pointer="@I1@", tag="INDI", value="").new_child_element(tag="NOTE", value="@N1@")
+    assert reference.is_reference()
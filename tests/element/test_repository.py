@@ -0,0 +1,19 @@
+from gedcom.element.element import Element
+from gedcom.element.repository import RepositoryElement
+import gedcom.tags
+
+
+def test_initialization():
+    repository_element = RepositoryElement(level=-1, pointer="", tag=gedcom.tags.GEDCOM_TAG_REPOSITORY, value="")
+    assert isinstance(repository_element, Element)
+    assert isinstance(repository_element, RepositoryElement)
+
+
+def test_accessors():
+    element = RepositoryElement(level=0, pointer="@R1@", tag="REPO", value="")
+    element.new_child_element(tag="NAME", value="Archiv")
+    element.new_child_element(tag="ADDR", value="Musterstraße 1\nMusterstadt")
+
+    assert element.get_name() == "Archiv"
+    assert element.get_address() == "Musterstraße 1\nMusterstadt"
+    assert element.get_call_number() == ""
@@ -0,0 +1,36 @@
+from gedcom.element.element import Element
+from gedcom.element.repository import RepositoryElement
+from gedcom.element.source import SourceElement
+import gedcom.tags
+
+
+def test_initialization():
+    source_element = SourceElement(level=-1, pointer="", tag=gedcom.tags.GEDCOM_TAG_SOURCE, value="")
+    assert isinstance(source_element, Element)
+    assert isinstance(source_element, SourceElement)
+
+
+def test_accessors():
+    element = SourceElement(level=0, pointer="@S1@", tag="SOUR", value="")
+    element.new_child_element(tag="TITL", value="Kirchenbuch " + "x" * 300)
+    element.new_child_element(tag="AUTH", value="Pfarramt")
+    element.new_child_element(tag="PUBL", value="Musterstadt, 1800")
+    repository = element.new_child_element(tag="REPO", value="@R1@")
+    repository.new_child_element(tag="CALN", value="KB-1")
+
+    assert not element.is_citation()
+    assert element.get_title() == "Kirchenbuch " + "x" * 300
+    assert element.get_author() == "Pfarramt"
+    assert element.get_publication() == "Musterstadt, 1800"
+    assert element.get_text() == ""
+    assert element.get_repository_pointer() == "@R1@"
+    assert element.get_call_number() == "KB-1"
+    assert isinstance(repository, RepositoryElement)
+    assert repository.get_call_number() == "KB-1"
+
+    citation = Element(level=0, pointer="@I1@", tag="INDI", value="").new_child_element(tag="SOUR", value="@S1@")
+    citation.new_child_element(tag="PAGE", value="p. 12")
+    citation.new_child_element(tag="QUAY", value="3")
+    assert citation.is_citation()
+    assert citation.get_page() == "p. 12"
+    assert citation.get_quality() == "3"
@@ -0,0 +1,118 @@
+import pytest
+import gedcom.ahnentafel
+from tests import parse_lines
+
+# I1 is the child of cousins I2 and I3, whose fathers I4 and I5 are brothers, sons of I6 and I7.
+# I1 was also adopted by I8.
+GEDCOM_LINES = (
+    "0 HEAD",
+    "0 @I1@ INDI",
+    "1 FAMC @F1@",
+    "1 FAMC @F5@",
+    "0 @I2@ INDI",
+    "1 FAMC @F2@",
+    "0 @I3@ INDI",
+    "1 FAMC @F3@",
+    "0 @I4@ INDI",
+    "1 FAMC @F4@",
+    "0 @I5@ INDI",
+    "1 FAMC @F4@",
+    "0 @I6@ INDI",
+    "0 @I7@ INDI",
+    "0 @I8@ INDI",
+    "0 @F1@ FAM",
+    "1 HUSB @I2@",
+    "1 WIFE @I3@",
+    "1 CHIL @I1@",
+    "2 _FREL Natural",
+    "2 _MREL Natural",
+    "0 @F2@ FAM",
+    "1 HUSB @I4@",
+    "1 CHIL @I2@",
+    "2 _FREL Natural",
+    "0 @F3@ FAM",
+    "1 HUSB @I5@",
+    "1 CHIL @I3@",
+    "2 _FREL Natural",
+    "0 @F4@ FAM",
+    "1 HUSB @I6@",
+    "1 WIFE @I7@",
+    "1 CHIL @I4@",
+    "2 _FREL Natural",
+    "2 _MREL Natural",
+    "1 CHIL @I5@",
+    "2 _FREL Natural",
+    "2 _MREL Natural",
+    "0 @F5@ FAM",
+    "1 HUSB @I8@",
+    "1 CHIL @I1@",
+    "2 _FREL Adopted",
+    "0 TRLR",
+)
+
+
+def get_numbers(numbering, parser):
+    return {pointer: numbering.get_numbers(parser.get_element_dictionary()[pointer])
+            for pointer in ("@I1@", "@I2@", "@I3@", "@I4@", "@I5@", "@I6@", "@I7@", "@I8@")}
+
+
+def test_pedigree_collapse():
+    parser = parse_lines(GEDCOM_LINES)
+    numbering = gedcom.ahnentafel.number_ancestors(parser, parser.get_element_dictionary()["@I1@"])
+
+    assert get_numbers(numbering, parser) == {
+        "@I1@": [1], "@I2@": [2], "@I3@": [3], "@I4@": [4], "@I5@": [6],
+        "@I6@": [8, 12], "@I7@": [9, 13], "@I8@": [2],
+    }
+    assert [individual.get_pointer() for individual in numbering.get_individuals(2)] == ["@I2@", "@I8@"]
+    assert [individual.get_pointer() for individual in numbering.get_collapsed_ancestors()] == ["@I6@", "@I7@"]
+    assert [individual.get_pointer() for individual in numbering.get_ancestors(2)] == ["@I4@", "@I5@"]
+    assert numbering.get_generations(parser.get_element_dictionary()["@I6@"]) == [3]
+    assert numbering.get_generation(parser.get_element_dictionary()["@I5@"]) == 2
+    assert numbering.get_max_generation() == 3
+    assert [number for number, individual in numbering.iter_numbers()] == [1, 2, 2, 3, 4, 6, 8, 9, 12, 13]
+
+
+def test_natural_parents_and_max_generations():
+    parser = parse_lines(GEDCOM_LINES)
+    proband = parser.get_element_dictionary()["@I1@"]
+
+    numbering = gedcom.ahnentafel.number_ancestors(parser, proband, gedcom.ahnentafel.PARENT_TYPE_NATURAL)
+    numbers = get_numbers(numbering, parser)
+    assert numbers["@I8@"] == []
+    assert numbers["@I6@"] == [8, 12]
+    assert numbers["@I7@"] == [9, 13]
+
+    numbering = gedcom.ahnentafel.number_ancestors(parser, proband, max_generations=1)
+    assert [number for number, individual in numbering.iter_numbers()] == [1, 2, 2, 3]
+    assert numbering.get_generation(parser.get_element_dictionary()["@I4@"]) is None
+
+
+def test_ancestor_loop():
+    lines = list(GEDCOM_LINES)
+    lines.insert(lines.index("0 @I7@ INDI") - 1, "1 FAMC @F1@")
+    parser = parse_lines(lines)
+
+    with pytest.raises(gedcom.ahnentafel.AncestorLoopError):
+        gedcom.ahnentafel.number_ancestors(parser, parser.get_element_dictionary()["@I1@"])
+
+
+def test_ancestor_loop_in_large_pedigree():
+    # Full pedigree of 14 generations, the last ancestor being listed as child of the proband's parents
+    count = 2 ** 14 - 1
+    lines = ["0 HEAD"]
+    for index in range(1, count + 1):
+        lines.append("0 @I%d@ INDI" % index)
+        if 2 * index < count:
+            lines.append("1 FAMC @F%d@" % index)
+    lines.append("1 FAMC @F1@")
+    for index in range(1, count // 2 + 1):
+        lines.extend(["0 @F%d@ FAM" % index, "1 HUSB @I%d@" % (2 * index), "1 WIFE @I%d@" % (2 * index + 1),
+                      "1 CHIL @I%d@" % index])
+    lines.append("0 TRLR")
+    parser = parse_lines(lines)
+    numberer = gedcom.ahnentafel.AhnentafelNumberer(parser)
+
+    with pytest.raises(gedcom.ahnentafel.AncestorLoopError):
+        numberer.number(parser.get_element_dictionary()["@I1@"])
+    assert numberer.number(parser.get_element_dictionary()["@I%d@" % (count // 2 + 1)]).get_max_generation() == 0
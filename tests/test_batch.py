@@ -0,0 +1,74 @@
+import os
+import threading
+import json
+from gedcom.parser import Parser
+import gedcom.batch
+
+
+def count_individuals(parser):
+    return len([element for element in parser.get_root_child_elements() if element.get_tag() == 'INDI'])
+
+
+def test_run_batch(tmp_path):
+    broken_file_path = str(tmp_path / 'broken.ged')
+    with open(broken_file_path, 'w') as broken_file:
+        broken_file.write("0 HEAD\n2 BROKEN\n")
+
+    file_paths = ['tests/files/*.ged', broken_file_path]
+    for processes in (1, 2):
+        results = gedcom.batch.run_batch(file_paths, count_individuals, processes=processes, files_per_worker=1)
+
+        assert [result.get_file_path() for result in results] == ['tests/files/Musterstammbaum.ged', broken_file_path]
+        assert results[0].is_successful()
+        assert results[0].get_result() == 20
+        assert results[0].get_seconds() > 0
+        assert not results[1].is_successful()
+        assert 'GedcomFormatViolationError' in results[1].get_error()
+
+
+def test_element_statistics():
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+
+    assert gedcom.batch.element_statistics(parser) == {
+        "elements": 396,
+        "records": 34,
+        "individuals": 20,
+        "families": 11,
+    }
+
+
+def test_main(capsys):
+    assert gedcom.batch.main(['--processes', '1', 'tests/files/Musterstammbaum.ged']) == 0
+
+    result = json.loads(capsys.readouterr().out)
+    assert result["file"] == 'tests/files/Musterstammbaum.ged'
+    assert result["result"]["individuals"] == 20
+    assert result["error"] is None
+
+
+def unpicklable_result(parser):
+    return threading.Lock()
+
+
+def crash_on_broken_file(parser):
+    if parser.get_root_child_elements()[-1].get_tag() == 'BROKEN':
+        os._exit(1)
+    return count_individuals(parser)
+
+
+def test_run_batch_failing_workers(tmp_path):
+    broken_file_path = str(tmp_path / 'broken.ged')
+    with open(broken_file_path, 'w') as broken_file:
+        broken_file.write("0 HEAD\n0 BROKEN\n")
+
+    results = gedcom.batch.run_batch('tests/files/*.ged', unpicklable_result, processes=2)
+    assert len(results) == 1
+    assert not results[0].is_successful()
+    assert 'pickle' in results[0].get_error()
+
+    file_paths = [broken_file_path, 'tests/files/Musterstammbaum.ged']
+    results = gedcom.batch.run_batch(file_paths, crash_on_broken_file, processes=2, files_per_worker=2)
+    assert not results[0].is_successful()
+    assert 'terminated abruptly' in results[0].get_error()
+    assert [result.get_result() for result in results[1:]] == [20]
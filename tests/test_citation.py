@@ -0,0 +1,34 @@
+import gedcom.generator
+from gedcom.element.source import SourceElement
+from gedcom.parser import Parser
+
+
+def test_citation_index():
+    parser = Parser()
+    parser.parse(line.encode('utf-8') for line in gedcom.generator.iter_gedcom_lines(300, seed=2))
+    citation_index = parser.get_citation_index()
+
+    assert citation_index is parser.get_citation_index()
+
+    citation_count = 0
+    for element in parser.get_element_list():
+        if element.get_tag() == 'SOUR' and element.get_value().startswith('@'):
+            citation_count += 1
+
+    indexed_count = 0
+    for source_pointer in citation_index.get_source_pointers():
+        assert isinstance(citation_index.get_source(source_pointer), SourceElement)
+        for citation in citation_index.get_citations(source_pointer):
+            indexed_count += 1
+            assert citation.get_citation_element().get_value() == source_pointer
+            assert citation.get_record().get_level() == 0
+            assert citation.get_cited_element() is citation.get_citation_element().get_parent_element()
+            assert citation.get_page().startswith('p. ')
+            assert citation.get_quality() in ('0', '1', '2', '3')
+        assert citation_index.get_cited_records(source_pointer)
+
+    assert indexed_count == citation_count > 0
+    assert citation_index.get_citations('@UNKNOWN@') == []
+
+    parser.invalidate_cache()
+    assert citation_index is not parser.get_citation_index()
@@ -0,0 +1,79 @@
+from gedcom.parser import Parser
+import gedcom.dedup
+from tests import parse_lines
+
+DUPLICATES = b"""0 @D1@ INDI
+1 NAME Max /Mustermann/
+1 SEX M
+1 BIRT
+2 DATE 1 JAN 1810
+2 PLAC Musterstadt
+0 @D2@ INDI
+1 NAME Maximilian /Musterman/
+1 SEX M
+1 BIRT
+2 DATE 1811
+2 PLAC Musterstadt
+0 @D3@ INDI
+1 NAME Maximilian /Mustermann/
+1 SEX F
+1 BIRT
+2 DATE 1811
+0 @D4@ INDI
+1 NAME Anna /Meyer/
+1 SEX F
+1 BIRT
+2 DATE 1850
+0 @D5@ INDI
+1 NAME Anna /Maier/
+1 SEX F
+1 BIRT
+2 DATE 1852
+0 TRLR
+"""
+
+
+def test_find_duplicates():
+    parser = Parser()
+    parser.parse(line + b"\n" for line in DUPLICATES.split(b"\n") if line)
+
+    pairs = gedcom.dedup.find_duplicate_pairs(parser)
+    assert [(pair.get_first().get_pointer(), pair.get_second().get_pointer()) for pair in pairs] == [
+        ('@D1@', '@D2@'),
+        ('@D4@', '@D5@'),
+    ]
+    assert all(0.85 <= pair.get_score() < 1 for pair in pairs)
+
+    clusters = gedcom.dedup.find_duplicates(parser, threshold=0.6)
+    assert [[individual.get_pointer() for individual in cluster] for cluster in clusters] == [
+        ['@D1@', '@D2@'],
+        ['@D4@', '@D5@'],
+    ]
+
+    for max_block_size, processes in ((1, 1), (200, 2)):
+        assert [(pair.get_first(), pair.get_second()) for pair in pairs] == [
+            (pair.get_first(), pair.get_second())
+            for pair in gedcom.dedup.find_duplicate_pairs(parser, max_block_size=max_block_size, processes=processes)
+        ]
+
+
+def test_find_duplicates_with_unknown_birth_year_and_sex():
+    lines = []
+    for pointer, birth_date, sex in (("@I1@", "1900", "M"), ("@I2@", None, "M"), ("@I3@", None, "M"),
+                                     ("@I4@", "1901", None), ("@I5@", "1900", "F")):
+        lines.extend(["0 %s INDI" % pointer, "1 NAME John /Smith/"])
+        if sex:
+            lines.append("1 SEX %s" % sex)
+        lines.append("1 BIRT")
+        if birth_date:
+            lines.append("2 DATE %s" % birth_date)
+        lines.extend(["2 PLAC Berlin", "1 DEAT", "2 DATE 1970"])
+    lines.append("0 TRLR")
+    parser = parse_lines(lines)
+
+    for max_block_size in (200, 1):
+        pairs = gedcom.dedup.find_duplicate_pairs(parser, max_block_size=max_block_size)
+        assert [(pair.get_first().get_pointer(), pair.get_second().get_pointer()) for pair in pairs] == [
+            ('@I1@', '@I2@'), ('@I1@', '@I3@'), ('@I1@', '@I4@'),
+            ('@I2@', '@I3@'), ('@I2@', '@I4@'), ('@I3@', '@I4@'), ('@I4@', '@I5@'),
+        ]
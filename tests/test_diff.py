@@ -0,0 +1,82 @@
+from gedcom.parser import Parser
+import gedcom.diff
+
+case_base = """0 HEAD
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME First /Last/
+1 SEX M
+1 BIRT
+2 DATE 1 JAN 1900
+1 NOTE Some
+2 CONC thing
+0 @I2@ INDI
+1 NAME Second /Last/
+0 @I3@ INDI
+1 NAME Third /Last/
+0 TRLR
+"""
+
+
+def parse_records(string):
+    parser = Parser()
+    parser.parse([(line + '\n').encode('utf-8-sig') for line in string.splitlines()])
+    return parser.get_root_child_elements()
+
+
+def test_record_hash():
+    records = parse_records(case_base)
+    reordered = parse_records(case_base.replace("1 SEX M\n1 BIRT\n2 DATE 1 JAN 1900\n",
+                                                "1 BIRT\n2 DATE 1 JAN 1900\n1 SEX M\n"))
+    split = parse_records(case_base.replace("1 NOTE Some\n2 CONC thing\n", "1 NOTE Something\n"))
+    renamed = parse_records(case_base.replace("1 NAME First /Last/\n", "1 NAME First /Last/\n1 NAME Alias /Last/\n"))
+    reordered_names = parse_records(case_base.replace("1 NAME First /Last/\n", "1 NAME Alias /Last/\n1 NAME First /Last/\n"))
+
+    assert gedcom.diff.record_hash(records[1]) == gedcom.diff.record_hash(reordered[1])
+    assert gedcom.diff.record_hash(records[1]) == gedcom.diff.record_hash(split[1])
+    assert gedcom.diff.record_hash(renamed[1]) != gedcom.diff.record_hash(reordered_names[1])
+
+
+def test_diff_records():
+    case_new = (case_base
+                .replace("2 DATE 1 JAN 1900\n", "2 DATE 2 JAN 1900\n")
+                .replace("0 @I2@ INDI\n1 NAME Second /Last/\n", "")
+                .replace("0 @I3@ INDI\n", "0 @I30@ INDI\n")
+                .replace("0 TRLR\n", "0 @I4@ INDI\n1 NAME Fourth /Last/\n0 TRLR\n"))
+
+    record_diff = gedcom.diff.diff_records(parse_records(case_base), parse_records(case_new))
+
+    assert [record.get_pointer() for record in record_diff.get_added_records()] == ['@I4@']
+    assert [record.get_pointer() for record in record_diff.get_removed_records()] == ['@I2@']
+    assert [(old.get_pointer(), new.get_pointer()) for old, new in record_diff.get_renumbered_records()] == \
+        [('@I3@', '@I30@')]
+
+    changes = record_diff.get_changed_records()
+    assert len(changes) == 1
+    assert changes[0].get_new_record().get_pointer() == '@I1@'
+    assert [element.get_tag() for element in changes[0].get_removed_elements()] == ['BIRT']
+    assert changes[0].get_added_elements()[0].get_child_elements()[0].get_value() == '2 JAN 1900'
+
+    assert gedcom.diff.diff_records(parse_records(case_base), parse_records(case_base)).is_empty()
+
+
+def test_merge_records():
+    case_ours = case_base.replace("2 DATE 1 JAN 1900\n", "2 DATE 2 JAN 1900\n")
+    case_theirs = (case_base
+                   .replace("0 @I2@ INDI\n1 NAME Second /Last/\n", "")
+                   .replace("1 NAME Third /Last/\n", "1 NAME Third /Other/\n"))
+
+    record_merge = gedcom.diff.merge_records(parse_records(case_base), parse_records(case_ours),
+                                             parse_records(case_theirs))
+
+    assert not record_merge.has_conflicts()
+    merged = ''.join(record.to_gedcom_string(True) for record in record_merge.get_records())
+    assert "2 DATE 2 JAN 1900" in merged
+    assert "Second" not in merged
+    assert "Third /Other/" in merged
+
+    case_conflict = case_base.replace("2 DATE 1 JAN 1900\n", "2 DATE 3 JAN 1900\n")
+    record_merge = gedcom.diff.merge_records(parse_records(case_base), parse_records(case_ours),
+                                             parse_records(case_conflict))
+
+    assert [conflict.get_key() for conflict in record_merge.get_conflicts()] == ['@I1@']
@@ -0,0 +1,83 @@
+import io
+import gedcom.extract
+import gedcom.generator
+from gedcom.element.individual import IndividualElement
+from gedcom.parser import Parser
+
+
+def get_parser():
+    parser = Parser()
+    parser.parse(line.encode('utf-8') for line in gedcom.generator.iter_gedcom_lines(300, seed=3))
+    return parser
+
+
+def parse_extract(parser, individuals, **options):
+    output = io.StringIO()
+    gedcom.extract.write_extract(output, parser, individuals, **options)
+    extracted_parser = Parser()
+    extracted_parser.parse(io.BytesIO(output.getvalue().encode('utf-8')))
+    return extracted_parser
+
+
+def get_individual_pointers(parser):
+    return set(element.get_pointer() for element in parser.get_root_child_elements()
+               if isinstance(element, IndividualElement))
+
+
+def assert_no_dangling_pointers(parser):
+    element_dictionary = parser.get_element_dictionary()
+    for element in parser.get_element_list():
+        value = element.get_value()
+        if len(value) > 2 and value[0] == '@' and value[-1] == '@':
+            assert value in element_dictionary
+
+
+def test_extract_ancestors():
+    parser = get_parser()
+    individuals = [element for element in parser.get_root_child_elements() if isinstance(element, IndividualElement)]
+    individual = individuals[-1]
+
+    extracted_parser = parse_extract(parser, [individual], ancestors=None)
+    expected_pointers = set(ancestor.get_pointer() for ancestor in parser.get_ancestors(individual))
+    expected_pointers.add(individual.get_pointer())
+
+    assert get_individual_pointers(extracted_parser) == expected_pointers
+    assert extracted_parser.get_root_child_elements()[0].get_tag() == 'HEAD'
+    assert extracted_parser.get_root_child_elements()[-1].get_tag() == 'TRLR'
+    assert_no_dangling_pointers(extracted_parser)
+    assert any(element.get_tag() == 'SOUR' for element in extracted_parser.get_root_child_elements())
+
+    parents_parser = parse_extract(parser, [individual], ancestors=1)
+    expected_pointers = set(parent.get_pointer() for parent in parser.get_parents(individual))
+    expected_pointers.add(individual.get_pointer())
+    assert get_individual_pointers(parents_parser) == expected_pointers
+
+
+def test_extract_descendants():
+    parser = get_parser()
+    individual = parser.get_element_dictionary()["@I1@"]
+
+    extracted_parser = parse_extract(parser, [individual], descendants=2, spouses=False)
+    children = [child for family in parser.get_families(individual)
+                for child in parser.get_family_members(family, "CHIL")]
+    grandchildren = [grandchild for child in children for family in parser.get_families(child)
+                     for grandchild in parser.get_family_members(family, "CHIL")]
+    expected_pointers = set(element.get_pointer() for element in [individual] + children + grandchildren)
+
+    assert len(expected_pointers) > 1
+    assert get_individual_pointers(extracted_parser) == expected_pointers
+    assert_no_dangling_pointers(extracted_parser)
+
+    with_spouses_parser = parse_extract(parser, [individual], descendants=2)
+    assert get_individual_pointers(with_spouses_parser) > expected_pointers
+
+
+def test_renumber():
+    parser = get_parser()
+    individual = parser.get_element_dictionary()["@I1@"]
+
+    extracted_parser = parse_extract(parser, [individual], descendants=None, renumber=True)
+    individual_pointers = get_individual_pointers(extracted_parser)
+
+    assert individual_pointers == set("@I%d@" % number for number in range(1, len(individual_pointers) + 1))
+    assert_no_dangling_pointers(extracted_parser)
@@ -0,0 +1,34 @@
+import gedcom.generator
+from gedcom.element.family import FamilyElement
+from gedcom.element.individual import IndividualElement
+from gedcom.parser import Parser
+
+
+def test_iter_gedcom_lines():
+    lines = list(gedcom.generator.iter_gedcom_lines(500, generations=5, seed=7))
+
+    assert lines == list(gedcom.generator.iter_gedcom_lines(500, generations=5, seed=7))
+    assert lines != list(gedcom.generator.iter_gedcom_lines(500, generations=5, seed=8))
+    assert lines[0] == "0 HEAD\n"
+    assert lines[-1] == "0 TRLR\n"
+    assert max(len(line) for line in lines) <= 256
+    assert any(" CONC " in line for line in lines)
+    assert any(" CONT " in line for line in lines)
+    assert any(" _FREL " in line for line in lines)
+
+
+def test_write_gedcom_file(tmp_path):
+    file_path = str(tmp_path / 'synthetic.ged')
+    gedcom.generator.write_gedcom_file(file_path, 500, generations=5, seed=7)
+
+    parser = Parser()
+    parser.parse_file(file_path)
+    element_dictionary = parser.get_element_dictionary()
+    records = parser.get_root_child_elements()
+
+    assert len([record for record in records if isinstance(record, IndividualElement)]) == 500
+    for record in records:
+        if isinstance(record, FamilyElement):
+            for child in record.get_child_elements():
+                if child.get_tag() in ('HUSB', 'WIFE', 'CHIL'):
+                    assert child.get_value() in element_dictionary
@@ -0,0 +1,65 @@
+import io
+import json
+from gedcom.element.individual import IndividualElement
+from gedcom.parser import Parser
+import gedcom.jsonl
+from tests import parse_lines
+
+
+def test_write_jsonl():
+    output = io.StringIO()
+    with open('tests/files/Musterstammbaum.ged', 'rb') as gedcom_stream:
+        gedcom.jsonl.write_jsonl(Parser().iter_records(gedcom_stream), output)
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 34
+
+    individual = json.loads(lines[1])
+    assert individual["pointer"] == "@1@"
+    assert individual["tag"] == "INDI"
+    assert {"tag": "SEX", "value": "M"} in individual["children"]
+
+
+def test_write_jsonl_flatten():
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+
+    output = io.StringIO()
+    gedcom.jsonl.write_jsonl(parser.get_root_child_elements(), output, flatten=True)
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 20
+
+    individual = json.loads(lines[0])
+    assert individual["given_name"] == "Max"
+    assert individual["surname"] == "Mustermann"
+    assert individual["birth_date"] == "1 JAN 1980"
+
+
+def test_read_jsonl():
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+
+    lines = list(gedcom.jsonl.iter_jsonl(parser.get_root_child_elements()))
+    records = list(gedcom.jsonl.read_jsonl(lines))
+
+    assert len(records) == 34
+    assert isinstance(records[1], IndividualElement)
+    assert ''.join(record.to_gedcom_string(True) for record in records) == parser.to_gedcom_string(True)
+
+
+def test_read_jsonl_crlf():
+    lines = ["0 HEAD", "0 @I1@ INDI", "1 NAME Max /Mustermann/", "1 BIRT", "2 DATE 1 JAN 1980", "0 TRLR"]
+    parser = parse_lines(lines, "\r\n")
+
+    jsonl_lines = list(gedcom.jsonl.iter_jsonl(parser.get_root_child_elements()))
+    records = list(gedcom.jsonl.read_jsonl(jsonl_lines))
+
+    assert json.loads(jsonl_lines[1]) == {
+        "pointer": "@I1@", "tag": "INDI", "crlf": "\r\n", "children": [
+            {"tag": "NAME", "value": "Max /Mustermann/"},
+            {"tag": "BIRT", "children": [{"tag": "DATE", "value": "1 JAN 1980"}]},
+        ],
+    }
+    assert ''.join(record.to_gedcom_string(True) for record in records) == parser.to_gedcom_string(True)
+    assert parser.to_gedcom_string(True).count("\r\n") == len(lines)
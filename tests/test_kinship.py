@@ -0,0 +1,134 @@
+import pytest
+import gedcom.kinship
+from gedcom.ahnentafel import AncestorLoopError
+from tests import parse_lines
+
+# I4 and I5 are full siblings, children of I6 and I7, I12 is their half brother by I6 and I13.
+# I1 is the child of first cousins I2 and I3, I11 the child of siblings I4 and I5.
+GEDCOM_LINES = (
+    "0 HEAD",
+    "0 @I1@ INDI",
+    "1 FAMC @F1@",
+    "0 @I2@ INDI",
+    "1 FAMC @F2@",
+    "0 @I3@ INDI",
+    "1 FAMC @F3@",
+    "0 @I4@ INDI",
+    "1 FAMC @F4@",
+    "0 @I5@ INDI",
+    "1 FAMC @F4@",
+    "0 @I6@ INDI",
+    "0 @I7@ INDI",
+    "0 @I9@ INDI",
+    "0 @I10@ INDI",
+    "0 @I11@ INDI",
+    "1 FAMC @F5@",
+    "0 @I12@ INDI",
+    "1 FAMC @F6@",
+    "0 @I13@ INDI",
+    "0 @F1@ FAM",
+    "1 HUSB @I2@",
+    "1 WIFE @I3@",
+    "1 CHIL @I1@",
+    "0 @F2@ FAM",
+    "1 HUSB @I4@",
+    "1 WIFE @I9@",
+    "1 CHIL @I2@",
+    "0 @F3@ FAM",
+    "1 HUSB @I10@",
+    "1 WIFE @I5@",
+    "1 CHIL @I3@",
+    "0 @F4@ FAM",
+    "1 HUSB @I6@",
+    "1 WIFE @I7@",
+    "1 CHIL @I4@",
+    "1 CHIL @I5@",
+    "0 @F5@ FAM",
+    "1 HUSB @I4@",
+    "1 WIFE @I5@",
+    "1 CHIL @I11@",
+    "0 @F6@ FAM",
+    "1 HUSB @I6@",
+    "1 WIFE @I13@",
+    "1 CHIL @I12@",
+    "0 TRLR",
+)
+
+
+def test_topological_order():
+    parser = parse_lines(GEDCOM_LINES)
+    order = [individual.get_pointer() for individual in gedcom.kinship.KinshipCalculator(parser).get_order()]
+
+    assert len(order) == 12
+    assert order.index("@I6@") < order.index("@I4@") < order.index("@I2@") < order.index("@I1@")
+    assert order.index("@I5@") < order.index("@I11@")
+
+
+def test_inbreeding_coefficients():
+    parser = parse_lines(GEDCOM_LINES)
+    coefficients = {individual.get_pointer(): coefficient
+                    for individual, coefficient in gedcom.kinship.compute_inbreeding_coefficients(parser)}
+
+    assert coefficients["@I1@"] == pytest.approx(1 / 16)
+    assert coefficients["@I11@"] == pytest.approx(1 / 4)
+    assert coefficients["@I2@"] == 0
+    assert coefficients["@I6@"] == 0
+
+
+def test_kinship():
+    parser = parse_lines(GEDCOM_LINES)
+    element_dictionary = parser.get_element_dictionary()
+    calculator = gedcom.kinship.KinshipCalculator(parser)
+
+    def kinship(first, second):
+        return calculator.get_kinship(element_dictionary[first], element_dictionary[second])
+
+    assert kinship("@I6@", "@I4@") == pytest.approx(1 / 4)
+    assert kinship("@I4@", "@I5@") == pytest.approx(1 / 4)
+    assert kinship("@I4@", "@I12@") == pytest.approx(1 / 8)
+    assert kinship("@I2@", "@I3@") == pytest.approx(1 / 16)
+    assert kinship("@I6@", "@I7@") == 0
+    assert kinship("@I4@", "@I4@") == pytest.approx(1 / 2)
+    assert kinship("@I11@", "@I11@") == pytest.approx(5 / 8)
+    assert kinship("@I11@", "@I4@") == pytest.approx(3 / 8)
+    assert calculator.get_inbreeding(element_dictionary["@I1@"]) == pytest.approx(kinship("@I2@", "@I3@"))
+
+
+@pytest.mark.parametrize("use_numpy,max_dense_size", [
+    (False, gedcom.kinship.MAX_DENSE_PEDIGREE_SIZE),
+    (True, gedcom.kinship.MAX_DENSE_PEDIGREE_SIZE),
+    (True, 5),
+])
+def test_kinship_matrix(use_numpy, max_dense_size):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    parser = parse_lines(GEDCOM_LINES)
+    element_dictionary = parser.get_element_dictionary()
+    calculator = gedcom.kinship.KinshipCalculator(parser)
+    individuals = [element_dictionary[pointer] for pointer in ("@I11@", "@I1@", "@I4@", "@I12@")]
+
+    matrix = calculator.get_kinship_matrix(individuals, use_numpy, max_dense_size)
+
+    for row, first in enumerate(individuals):
+        for column, second in enumerate(individuals):
+            assert matrix[row][column] == pytest.approx(calculator.get_kinship(first, second))
+
+
+def test_ancestor_loop():
+    lines = (
+        "0 HEAD",
+        "0 @I1@ INDI",
+        "1 FAMC @F1@",
+        "0 @I2@ INDI",
+        "1 FAMC @F2@",
+        "0 @F1@ FAM",
+        "1 HUSB @I2@",
+        "1 CHIL @I1@",
+        "0 @F2@ FAM",
+        "1 HUSB @I1@",
+        "1 CHIL @I2@",
+        "0 TRLR",
+    )
+
+    with pytest.raises(AncestorLoopError):
+        gedcom.kinship.KinshipCalculator(parse_lines(lines))
@@ -0,0 +1,62 @@
+import pytest
+import gedcom.name_index
+from tests import parse_lines
+
+GEDCOM_LINES = (
+    "0 HEAD",
+    "0 @I1@ INDI",
+    "1 NAME Anna Maria /Schröder/",
+    "0 @I2@ INDI",
+    "1 NAME Hans /Schroeder/",
+    "0 @I3@ INDI",
+    "1 NAME Anna /Meyer/",
+    "1 NAME Anne /Maier/",
+    "0 @I4@ INDI",
+    "1 NAME",
+    "2 GIVN Katharina",
+    "2 SURN Moskowitz",
+    "0 @I5@ INDI",
+    "1 NAME Catherine /Mueller/",
+    "0 TRLR",
+)
+
+
+def get_pointers(individuals):
+    return [individual.get_pointer() for individual in individuals]
+
+
+def test_find():
+    parser = parse_lines(GEDCOM_LINES)
+    name_index = parser.get_name_index()
+
+    assert name_index is parser.get_name_index()
+    assert sorted(name_index.get_surnames()) == ["maier", "meyer", "moskowitz", "mueller", "schroder", "schroeder"]
+
+    assert get_pointers(name_index.find(surname="SCHRODER")) == ["@I1@"]
+    assert get_pointers(name_index.find(surname="Maier")) == ["@I3@"]
+    assert get_pointers(name_index.find(given_name="maria anna")) == ["@I1@"]
+    assert get_pointers(name_index.find(surname="Moskowitz", given_name="Katharina")) == ["@I4@"]
+
+    assert get_pointers(name_index.find(surname="Schroder", method=gedcom.name_index.MATCH_SOUNDEX)) == ["@I1@", "@I2@"]
+    assert get_pointers(name_index.find(surname="Meier", method=gedcom.name_index.MATCH_DAITCH_MOKOTOFF)) == ["@I3@"]
+    assert get_pointers(name_index.find(surname="Moskovitz", method=gedcom.name_index.MATCH_DAITCH_MOKOTOFF)) == ["@I4@"]
+    assert get_pointers(name_index.find(given_name="Kathryn", method=gedcom.name_index.MATCH_METAPHONE)) == ["@I4@", "@I5@"]
+
+    assert get_pointers(name_index.find(surname="Schrder", method=gedcom.name_index.MATCH_FUZZY, max_distance=1)) == ["@I1@"]
+    assert get_pointers(name_index.find(surname="Schrder", method=gedcom.name_index.MATCH_FUZZY)) == ["@I1@", "@I2@"]
+    assert name_index.find_similar_surnames("Meier", 1) == [("maier", 1), ("meyer", 1)]
+
+    assert name_index.find(surname="Unknown") == []
+
+    with pytest.raises(ValueError):
+        name_index.find()
+    with pytest.raises(ValueError):
+        name_index.find(surname="Meyer", method="unknown")
+
+
+def test_name_index_of_frozen_parser():
+    snapshot = parse_lines(GEDCOM_LINES).freeze()
+    name_index = snapshot.get_name_index()
+    assert snapshot.get_name_index() is name_index
+    assert get_pointers(name_index.find(surname="Meyer")) == ["@I3@"]
+    assert name_index.find_similar_surnames("Meier", 1) == [("maier", 1), ("meyer", 1)]
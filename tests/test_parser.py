@@ -1,6 +1,10 @@
+import asyncio
+import io
+import pytest
+from gedcom.element.element import Element, FrozenElementError, register_element_class, unregister_element_class
 from gedcom.element.individual import IndividualElement
 from gedcom.element.root import RootElement
-from gedcom.parser import Parser
+from gedcom.parser import FrozenParserError, Parser
 
 
 def test_initialization():
@@ -155,3 +159,203 @@ def test_to_gedcom_string():
 def test___parse_line():
     # @TODO Add appropriate testing cases
     pass
+
+
+def test_iter_records():
+    parser = Parser()
+
+    with open('tests/files/Musterstammbaum.ged', 'rb') as gedcom_stream:
+        records = list(parser.iter_records(gedcom_stream))
+
+    assert len(records) == 34
+    assert len(parser.get_root_child_elements()) == 0
+    assert records[0].get_tag() == 'HEAD'
+    assert records[-1].get_tag() == 'TRLR'
+    assert isinstance(records[1], IndividualElement)
+
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    assert ''.join(record.to_gedcom_string(True) for record in records) == parser.to_gedcom_string(True)
+
+
+class AsyncChunkStream(object):
+    """Asynchronous stream yielding data in chunks of a fixed size"""
+
+    def __init__(self, data, chunk_size):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.position = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.position >= len(self.data):
+            raise StopAsyncIteration
+        chunk = self.data[self.position:self.position + self.chunk_size]
+        self.position += self.chunk_size
+        return chunk
+
+
+class AsyncSink(object):
+    """Asynchronous sink collecting everything written to it"""
+
+    def __init__(self):
+        self.output = io.StringIO()
+
+    async def write(self, data):
+        self.output.write(data)
+
+
+def run_coroutine(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_parse_async():
+    with open('tests/files/Musterstammbaum.ged', 'rb') as gedcom_stream:
+        data = gedcom_stream.read()
+
+    parser = Parser()
+    run_coroutine(parser.parse_async(AsyncChunkStream(data, 100), lines_per_yield=10))
+
+    assert len(parser.get_element_list()) == 396
+    assert len(parser.get_root_child_elements()) == 34
+
+    expected_parser = Parser()
+    expected_parser.parse_file('tests/files/Musterstammbaum.ged')
+    assert parser.to_gedcom_string(True) == expected_parser.to_gedcom_string(True)
+
+
+def test_save_gedcom_async():
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+
+    sink = AsyncSink()
+    run_coroutine(parser.save_gedcom_async(sink, records_per_yield=5))
+
+    assert sink.output.getvalue() == parser.to_gedcom_string(True)
+
+
+def test_freeze():
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+
+    snapshot = parser.freeze()
+    assert snapshot.is_frozen()
+    assert not parser.is_frozen()
+    assert len(snapshot.get_element_list()) == 396
+    assert len(snapshot.get_element_dictionary()) == 32
+    assert snapshot.to_gedcom_string(True) == parser.to_gedcom_string(True)
+
+    individual = snapshot.get_element_dictionary()['@1@']
+    assert isinstance(individual, IndividualElement)
+    assert individual.is_frozen()
+    assert len(snapshot.get_families(individual)) == 1
+
+    with pytest.raises(FrozenElementError):
+        individual.new_child_element(tag="NOTE", value="Note")
+    with pytest.raises(FrozenElementError):
+        individual.get_child_elements()[0].set_value("Changed")
+    with pytest.raises(FrozenParserError):
+        snapshot.parse_file('tests/files/Musterstammbaum.ged')
+
+    # Links get resolved while freezing, even when the original parser never resolved them
+    assert not parser.has_resolved_links()
+    assert snapshot.has_resolved_links()
+    with pytest.raises(FrozenParserError):
+        snapshot.resolve_links()
+
+    # The original parser stays mutable and independent from the snapshot
+    parser.get_element_dictionary()['@1@'].new_child_element(tag="NOTE", value="Note")
+    assert len(snapshot.get_element_list()) == 396
+
+
+def test_instrumentation():
+    parser = Parser()
+    assert parser.get_statistics() is None
+
+    elements = []
+    cache_builds = []
+    statistics = parser.enable_instrumentation(
+        on_element=lambda line_number, element: elements.append((line_number, element.get_tag())),
+        on_cache_built=lambda name, seconds: cache_builds.append(name)
+    )
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    parser.get_element_list()
+    parser.get_element_dictionary()
+
+    assert parser.get_statistics() is statistics
+    assert statistics.get_lines() == len(elements) == 396
+    assert elements[0] == (1, 'HEAD')
+    assert statistics.get_tag_counts()['INDI'] == 20
+    assert statistics.get_max_depth() == 3
+    assert statistics.get_seconds() >= statistics.get_tokenize_seconds() + statistics.get_build_seconds()
+    assert statistics.get_lines_per_second() > 0
+    assert cache_builds == ['element_list', 'element_dictionary']
+    assert sorted(statistics.get_cache_build_seconds()) == ['element_dictionary', 'element_list']
+
+    parser.disable_instrumentation()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    assert statistics.get_lines() == 396
+
+
+class SubmitterElement(Element):
+    pass
+
+
+class SourceCitationElement(Element):
+    pass
+
+
+def test_element_classes():
+    register_element_class('SUBM', SubmitterElement)
+    try:
+        parser = Parser(element_classes={'SOUR': SourceCitationElement})
+        parser.parse_file('tests/files/Musterstammbaum.ged')
+        element_dictionary = parser.get_element_dictionary()
+
+        assert isinstance(element_dictionary['@SUBM@'], SubmitterElement)
+        assert isinstance(element_dictionary['@1@'], IndividualElement)
+        assert all(isinstance(element, SourceCitationElement)
+                   for element in parser.get_element_list() if element.get_tag() == 'SOUR')
+        assert isinstance(RootElement().new_child_element('SUBM'), SubmitterElement)
+        assert not isinstance(RootElement().new_child_element('SOUR'), SourceCitationElement)
+
+        with pytest.raises(TypeError):
+            register_element_class('SUBM', object)
+    finally:
+        unregister_element_class('SUBM')
+
+    assert type(RootElement().new_child_element('SUBM')) is Element
+
+
+def test_resolve_links():
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    individual = parser.get_element_dictionary()['@1@']
+    families = parser.get_families(individual)
+    parents = parser.get_parents(individual)
+
+    assert not parser.has_resolved_links()
+    family_link = parser.get_root_element().new_child_element('INDI', '@X1@').new_child_element('FAMS', value='@NONE@')
+    parser.invalidate_cache()
+
+    assert parser.resolve_links() == [family_link]
+    assert parser.has_resolved_links()
+    assert parser.get_unresolved_links() == [family_link]
+    assert parser.get_families(individual) == families
+    assert parser.get_parents(individual) == parents
+    for element in parser.get_element_list():
+        if element.get_tag() == 'FAMS' and element is not family_link:
+            assert element.get_linked_record() is parser.get_element_dictionary()[element.get_value()]
+
+    snapshot = parser.freeze()
+    assert snapshot.has_resolved_links()
+    assert len(snapshot.get_unresolved_links()) == 1
+
+    parser.invalidate_cache()
+    assert not parser.has_resolved_links()
+    assert parser.get_unresolved_links() == []
@@ -0,0 +1,42 @@
+import gedcom.phonetic
+
+
+def test_fold():
+    assert gedcom.phonetic.fold("  Schröder  MÜLLER ") == "schroder muller"
+    assert gedcom.phonetic.fold("Straße") == "strasse"
+
+
+def test_soundex():
+    assert gedcom.phonetic.soundex("Robert") == gedcom.phonetic.soundex("Rupert") == "R163"
+    assert gedcom.phonetic.soundex("Ashcraft") == "A261"
+    assert gedcom.phonetic.soundex("Tymczak") == "T522"
+    assert gedcom.phonetic.soundex("Pfister") == "P236"
+    assert gedcom.phonetic.soundex("Meyer") == gedcom.phonetic.soundex("Maier") == gedcom.phonetic.soundex("Mayer")
+    assert gedcom.phonetic.soundex("Lee") == "L000"
+    assert gedcom.phonetic.soundex("") == ""
+
+
+def test_daitch_mokotoff():
+    assert gedcom.phonetic.daitch_mokotoff("Moskowitz") == ["645740"]
+    assert gedcom.phonetic.daitch_mokotoff("Auerbach") == gedcom.phonetic.daitch_mokotoff("Ohrbach") == ["097400", "097500"]
+    assert gedcom.phonetic.daitch_mokotoff("Peters") == ["734000", "739400"]
+    assert gedcom.phonetic.daitch_mokotoff("Lewinsky") == gedcom.phonetic.daitch_mokotoff("Levinski") == ["876450"]
+    assert gedcom.phonetic.daitch_mokotoff("Szlamawicz") == gedcom.phonetic.daitch_mokotoff("Shlamovitz") == ["486740"]
+    assert gedcom.phonetic.daitch_mokotoff("") == []
+
+
+def test_metaphone():
+    assert gedcom.phonetic.metaphone("Catherine") == gedcom.phonetic.metaphone("Kathryn") == "K0RN"
+    assert gedcom.phonetic.metaphone("Knight") == "NT"
+    assert gedcom.phonetic.metaphone("Schmitt") == "SKMT"
+    assert gedcom.phonetic.metaphone("Dodge") == "TJ"
+    assert gedcom.phonetic.metaphone("Nation") == "NXN"
+    assert gedcom.phonetic.metaphone("Philips") == "FLPS"
+    assert gedcom.phonetic.metaphone("") == ""
+
+
+def test_levenshtein():
+    assert gedcom.phonetic.levenshtein("kitten", "sitting") == 3
+    assert gedcom.phonetic.levenshtein("schroder", "schroeder") == 1
+    assert gedcom.phonetic.levenshtein("", "abc") == 3
+    assert gedcom.phonetic.levenshtein("abc", "abcdef", maximum=1) == 2
@@ -0,0 +1,132 @@
+import io
+import pytest
+import gedcom.projection
+from gedcom.parser import GedcomFormatViolationError, Parser
+from tests import parse_lines
+
+GEDCOM_LINES = (
+    "0 HEAD",
+    "1 SOUR python-gedcom",
+    "0 @I1@ INDI",
+    "1 NAME John /Doe/",
+    "1 BIRT",
+    "2 DATE 1 JAN 1900",
+    "2 SOUR @S1@",
+    "3 PAGE p. 12",
+    "3 NOTE Seen",
+    "4 CONT in the register",
+    "1 NOTE @N1@",
+    "1 OCCU Farmer",
+    "2 SOUR @S1@",
+    "1 FAMS @F1@",
+    "0 @F1@ FAM",
+    "1 HUSB @I1@",
+    "1 MARR",
+    "2 SOUR @S1@",
+    "0 @S1@ SOUR",
+    "1 TITL Register",
+    "1 OBJE",
+    "2 FILE register.jpg",
+    "0 @N1@ NOTE A note",
+    "1 CONC  spanning lines",
+    "0 TRLR",
+)
+
+
+def get_lines(parser):
+    return parser.to_gedcom_string(True).splitlines()
+
+
+def test_tag_filter():
+    element_filter = gedcom.projection.make_tag_filter(
+        record_tags=gedcom.projection.FAMILY_RECORD_TAGS,
+        exclude_tags=gedcom.projection.SOURCE_TAGS,
+    )
+
+    assert get_lines(parse_lines(GEDCOM_LINES, element_filter=element_filter)) == [
+        "0 @I1@ INDI",
+        "1 NAME John /Doe/",
+        "1 BIRT",
+        "2 DATE 1 JAN 1900",
+        "1 OCCU Farmer",
+        "1 FAMS @F1@",
+        "0 @F1@ FAM",
+        "1 HUSB @I1@",
+        "1 MARR",
+    ]
+
+
+def test_include_tags():
+    element_filter = gedcom.projection.make_tag_filter(include_tags=("NAME", "HUSB"))
+
+    assert get_lines(parse_lines(GEDCOM_LINES, element_filter=element_filter)) == [
+        "0 HEAD",
+        "0 @I1@ INDI",
+        "1 NAME John /Doe/",
+        "0 @F1@ FAM",
+        "1 HUSB @I1@",
+        "0 @S1@ SOUR",
+        "0 @N1@ NOTE A note",
+        "1 CONC  spanning lines",
+        "0 TRLR",
+    ]
+
+
+def test_predicate():
+    def element_filter(record_tag, path):
+        return record_tag != "SOUR" and path[-2:] != ("OCCU", "SOUR")
+
+    lines = get_lines(parse_lines(GEDCOM_LINES, element_filter=element_filter))
+
+    assert "3 PAGE p. 12" in lines
+    assert "1 OCCU Farmer" in lines
+    assert lines.count("2 SOUR @S1@") == 2
+    assert "0 @S1@ SOUR" not in lines
+    assert get_lines(parse_lines(GEDCOM_LINES, element_filter=lambda record_tag, path: True)) == get_lines(parse_lines(GEDCOM_LINES))
+
+
+def test_filter_format_checks():
+    lines = ("0 HEAD", "0 @I1@ INDI", "1 BIRT", "3 DATE 1900", "0 TRLR")
+
+    with pytest.raises(GedcomFormatViolationError):
+        parse_lines(lines, element_filter=gedcom.projection.make_tag_filter(exclude_tags=("NOTE",)))
+    # Lines of dropped elements are not checked
+    parse_lines(lines, element_filter=gedcom.projection.make_tag_filter(exclude_tags=("BIRT",)))
+
+
+def get_projected_lines(data, record_tags, chunk_size):
+    return b"".join(gedcom.projection.iter_projected_lines(io.BytesIO(data), record_tags, chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_projected_lines(chunk_size):
+    data = "".join(line + "\n" for line in GEDCOM_LINES).encode('utf-8')
+
+    assert get_projected_lines(data, ("INDI", "FAM"), chunk_size).decode('utf-8').splitlines() == list(GEDCOM_LINES[2:18])
+    assert get_projected_lines(data, ("HEAD", "NOTE", "TRLR"), chunk_size).decode('utf-8').splitlines() == [
+        "0 HEAD", "1 SOUR python-gedcom", "0 @N1@ NOTE A note", "1 CONC  spanning lines", "0 TRLR",
+    ]
+    assert get_projected_lines(data, (), chunk_size) == b""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_projected_lines_quirks(chunk_size):
+    data = "\ufeff0 HEAD\r\n0 @S1@ SOUR\r\n1 TITL 0 @I2@ INDI\r\n0 @I1@ INDI\r\n1 NAME Jane /Doe/".encode('utf-8')
+
+    assert get_projected_lines(data, ("INDI",), chunk_size) == b"0 @I1@ INDI\r\n1 NAME Jane /Doe/"
+    assert get_projected_lines(data, ("HEAD",), chunk_size) == "\ufeff0 HEAD\r\n".encode('utf-8')
+
+
+def test_parse_record_tags():
+    lines = [(line + "\n").encode('utf-8') for line in GEDCOM_LINES]
+    parser = Parser()
+    parser.parse(lines, record_tags=gedcom.projection.FAMILY_RECORD_TAGS)
+
+    assert get_lines(parser) == list(GEDCOM_LINES[2:18])
+
+    element_filter = gedcom.projection.make_tag_filter(exclude_tags=gedcom.projection.SOURCE_TAGS)
+    parser.parse(lines, element_filter=element_filter, record_tags=gedcom.projection.FAMILY_RECORD_TAGS)
+
+    assert get_lines(parser) == get_lines(parse_lines(GEDCOM_LINES, element_filter=gedcom.projection.make_tag_filter(
+        record_tags=gedcom.projection.FAMILY_RECORD_TAGS, exclude_tags=gedcom.projection.SOURCE_TAGS
+    )))
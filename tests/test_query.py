@@ -0,0 +1,92 @@
+import pytest
+import gedcom.query
+from tests import parse_lines
+
+GEDCOM_LINES = (
+    "0 HEAD",
+    "0 @I1@ INDI",
+    "1 NAME Anna /Schmidt/",
+    "1 SEX F",
+    "1 BIRT",
+    "2 DATE 1850",
+    "2 PLAC Berlin",
+    "1 FAMS @F1@",
+    "0 @I2@ INDI",
+    "1 NAME Karl /Meyer/",
+    "1 SEX M",
+    "1 BIRT",
+    "2 DATE 1848",
+    "2 PLAC Hamburg",
+    "1 DEAT",
+    "2 DATE 1900",
+    "2 PLAC Bremen",
+    "1 FAMS @F1@",
+    "0 @F1@ FAM",
+    "1 HUSB @I2@",
+    "1 WIFE @I1@",
+    "1 MARR",
+    "2 DATE 1870",
+    "2 PLAC Berlin",
+    "1 NOTE Married in [St.] Marien",
+    "0 TRLR",
+)
+
+
+def get_values(elements):
+    return [element.get_value() for element in elements]
+
+
+def test_steps_and_wildcards():
+    parser = parse_lines(GEDCOM_LINES)
+
+    assert get_values(gedcom.query.select(parser, "INDI/BIRT/PLAC")) == ["Berlin", "Hamburg"]
+    assert get_values(gedcom.query.select(parser, "/indi/birt/date")) == ["1850", "1848"]
+    assert get_values(gedcom.query.select(parser, "FAM/*/DATE")) == ["1870"]
+    assert get_values(gedcom.query.select(parser, "*/*/PLAC")) == ["Berlin", "Hamburg", "Bremen", "Berlin"]
+    assert get_values(gedcom.query.select(parser, "INDI//DATE")) == ["1850", "1848", "1900"]
+    assert get_values(gedcom.query.select(parser, "//PLAC")) == ["Berlin", "Hamburg", "Bremen", "Berlin"]
+    assert len(list(gedcom.query.select(parser, "//*"))) == len(parser.get_element_list())
+    assert list(gedcom.query.select(parser, "SOUR/TITL")) == []
+
+
+def test_predicates():
+    parser = parse_lines(GEDCOM_LINES)
+
+    assert get_values(gedcom.query.select(parser, "INDI[SEX=F]/NAME")) == ["Anna /Schmidt/"]
+    assert get_values(gedcom.query.select(parser, "INDI[SEX!=F]/NAME")) == ["Karl /Meyer/"]
+    assert get_values(gedcom.query.select(parser, "INDI[DEAT]/NAME")) == ["Karl /Meyer/"]
+    assert get_values(gedcom.query.select(parser, "INDI[BIRT/PLAC=Berlin]/NAME")) == ["Anna /Schmidt/"]
+    assert get_values(gedcom.query.select(parser, "INDI[NAME~^Karl ]/BIRT/DATE")) == ["1848"]
+    assert get_values(gedcom.query.select(parser, "//PLAC[=Berlin]")) == ["Berlin", "Berlin"]
+    assert len(list(gedcom.query.select(parser, 'FAM[NOTE="Married in [St.\\] Marien"]'))) == 1
+    assert get_values(gedcom.query.select(parser, "INDI[SEX=F][DEAT]/NAME")) == []
+
+
+def test_dereference():
+    parser = parse_lines(GEDCOM_LINES)
+
+    assert get_values(gedcom.query.select(parser, "FAM/HUSB@/NAME")) == ["Karl /Meyer/"]
+    assert get_values(gedcom.query.select(parser, "INDI[SEX=F]/FAMS@/HUSB@/BIRT/PLAC")) == ["Hamburg"]
+
+    query = gedcom.query.compile_query("FAMS@/MARR/DATE")
+    individual = parser.get_element_dictionary()["@I1@"]
+    assert get_values(query.evaluate_element(individual)) == []
+    assert get_values(query.evaluate_element(individual, parser)) == ["1870"]
+    parser.resolve_links()
+    assert get_values(query.evaluate_element(individual)) == ["1870"]
+
+
+def test_frozen_parser():
+    parser = parse_lines(GEDCOM_LINES)
+    assert not parser.get_tag_index().is_built()
+
+    snapshot = parser.freeze()
+
+    assert snapshot.get_tag_index().is_built()
+    assert get_values(gedcom.query.select(snapshot, "//PLAC")) == ["Berlin", "Hamburg", "Bremen", "Berlin"]
+
+
+def test_syntax_errors():
+    for path in ("", "INDI/", "INDI[", "INDI[]", "INDI BIRT", "INDI[NAME~(]"):
+        with pytest.raises(gedcom.query.QuerySyntaxError):
+            gedcom.query.compile_query(path)
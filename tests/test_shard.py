@@ -0,0 +1,99 @@
+import os
+import pytest
+import gedcom.generator
+import gedcom.shard
+from gedcom.parser import Parser
+from tests import parse_lines
+
+GEDCOM_LINES = (
+    "0 HEAD",
+    "1 SUBM @U1@",
+    "0 @U1@ SUBM",
+    "1 NAME Submitter",
+    "0 @I1@ INDI",
+    "1 FAMS @F1@",
+    "1 SOUR @S1@",
+    "0 @I2@ INDI",
+    "1 FAMS @F1@",
+    "0 @I3@ INDI",
+    "1 FAMC @F1@",
+    "1 NOTE @N1@",
+    "0 @F1@ FAM",
+    "1 HUSB @I1@",
+    "1 WIFE @I2@",
+    "1 CHIL @I3@",
+    "0 @I4@ INDI",
+    "1 SOUR @S1@",
+    "0 @I5@ INDI",
+    "1 FAMC @F2@",
+    "0 @F2@ FAM",
+    "1 CHIL @I5@",
+    "0 @S1@ SOUR",
+    "1 REPO @R1@",
+    "0 @R1@ REPO",
+    "0 @N1@ NOTE Shared note",
+    "0 @S2@ SOUR",
+    "1 TITL Unreferenced",
+    "0 TRLR",
+)
+
+
+def get_pointers(records):
+    return [record.get_pointer() for record in records]
+
+
+def test_find_components():
+    components = gedcom.shard.find_components(parse_lines(GEDCOM_LINES))
+    assert [get_pointers(component) for component in components] == [
+        ["@I1@", "@I2@", "@I3@", "@F1@"], ["@I5@", "@F2@"], ["@I4@"]
+    ]
+
+
+def test_pack_components():
+    components = gedcom.shard.find_components(parse_lines(GEDCOM_LINES))
+    shards = gedcom.shard.pack_components(components, 2)
+    assert [[get_pointers(component) for component in shard] for shard in shards] == [
+        [["@I1@", "@I2@", "@I3@", "@F1@"]], [["@I5@", "@F2@"], ["@I4@"]]
+    ]
+    assert len(gedcom.shard.pack_components(components, 10)) == 3
+    with pytest.raises(ValueError):
+        gedcom.shard.pack_components(components, 0)
+
+
+def test_write_and_combine_shards(tmp_path):
+    parser = parse_lines(GEDCOM_LINES)
+    directory = str(tmp_path / "shards")
+    manifest = gedcom.shard.write_shards(parser, directory, 2)
+
+    assert [shard["file"] for shard in manifest["shards"]] == ["shard-000.ged", "shard-001.ged"]
+    assert manifest["records"]["@I3@"] == 0
+    assert manifest["records"]["@I4@"] == 1
+    assert manifest["records"]["@S2@"] == 0
+    assert manifest["shared_records"]["@S1@"] == [0, 1]
+    assert manifest["shared_records"]["@R1@"] == [0, 1]
+    assert manifest["shared_records"]["@U1@"] == [0, 1]
+    assert manifest["shared_records"]["@N1@"] == [0]
+
+    for shard in manifest["shards"]:
+        shard_parser = Parser()
+        shard_parser.parse_file(os.path.join(directory, shard["file"]))
+        element_dictionary = shard_parser.get_element_dictionary()
+        for element in shard_parser.get_element_list():
+            if element.get_value().startswith('@'):
+                assert element.get_value() in element_dictionary
+
+    combined_path = str(tmp_path / "combined.ged")
+    gedcom.shard.combine_shards(os.path.join(directory, gedcom.shard.MANIFEST_FILE_NAME), combined_path)
+    combined_parser = Parser()
+    combined_parser.parse_file(combined_path)
+    assert sorted(get_pointers(combined_parser.get_root_child_elements())) == \
+        sorted(get_pointers(parser.get_root_child_elements()))
+
+
+def test_shards_of_generated_tree(tmp_path):
+    parser = Parser()
+    parser.parse(line.encode('utf-8') for line in gedcom.generator.iter_gedcom_lines(500, seed=4))
+    manifest = gedcom.shard.write_shards(parser, str(tmp_path), 4)
+
+    individuals = sum(shard["individuals"] for shard in manifest["shards"])
+    assert individuals == len([record for record in parser.get_root_child_elements() if record.get_tag() == 'INDI'])
@@ -0,0 +1,64 @@
+import sqlite3
+import pytest
+import gedcom.sqlite
+from gedcom.element.individual import IndividualElement
+from gedcom.parser import Parser
+
+
+def test_to_sqlite(tmp_path):
+    database_path = str(tmp_path / 'gedcom.sqlite')
+
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    parser.to_sqlite(database_path, batch_size=50)
+
+    connection = sqlite3.connect(database_path)
+    assert connection.execute("SELECT COUNT(*) FROM elements").fetchone()[0] == 396
+    assert connection.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 34
+    assert connection.execute("SELECT COUNT(*) FROM individuals").fetchone()[0] == 20
+    assert connection.execute(
+        "SELECT given_name, surname, birth_year FROM individuals WHERE pointer = '@1@'"
+    ).fetchone() == ("Max", "Mustermann", 1980)
+    assert connection.execute(
+        "SELECT COUNT(*) FROM family_links WHERE individual = '@1@'"
+    ).fetchone()[0] > 0
+    connection.close()
+
+    # Exporting twice replaces the previous tables
+    parser.to_sqlite(database_path)
+
+
+def test_failed_export_keeps_database(tmp_path):
+    database_path = str(tmp_path / 'gedcom.sqlite')
+
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    parser.to_sqlite(database_path)
+
+    def failing_records():
+        for record in parser.get_root_child_elements()[:10]:
+            yield record
+        raise RuntimeError("export aborted")
+
+    with pytest.raises(RuntimeError):
+        gedcom.sqlite.export_sqlite(failing_records(), database_path, batch_size=5)
+
+    connection = sqlite3.connect(database_path)
+    assert connection.execute("SELECT COUNT(*) FROM elements").fetchone()[0] == 396
+    assert connection.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 34
+    connection.close()
+
+
+def test_load_sqlite(tmp_path):
+    database_path = str(tmp_path / 'gedcom.sqlite')
+
+    parser = Parser()
+    parser.parse_file('tests/files/Musterstammbaum.ged')
+    parser.to_sqlite(database_path)
+
+    loaded_parser = Parser()
+    loaded_parser.load_sqlite(database_path)
+
+    assert loaded_parser.to_gedcom_string(True) == parser.to_gedcom_string(True)
+    assert len(loaded_parser.get_element_dictionary()) == 32
+    assert isinstance(loaded_parser.get_element_dictionary()['@1@'], IndividualElement)
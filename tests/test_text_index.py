@@ -0,0 +1,114 @@
+import pytest
+import gedcom.text_index
+from tests import parse_lines
+
+GEDCOM_LINES = (
+    "0 HEAD",
+    "1 NOTE Exported for the family reunion",
+    "0 @I1@ INDI",
+    "1 NAME Anna /Schröder/",
+    "1 NOTE She emigrated to America",
+    "2 CONC  in 1852 with her brother.",
+    "1 BIRT",
+    "2 SOUR @S1@",
+    "3 PAGE Taufbuch 1830, S. 12",
+    "0 @I2@ INDI",
+    "1 NAME Hans /Schröder/",
+    "1 NOTE @N1@",
+    "0 @N1@ NOTE Emigrated to Hamburg,",
+    "1 CONT then America",
+    "0 @S1@ SOUR",
+    "1 TITL Kirchenbuch Sankt Marien",
+    "1 DATA",
+    "2 TEXT Getauft wurde Anna Schröder",
+    "0 TRLR",
+)
+
+
+def get_keys(records):
+    return [record.get_pointer() or record.get_tag() for record in records]
+
+
+def test_queries():
+    parser = parse_lines(GEDCOM_LINES)
+    text_index = gedcom.text_index.build_text_index(parser.get_root_child_elements())
+
+    assert get_keys(text_index.find("emigrated")) == ["@I1@", "@N1@"]
+    assert get_keys(text_index.find("EMIGRATED america 1852")) == ["@I1@"]
+    assert get_keys(text_index.find("schroder")) == ["@S1@"]
+    assert get_keys(text_index.find("reunion")) == ["HEAD"]
+    assert get_keys(text_index.find("taufbuch")) == ["@I1@"]
+    assert text_index.find("unknown") == []
+
+    assert get_keys(text_index.find_phrase("emigrated to america")) == ["@I1@"]
+    assert get_keys(text_index.find_phrase("to Hamburg, then America")) == ["@N1@"]
+    assert get_keys(text_index.find_phrase("sankt marien getauft")) == []
+
+    assert get_keys(text_index.find_prefix("Emig")) == ["@I1@", "@N1@"]
+    assert get_keys(text_index.find_prefix("kirchen")) == ["@S1@"]
+    assert text_index.find_prefix("xyz") == []
+
+
+def test_update_record():
+    parser = parse_lines(GEDCOM_LINES)
+    text_index = gedcom.text_index.build_text_index(parser.get_root_child_elements())
+
+    note = parser.get_element_dictionary()["@N1@"]
+    note.set_value("Moved to Bremen")
+    note.get_child_elements()[0].set_value("and stayed")
+    text_index.update_record(note)
+
+    assert get_keys(text_index.find("emigrated")) == ["@I1@"]
+    assert get_keys(text_index.find_phrase("moved to bremen")) == ["@N1@"]
+    assert "hamburg" not in text_index.get_terms()
+
+    text_index.remove_record(note)
+    assert text_index.find("bremen") == []
+
+
+def test_records_without_pointer(tmp_path):
+    lines = ("0 HEAD", "0 NOTE First note about Anna", "0 NOTE Second note about Hans", "0 TRLR")
+    parser = parse_lines(lines)
+    records = parser.get_root_child_elements()
+    text_index = gedcom.text_index.build_text_index(records)
+
+    assert text_index.find("note") == [records[1], records[2]]
+    assert text_index.find("anna") == [records[1]]
+    assert text_index.find("hans") == [records[2]]
+
+    records[2].set_value("Second note about Karl")
+    text_index.update_record(records[2])
+    assert text_index.find("note") == [records[1], records[2]]
+    assert text_index.find("karl") == [records[2]]
+    assert text_index.find("hans") == []
+
+    file_path = str(tmp_path / "index.json")
+    text_index.save(file_path)
+    loaded_text_index = gedcom.text_index.load_text_index(file_path, records)
+    assert loaded_text_index.find("anna") == [records[1]]
+    assert loaded_text_index.find("karl") == [records[2]]
+
+    text_index.remove_record(records[1])
+    assert text_index.find("note") == [records[2]]
+    text_index.add_record(records[1])
+    assert text_index.find("anna") == [records[1]]
+    assert len(text_index.get_records()) == len(records)
+
+
+def test_save_and_load(tmp_path):
+    parser = parse_lines(GEDCOM_LINES)
+    records = parser.get_root_child_elements()
+    text_index = gedcom.text_index.build_text_index(records)
+
+    file_path = str(tmp_path / "index.json")
+    text_index.save(file_path)
+    loaded_text_index = gedcom.text_index.load_text_index(file_path, records)
+
+    assert loaded_text_index.get_terms() == text_index.get_terms()
+    assert loaded_text_index.find_phrase("emigrated to america") == text_index.find_phrase("emigrated to america")
+    assert loaded_text_index.find("schroder")[0] is records[4]
+
+    with open(file_path, "w") as index_file:
+        index_file.write("[]")
+    with pytest.raises(gedcom.text_index.TextIndexFormatError):
+        gedcom.text_index.load_text_index(file_path, records)
@@ -0,0 +1,60 @@
+import gedcom.validator
+
+
+def problem_tuples(lines, strict=True):
+    return [(problem.get_line_number(), problem.get_code())
+            for problem in gedcom.validator.validate(lines, strict)]
+
+
+def test_validate_file():
+    assert gedcom.validator.validate_file('tests/files/Musterstammbaum.ged') == []
+
+
+def test_validate():
+    lines = [
+        b"0 @I1@ INDI\n",
+        b"2 DATE 1 JAN 1900\n",
+        b"1 FAMS @F1@\n",
+        b"1 NOTE " + b"x" * 260 + b"\n",
+        b"broken line\n",
+        b"0 @I1@ INDI\n",
+        b"1 NAME \xff\n",
+        b"1 DATE @#DJULIAN@ 1700\n",
+        b"0 TRLR\n",
+        b"0 @I2@ INDI",
+    ]
+    assert problem_tuples(lines) == [
+        (1, gedcom.validator.PROBLEM_MISSING_HEADER),
+        (2, gedcom.validator.PROBLEM_LEVEL_JUMP),
+        (4, gedcom.validator.PROBLEM_LINE_TOO_LONG),
+        (5, gedcom.validator.PROBLEM_MALFORMED_LINE),
+        (6, gedcom.validator.PROBLEM_DUPLICATE_POINTER),
+        (7, gedcom.validator.PROBLEM_MALFORMED_LINE),
+        (10, gedcom.validator.PROBLEM_MALFORMED_LINE),
+        (3, gedcom.validator.PROBLEM_DANGLING_POINTER),
+    ]
+    assert problem_tuples(lines, strict=False)[-3:] == [
+        (10, gedcom.validator.PROBLEM_RECORD_AFTER_TRAILER),
+        (3, gedcom.validator.PROBLEM_DANGLING_POINTER),
+        (10, gedcom.validator.PROBLEM_MISSING_TRAILER),
+    ]
+    assert problem_tuples([]) == [(1, gedcom.validator.PROBLEM_MISSING_HEADER)]
+
+
+def test_missing_header():
+    assert problem_tuples([b"\n", b"0 @I1@ INDI\n", b"0 TRLR\n"]) == [
+        (1, gedcom.validator.PROBLEM_MALFORMED_LINE),
+        (2, gedcom.validator.PROBLEM_MISSING_HEADER),
+    ]
+    assert problem_tuples([b"1 NAME John /Doe/\n", b"0 @I1@ INDI\n", b"0 TRLR\n"]) == [
+        (1, gedcom.validator.PROBLEM_LEVEL_JUMP),
+        (2, gedcom.validator.PROBLEM_MISSING_HEADER),
+    ]
+    assert problem_tuples([b"\n", b"0 HEAD\n", b"0 TRLR\n"]) == [
+        (1, gedcom.validator.PROBLEM_MALFORMED_LINE),
+    ]
+    assert problem_tuples([b"1 NAME John /Doe/\n"]) == [
+        (1, gedcom.validator.PROBLEM_LEVEL_JUMP),
+        (1, gedcom.validator.PROBLEM_MISSING_HEADER),
+        (1, gedcom.validator.PROBLEM_MISSING_TRAILER),
+    ]